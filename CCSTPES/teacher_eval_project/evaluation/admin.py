@@ -1,7 +1,7 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
-from .models import User, StudentProfile, TeacherProfile, Subject, Evaluation, Department, StudentSubject, Semester, AcademicYear, EvaluationSettings
+from .models import User, StudentProfile, TeacherProfile, Subject, Evaluation, Department, StudentSubject, Semester, AcademicYear, EvaluationSettings, ReportJob
 
 
 class CustomUserAdmin(UserAdmin):
@@ -23,7 +23,7 @@ class DepartmentAdmin(admin.ModelAdmin):
 
 
 class TeacherProfileAdmin(admin.ModelAdmin):
-    list_display = ['get_full_name', 'employee_id', 'department', 'get_subjects_count', 'experience_years', 'get_average_rating']
+    list_display = ['get_full_name', 'employee_id', 'department', 'get_subjects_count', 'experience_years', 'get_average_rating', 'get_evaluation_progress_display']
     search_fields = ['user__username', 'user__first_name', 'user__last_name', 'employee_id']
     list_filter = ['department', 'experience_years']
     filter_horizontal = ['subjects']
@@ -64,6 +64,12 @@ class TeacherProfileAdmin(admin.ModelAdmin):
         """Optimize queryset"""
         qs = super().get_queryset(request)
         return qs.select_related('user', 'department').prefetch_related('subjects')
+    
+    def get_changelist_instance(self, request):
+        """Compute the progress column for the whole page at once"""
+        changelist = super().get_changelist_instance(request)
+        TeacherProfile.attach_evaluation_progress(changelist.result_list)
+        return changelist
 
 
 class SubjectAdmin(admin.ModelAdmin):
@@ -270,6 +276,7 @@ class EvaluationAdmin(admin.ModelAdmin):
         return f"{obj.get_average_rating()} / 5"
 
     get_average_rating_display.short_description = 'Average Rating'
+    get_average_rating_display.admin_order_field = 'overall_avg'
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
@@ -292,4 +299,5 @@ admin.site.register(Evaluation, EvaluationAdmin)
 admin.site.register(StudentSubject, StudentSubjectAdmin)
 admin.site.register(Semester)
 admin.site.register(AcademicYear)
-admin.site.register(EvaluationSettings)
\ No newline at end of file
+admin.site.register(EvaluationSettings)
+admin.site.register(ReportJob)
@@ -0,0 +1,224 @@
+"""
+Teacher standings
+=================
+
+Ranks teachers by their average rating within their department and across
+the institution. The ratings come from TeacherRatingRollup and the ranks are
+computed by the database with RANK() / PERCENT_RANK() window functions, so a
+full ranking for any academic year / semester is a single query. Databases
+without window function support get the same result computed in Python.
+
+cohort_comparison() puts a teacher's averages next to their department's and
+the whole institution's, again in a single query (GROUPING SETS on
+PostgreSQL, a UNION of the three aggregates elsewhere).
+
+Usage:
+    rankings = teacher_rankings(academic_year=ay, semester=sem)
+    standing = teacher_standing(teacher, academic_year=ay, semester=sem)
+    comparison = cohort_comparison(teacher, academic_year=ay, semester=sem)
+"""
+
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import CharField, Count, F, Sum, Value, Window
+from django.db.models.functions import PercentRank, Rank
+
+from .models import RATING_FIELDS, SCORE_PARTS, TeacherProfile, TeacherRatingRollup, rollup_aggregates
+
+COHORTS = ('teacher', 'department', 'institution')
+
+
+def teacher_rankings(academic_year=None, semester=None, department=None):
+    """
+    Rank every evaluated teacher for the given period.
+
+    Returns a list of dicts ordered by overall rank with teacher (id),
+    department (id), evaluation_count, average_rating and, for both the
+    department and the whole institution, the rank (1 = highest rated,
+    ties share a rank), the percentile (100 = top, 0 = bottom) and the
+    number of ranked teachers. When department is given the query reads
+    only its teachers, so the overall columns rank within the department
+    too; teacher_standing() places a teacher across the institution.
+    """
+    rollups = TeacherRatingRollup.objects.all()
+    if department:
+        rollups = rollups.filter(teacher__department=department)
+    if academic_year:
+        rollups = rollups.filter(academic_year=academic_year)
+    if semester:
+        rollups = rollups.filter(semester=semester)
+
+    aggregates = rollup_aggregates()
+    rows = (
+        rollups.order_by()
+        .values('teacher', department=F('teacher__department'))
+        .annotate(total_evaluations=aggregates['total_evaluations'], average_rating=aggregates['average_rating'])
+        .filter(total_evaluations__gt=0)
+    )
+
+    if connection.features.supports_over_clause:
+        rows = list(_with_window_ranks(rows))
+    else:
+        rows = _with_python_ranks(list(rows))
+
+    rankings = []
+    for row in sorted(rows, key=lambda row: (row['overall_rank'], row['teacher'])):
+        rankings.append({
+            'teacher': row['teacher'],
+            'department': row['department'],
+            'evaluation_count': row['total_evaluations'],
+            'average_rating': round(row['average_rating'], 2),
+            'department_rank': row['department_rank'],
+            'department_percentile': _percentile(row['department_percent_rank']),
+            'department_size': row['department_size'],
+            'overall_rank': row['overall_rank'],
+            'overall_percentile': _percentile(row['overall_percent_rank']),
+            'overall_size': row['overall_size'],
+        })
+    return rankings
+
+
+def teacher_standing(teacher, academic_year=None, semester=None):
+    """Ranking entry of one teacher (see teacher_rankings()), or None if they have no evaluations"""
+    for row in teacher_rankings(academic_year, semester):
+        if row['teacher'] == teacher.pk:
+            return row
+    return None
+
+
+def _with_window_ranks(rows):
+    by_rating = F('average_rating').desc()
+    by_department = [F('teacher__department')]
+    return rows.annotate(
+        department_rank=Window(Rank(), partition_by=by_department, order_by=by_rating),
+        department_percent_rank=Window(PercentRank(), partition_by=by_department, order_by=by_rating),
+        department_size=Window(Count('teacher'), partition_by=by_department),
+        overall_rank=Window(Rank(), order_by=by_rating),
+        overall_percent_rank=Window(PercentRank(), order_by=by_rating),
+        overall_size=Window(Count('teacher')),
+    )
+
+
+def _with_python_ranks(rows):
+    """Same columns as _with_window_ranks(), for databases without OVER support"""
+    partitions = defaultdict(list)
+    for row in rows:
+        partitions[row['department']].append(row)
+
+    _rank(rows, 'overall')
+    for members in partitions.values():
+        _rank(members, 'department')
+    return rows
+
+
+def _rank(rows, prefix):
+    # RANK(): position of the first row with the same rating; PERCENT_RANK(): (rank - 1) / (size - 1)
+    first_position = {}
+    for position, rating in enumerate(sorted((row['average_rating'] for row in rows), reverse=True), 1):
+        first_position.setdefault(rating, position)
+
+    size = len(rows)
+    for row in rows:
+        rank = first_position[row['average_rating']]
+        row[f'{prefix}_rank'] = rank
+        row[f'{prefix}_percent_rank'] = (rank - 1) / (size - 1) if size > 1 else 0
+        row[f'{prefix}_size'] = size
+
+
+def _percentile(percent_rank):
+    return round((1 - percent_rank) * 100, 1)
+
+
+def cohort_comparison(teacher, academic_year=None, semester=None):
+    """
+    Averages of a teacher, their department and the institution for a period.
+
+    Returns {'teacher': {...}, 'department': {...}, 'institution': {...}},
+    each with the same keys as EvaluationQuerySet.score_summary(). Cohorts
+    without evaluations have a count and averages of 0.
+    """
+    if connection.vendor == 'postgresql':
+        totals = _cohort_totals_grouping_sets(teacher, academic_year, semester)
+    else:
+        totals = _cohort_totals_union(teacher, academic_year, semester)
+    return {cohort: _cohort_summary(totals.get(cohort)) for cohort in COHORTS}
+
+
+def _cohort_sum_columns():
+    return ['evaluation_count'] + [f'{part}_sum' for part in SCORE_PARTS]
+
+
+def _cohort_totals_grouping_sets(teacher, academic_year, semester):
+    rollup_table = TeacherRatingRollup._meta.db_table
+    teacher_table = TeacherProfile._meta.db_table
+    sums = ', '.join(f'SUM(r.{column})' for column in _cohort_sum_columns())
+
+    where, params = [], []
+    if academic_year:
+        where.append('r.academic_year_id = %s')
+        params.append(getattr(academic_year, 'pk', academic_year))
+    if semester:
+        where.append('r.semester_id = %s')
+        params.append(getattr(semester, 'pk', semester))
+
+    # (department, teacher) -> one teacher, (department) -> department, () -> institution;
+    # HAVING keeps only the requested teacher's and department's rows plus the grand total
+    sql = f"""
+        SELECT GROUPING(t.department_id), GROUPING(r.teacher_id), {sums}
+        FROM {rollup_table} r
+        INNER JOIN {teacher_table} t ON t.id = r.teacher_id
+        {'WHERE ' + ' AND '.join(where) if where else ''}
+        GROUP BY GROUPING SETS ((t.department_id, r.teacher_id), (t.department_id), ())
+        HAVING GROUPING(t.department_id) = 1
+            OR (t.department_id = %s AND (GROUPING(r.teacher_id) = 1 OR r.teacher_id = %s))
+    """
+    params += [teacher.department_id, teacher.pk]
+
+    cohort_by_grouping = {(0, 0): 'teacher', (0, 1): 'department', (1, 1): 'institution'}
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        # the grand total has a row of NULL sums when nothing matches
+        return {
+            cohort_by_grouping[(row[0], row[1])]: dict(zip(_cohort_sum_columns(), row[2:]))
+            for row in cursor.fetchall()
+            if row[2]
+        }
+
+
+def _cohort_totals_union(teacher, academic_year, semester):
+    rollups = TeacherRatingRollup.objects.all()
+    if academic_year:
+        rollups = rollups.filter(academic_year=academic_year)
+    if semester:
+        rollups = rollups.filter(semester=semester)
+
+    sums = {column: Sum(column) for column in _cohort_sum_columns()}
+    cohorts = {
+        'teacher': rollups.filter(teacher=teacher),
+        'department': rollups.filter(teacher__department_id=teacher.department_id),
+        'institution': rollups,
+    }
+    queries = [
+        queryset.order_by()
+        .annotate(cohort=Value(cohort, output_field=CharField()))
+        .values('cohort')
+        .annotate(**sums)
+        .values('cohort', *sums)
+        for cohort, queryset in cohorts.items()
+    ]
+    rows = queries[0].union(*queries[1:], all=True)
+    # like the GROUPING SETS query, cohorts without evaluations are left out
+    return {row.pop('cohort'): row for row in rows if row['evaluation_count']}
+
+
+def _cohort_summary(totals):
+    count = (totals or {}).get('evaluation_count') or 0
+    summary = {'evaluation_count': count}
+    overall = 0
+    for part, fields in SCORE_PARTS.items():
+        part_sum = totals[f'{part}_sum'] if count else 0
+        overall += part_sum
+        summary[f'{part}_average'] = round(part_sum / (count * len(fields)), 2) if count else 0
+    summary['average_rating'] = round(overall / (count * len(RATING_FIELDS)), 2) if count else 0
+    return summary
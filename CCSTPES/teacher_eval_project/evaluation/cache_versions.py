@@ -0,0 +1,25 @@
+"""
+Version counters of the cached worklists, fragments, periods, live stats
+and directories.
+
+Cached entries are never deleted. Their keys embed one or more version
+counters, and bumping a counter (see signals.py) orphans every entry built
+under it until it expires.
+"""
+
+from django.core.cache import cache
+
+
+def bump_version(version_key):
+    """Orphan every entry whose key was built with version_key"""
+    try:
+        cache.incr(version_key)
+    except ValueError:
+        # counters never expire, a missing one just was never bumped
+        cache.set(version_key, 1, None)
+
+
+def versioned_key(prefix, version_keys, *parts):
+    """Cache key of prefix and parts under the current value of each counter"""
+    versions = cache.get_many(version_keys)
+    return ':'.join([prefix, *(str(versions.get(key, 0)) for key in version_keys), *map(str, parts)])
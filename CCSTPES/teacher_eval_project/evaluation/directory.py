@@ -0,0 +1,90 @@
+"""
+The teachers of a department with their subjects in that department and
+their average rating, as listed to the department's students on the
+teacher directory page. Built once per department and served from the
+cache as plain dicts, so rendering the page needs no queries.
+
+The directories are keyed on two version counters (see cache_versions.py
+and signals.py):
+- the shared counter, on saves / deletes of TeacherProfile, Subject,
+  Department and teacher users, and on teacher / subject assignments
+- the department's counter, on Evaluation saves / deletes of its teachers
+  (the average ratings)
+"""
+
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from .cache_versions import bump_version, versioned_key
+from .models import Department, Subject, TeacherProfile
+
+DIRECTORY_TIMEOUT = 60 * 60
+DIRECTORY_VERSION_KEY = 'teacher_directory_version'
+
+
+def _department_version_key(department_id):
+    return f'teacher_directory_version:department:{department_id}'
+
+
+def invalidate_directories():
+    bump_version(DIRECTORY_VERSION_KEY)
+
+
+def invalidate_department_directory(department_id):
+    bump_version(_department_version_key(department_id))
+
+
+def department_directory(department_id):
+    """
+    Cached directory of a department.
+
+    Returns {'department': {'name', 'code'}, 'teachers': [...]} where each
+    teacher is a dict of id, full_name, employee_id, department_name,
+    qualification, experience_years, average_rating and subjects, the
+    teacher's subjects of the department as dicts of name, code,
+    time_range, days and duration.
+    """
+    key = versioned_key(
+        'teacher_directory', [DIRECTORY_VERSION_KEY, _department_version_key(department_id)], department_id
+    )
+
+    directory = cache.get(key)
+    if directory is None:
+        directory = _build_directory(department_id)
+        cache.set(key, directory, DIRECTORY_TIMEOUT)
+    return directory
+
+
+def _build_directory(department_id):
+    department = Department.objects.filter(pk=department_id).values('name', 'code').first()
+    teachers = TeacherProfile.objects.filter(department_id=department_id).with_ratings().select_related(
+        'user', 'department'
+    ).prefetch_related(
+        Prefetch('subjects', queryset=Subject.objects.filter(department_id=department_id), to_attr='dept_subjects')
+    )
+
+    return {
+        'department': department,
+        'teachers': [
+            {
+                'id': teacher.pk,
+                'full_name': teacher.user.get_full_name(),
+                'employee_id': teacher.employee_id,
+                'department_name': teacher.department.name,
+                'qualification': teacher.qualification,
+                'experience_years': teacher.experience_years,
+                'average_rating': teacher.get_average_rating(),
+                'subjects': [
+                    {
+                        'name': subject.name,
+                        'code': subject.code,
+                        'time_range': subject.get_time_range(),
+                        'days': subject.days,
+                        'duration': subject.get_duration(),
+                    }
+                    for subject in teacher.dept_subjects
+                ],
+            }
+            for teacher in teachers
+        ],
+    }
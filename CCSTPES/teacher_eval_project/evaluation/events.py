@@ -0,0 +1,90 @@
+"""
+Live dashboard events
+=====================
+
+In-process publish / subscribe feeding the Server-Sent Events stream of
+views_events.live_events. Views publish after their transaction commits:
+- 'evaluation' when a student submits an evaluation
+- 'student_approved' when an admin approves a registration
+
+Subscribers are asyncio queues of the SSE responses; publishing is thread
+safe, so the sync views running in the ASGI thread pool can publish to
+them. Events only reach subscribers of the same process, which is the
+deployment this is made for: a single uvicorn worker (see Procfile). With
+several processes a dashboard misses the events published elsewhere and
+catches up through its regular polling.
+
+Usage:
+    transaction.on_commit(lambda: publish('evaluation', teacher_id=teacher.pk))
+
+    async with subscribe(lambda event: event['event'] == 'evaluation') as subscription:
+        event = await subscription.get(timeout=15)
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+
+# events kept per subscriber while its client is slow to read
+SUBSCRIBER_QUEUE_SIZE = 100
+
+_subscriptions = set()
+_lock = threading.Lock()
+_event_ids = itertools.count(1)
+
+
+class Subscription:
+    """Queue of the accepted events, registered while used as `async with`"""
+
+    def __init__(self, accepts):
+        self.accepts = accepts
+        self.loop = None
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    async def __aenter__(self):
+        self.loop = asyncio.get_running_loop()
+        with _lock:
+            _subscriptions.add(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        with _lock:
+            _subscriptions.discard(self)
+
+    def deliver(self, event):
+        if not self.accepts(event):
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # the subscriber's event loop is closed
+            pass
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # a stalled client loses events; its dashboard still polls
+            pass
+
+    async def get(self, timeout):
+        """Next event, or None when none arrives within timeout seconds"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+def publish(event, **data):
+    """Send an event to every subscriber that accepts it"""
+    message = {'id': next(_event_ids), 'event': event, 'data': dict(data, sent_at=time.time())}
+    with _lock:
+        subscriptions = list(_subscriptions)
+    for subscription in subscriptions:
+        subscription.deliver(message)
+
+
+def subscribe(accepts):
+    """Subscription to the events for which accepts(event) is true"""
+    return Subscription(accepts)
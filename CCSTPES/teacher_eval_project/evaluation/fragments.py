@@ -0,0 +1,31 @@
+"""
+The admin student listing (filter_students) is rendered once per filter
+set and page and then served from the cache, since admins re-run the same
+filters over and over while triaging registrations.
+
+The pages are keyed on a version counter (see cache_versions.py) that
+signals.py bumps on:
+- saves / deletes of student users (registration, approval, renames)
+- saves / deletes of StudentProfile
+- saves / deletes of Evaluation and StudentSubject (the per-row counts)
+- saves / deletes of Department (department names)
+"""
+
+import hashlib
+import json
+
+from .cache_versions import bump_version, versioned_key
+
+STUDENT_LIST_TIMEOUT = 10 * 60
+STUDENT_LIST_VERSION_KEY = 'student_list_version'
+
+
+def invalidate_student_list():
+    bump_version(STUDENT_LIST_VERSION_KEY)
+
+
+def student_list_key(filters):
+    """Cache key of a page of the student listing for normalized filters"""
+    # search terms and cursors are unbounded, hash them to keep keys short
+    digest = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    return versioned_key('student_list', [STUDENT_LIST_VERSION_KEY], digest)
@@ -0,0 +1,25 @@
+"""
+Totals, submissions in the last hour and per-department completion for the
+admin dashboard, which polls them every few seconds during evaluation week.
+
+The stats are cached under a version counter (see cache_versions.py) plus
+the current minute, since the last-hour window slides even when nothing new
+comes in. signals.py bumps the counter whenever an evaluation, student, teacher, subject, department
+or evaluation setting is saved or deleted. The cache key is also the ETag of
+the endpoint, so a poll with nothing new is answered 304 from the cache alone.
+"""
+
+from django.utils import timezone
+
+from .cache_versions import bump_version, versioned_key
+
+LIVE_STATS_TIMEOUT = 2 * 60
+LIVE_STATS_VERSION_KEY = 'admin_live_stats_version'
+
+
+def invalidate_live_stats():
+    bump_version(LIVE_STATS_VERSION_KEY)
+
+
+def live_stats_etag():
+    return versioned_key('admin_live_stats', [LIVE_STATS_VERSION_KEY], f'{timezone.now():%Y%m%d%H%M}')
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from evaluation.models import Evaluation, backfill_score_columns
+
+
+class Command(BaseCommand):
+    help = (
+        'Fill the persisted score columns (overall_avg, part averages, problem_total) of existing evaluations. '
+        'Migration 0015 runs this once; use --all to recompute every evaluation.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Evaluations updated per transaction')
+        parser.add_argument('--all', action='store_true', help='Recompute every evaluation, not only missing scores')
+
+    def handle(self, *args, **options):
+        updated = backfill_score_columns(
+            Evaluation,
+            batch_size=options['batch_size'],
+            recompute=options['all'],
+            progress=lambda updated: self.stdout.write(f'  {updated} evaluations updated...'),
+        )
+        self.stdout.write(self.style.SUCCESS(f'Backfilled scores for {updated} evaluations.'))
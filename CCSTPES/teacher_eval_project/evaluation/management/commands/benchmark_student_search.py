@@ -0,0 +1,83 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from evaluation.models import Department, StudentProfile, User
+from evaluation.pagination import keyset_page
+from evaluation.search import search_students
+
+FIRST_NAMES = ['Juan', 'Maria', 'Jose', 'Ana', 'Mark', 'Angel', 'John', 'Princess', 'Carlo', 'Kristine']
+LAST_NAMES = ['Dela Cruz', 'Santos', 'Reyes', 'Garcia', 'Mendoza', 'Bautista', 'Villanueva', 'Ramos', 'Aquino', 'Castillo']
+COURSES = ['BSCS', 'BSIT', 'BSIS', 'ACT']
+
+
+class Command(BaseCommand):
+    help = 'Time the admin student search against synthetic students (rolled back unless --keep).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--students', type=int, default=50000, help='Synthetic students to create')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows per bulk insert')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per query, the best one is reported')
+        parser.add_argument('--keep', action='store_true', help='Keep the synthetic students')
+        parser.add_argument('--explain', action='store_true', help='Print the query plan of each search')
+        parser.add_argument('queries', nargs='*', default=['dela cruz', 'santos', 'bench-01234', 'jose rey'])
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.create_students(options['students'], options['batch_size'])
+            for query in options['queries']:
+                self.benchmark(query, options['repeat'], options['explain'])
+            if not options['keep']:
+                transaction.set_rollback(True)
+                self.stdout.write('Rolled back the synthetic students.')
+
+    def create_students(self, count, batch_size):
+        department, _ = Department.objects.get_or_create(code='BENCH', defaults={'name': 'Benchmark Department'})
+        for start in range(0, count, batch_size):
+            users = User.objects.bulk_create([
+                User(
+                    username=f'bench-{i:05d}', user_type='student',
+                    first_name=FIRST_NAMES[i % len(FIRST_NAMES)],
+                    last_name=LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)],
+                    email=f'bench-{i:05d}@example.com',
+                )
+                for i in range(start, min(start + batch_size, count))
+            ])
+            # bulk_create skips save(), so fill search_text here
+            students = [
+                StudentProfile(
+                    user=user, student_id_number=user.username, year_level=user.pk % 4 + 1,
+                    course=COURSES[user.pk % len(COURSES)], department=department,
+                )
+                for user in users
+            ]
+            for student, user in zip(students, users):
+                student.search_text = student.build_search_text(user)
+            StudentProfile.objects.bulk_create(students)
+            self.stdout.write(f'  {start + len(users)} students created...')
+
+        # fresh statistics so the planner considers the search indexes
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {StudentProfile._meta.db_table}')
+
+    def benchmark(self, query, repeat, explain):
+        students = search_students(StudentProfile.objects.all(), query)
+        ordering = ('-search_rank', 'user_id')
+
+        count_time = page_time = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            total = students.count()
+            count_time = min(count_time, time.perf_counter() - started)
+
+            started = time.perf_counter()
+            rows, _ = keyset_page(students.select_related('user'), ordering)
+            page_time = min(page_time, time.perf_counter() - started)
+
+        self.stdout.write(
+            f'{query!r}: {total} matches, count {count_time * 1000:.1f} ms, '
+            f'first page ({len(rows)} rows) {page_time * 1000:.1f} ms'
+        )
+        if explain:
+            self.stdout.write(students.order_by(*ordering)[:26].explain())
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from evaluation.models import TeacherRatingRollup, RatingAccumulator
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the TeacherRatingRollup and RatingAccumulator tables from submitted evaluations.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--teacher', type=int, help='Only rebuild rollups for this TeacherProfile id')
+
+    def handle(self, *args, **options):
+        filters = {}
+        if options['teacher']:
+            filters['teacher_id'] = options['teacher']
+
+        with transaction.atomic():
+            written = TeacherRatingRollup.objects.rebuild(**filters)
+            accumulators = RatingAccumulator.objects.rebuild(**filters)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} rating rollup rows.'))
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {accumulators} rating accumulator rows.'))
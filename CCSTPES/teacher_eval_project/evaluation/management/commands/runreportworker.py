@@ -0,0 +1,59 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.utils import timezone
+
+from evaluation.models import ReportJob
+from evaluation.report_jobs import run_job
+
+PURGE_INTERVAL = 60 * 60
+
+
+class Command(BaseCommand):
+    help = 'Render queued PDF report jobs, oldest first. Run alongside the web process (see Procfile).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Render the queued jobs, then exit')
+        parser.add_argument('--interval', type=float, default=2, help='Seconds between polls of an empty queue')
+        parser.add_argument(
+            '--stale-after', type=int, default=30,
+            help='Minutes after which a running job is considered abandoned and queued again'
+        )
+        parser.add_argument(
+            '--keep-days', type=int, default=7, help='Days finished jobs and their PDFs are kept'
+        )
+
+    def handle(self, *args, **options):
+        requeued = ReportJob.objects.requeue_stale(timezone.now() - timedelta(minutes=options['stale_after']))
+        if requeued:
+            self.stdout.write(f'Queued {requeued} abandoned report jobs again.')
+
+        last_purge = None
+        while True:
+            if last_purge is None or time.monotonic() - last_purge > PURGE_INTERVAL:
+                self.purge(options['keep_days'])
+                last_purge = time.monotonic()
+
+            job = ReportJob.objects.claim_next()
+            if job is not None:
+                run_job(job)
+                style = self.style.SUCCESS if job.status == ReportJob.DONE else self.style.ERROR
+                self.stdout.write(style(f'Report job {job.pk}: {job} {job.error}'.rstrip()))
+                continue
+
+            if options['once']:
+                break
+            # drop connections the database closed while the queue was idle
+            close_old_connections()
+            time.sleep(options['interval'])
+
+    def purge(self, keep_days):
+        expired = ReportJob.objects.filter(
+            status__in=[ReportJob.DONE, ReportJob.FAILED],
+            finished_at__lt=timezone.now() - timedelta(days=keep_days),
+        )
+        count, _ = expired.delete()
+        if count:
+            self.stdout.write(f'Deleted {count} expired report jobs.')
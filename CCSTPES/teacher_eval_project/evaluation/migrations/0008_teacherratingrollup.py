@@ -0,0 +1,97 @@
+# Generated by Django 4.2 on 2026-10-16 23:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_rollups(apps, schema_editor):
+    from django.db.models import Count, Sum
+
+    Evaluation = apps.get_model('evaluation', 'Evaluation')
+    TeacherRatingRollup = apps.get_model('evaluation', 'TeacherRatingRollup')
+
+    parts = {
+        'presentation': ['presentation_objectives', 'presentation_motivation', 'presentation_relation',
+                         'presentation_assignments'],
+        'development': ['dev_anticipates', 'dev_mastery', 'dev_logical', 'dev_expression', 'dev_participation',
+                        'dev_questions', 'dev_values', 'dev_reinforcement', 'dev_involvement', 'dev_voice',
+                        'dev_grammar', 'dev_monitoring', 'dev_time'],
+        'student_behavior': ['student_answers', 'student_questions', 'student_engagement', 'student_timeframe',
+                             'student_majority'],
+        'wrapup': ['wrapup_demonstrate', 'wrapup_synthesize'],
+        'problem': ['problem_late', 'problem_absent', 'problem_video'],
+    }
+    sums = {'evaluation_count': Count('id')}
+    for part, fields in parts.items():
+        for name in fields:
+            sums[f'{name}_sum'] = Sum(name)
+
+    rows = (
+        Evaluation.objects.order_by()
+        .values('teacher_id', 'academic_year_id', 'semester_id', 'subject_id')
+        .annotate(**sums)
+    )
+    rollups = []
+    for row in rows:
+        for part, fields in parts.items():
+            row[f'{part}_sum'] = sum(row[f'{name}_sum'] for name in fields)
+        rollups.append(TeacherRatingRollup(**row))
+    TeacherRatingRollup.objects.bulk_create(rollups, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0007_alter_evaluation_unique_together'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TeacherRatingRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('evaluation_count', models.PositiveIntegerField(default=0)),
+                ('presentation_objectives_sum', models.PositiveIntegerField(default=0)),
+                ('presentation_motivation_sum', models.PositiveIntegerField(default=0)),
+                ('presentation_relation_sum', models.PositiveIntegerField(default=0)),
+                ('presentation_assignments_sum', models.PositiveIntegerField(default=0)),
+                ('dev_anticipates_sum', models.PositiveIntegerField(default=0)),
+                ('dev_mastery_sum', models.PositiveIntegerField(default=0)),
+                ('dev_logical_sum', models.PositiveIntegerField(default=0)),
+                ('dev_expression_sum', models.PositiveIntegerField(default=0)),
+                ('dev_participation_sum', models.PositiveIntegerField(default=0)),
+                ('dev_questions_sum', models.PositiveIntegerField(default=0)),
+                ('dev_values_sum', models.PositiveIntegerField(default=0)),
+                ('dev_reinforcement_sum', models.PositiveIntegerField(default=0)),
+                ('dev_involvement_sum', models.PositiveIntegerField(default=0)),
+                ('dev_voice_sum', models.PositiveIntegerField(default=0)),
+                ('dev_grammar_sum', models.PositiveIntegerField(default=0)),
+                ('dev_monitoring_sum', models.PositiveIntegerField(default=0)),
+                ('dev_time_sum', models.PositiveIntegerField(default=0)),
+                ('student_answers_sum', models.PositiveIntegerField(default=0)),
+                ('student_questions_sum', models.PositiveIntegerField(default=0)),
+                ('student_engagement_sum', models.PositiveIntegerField(default=0)),
+                ('student_timeframe_sum', models.PositiveIntegerField(default=0)),
+                ('student_majority_sum', models.PositiveIntegerField(default=0)),
+                ('wrapup_demonstrate_sum', models.PositiveIntegerField(default=0)),
+                ('wrapup_synthesize_sum', models.PositiveIntegerField(default=0)),
+                ('problem_late_sum', models.PositiveIntegerField(default=0)),
+                ('problem_absent_sum', models.PositiveIntegerField(default=0)),
+                ('problem_video_sum', models.PositiveIntegerField(default=0)),
+                ('presentation_sum', models.PositiveIntegerField(default=0)),
+                ('development_sum', models.PositiveIntegerField(default=0)),
+                ('student_behavior_sum', models.PositiveIntegerField(default=0)),
+                ('wrapup_sum', models.PositiveIntegerField(default=0)),
+                ('problem_sum', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('academic_year', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='evaluation.academicyear')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='evaluation.semester')),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='evaluation.subject')),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rating_rollups', to='evaluation.teacherprofile')),
+            ],
+            options={
+                'unique_together': {('teacher', 'academic_year', 'semester', 'subject')},
+            },
+        ),
+        migrations.RunPython(build_rollups, migrations.RunPython.noop),
+    ]
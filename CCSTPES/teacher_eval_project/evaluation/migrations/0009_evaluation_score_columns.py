@@ -0,0 +1,43 @@
+# Generated by Django 4.2 on 2026-10-16 23:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0008_teacherratingrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='evaluation',
+            name='development_avg',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='overall_avg',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='presentation_avg',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='problem_total',
+            field=models.PositiveSmallIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='student_behavior_avg',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='evaluation',
+            name='wrapup_avg',
+            field=models.FloatField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,89 @@
+# Generated by Django 4.2 on 2026-10-16 23:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def build_accumulators(apps, schema_editor):
+    from django.db.models import Avg, Count, F, FloatField, Value, Variance
+    from django.db.models.functions import Cast
+
+    Evaluation = apps.get_model('evaluation', 'Evaluation')
+    RatingAccumulator = apps.get_model('evaluation', 'RatingAccumulator')
+
+    parts = {
+        'presentation': ['presentation_objectives', 'presentation_motivation', 'presentation_relation',
+                         'presentation_assignments'],
+        'development': ['dev_anticipates', 'dev_mastery', 'dev_logical', 'dev_expression', 'dev_participation',
+                        'dev_questions', 'dev_values', 'dev_reinforcement', 'dev_involvement', 'dev_voice',
+                        'dev_grammar', 'dev_monitoring', 'dev_time'],
+        'student_behavior': ['student_answers', 'student_questions', 'student_engagement', 'student_timeframe',
+                             'student_majority'],
+        'wrapup': ['wrapup_demonstrate', 'wrapup_synthesize'],
+    }
+    rating_fields = [name for fields in parts.values() for name in fields]
+    problem_fields = ['problem_late', 'problem_absent', 'problem_video']
+
+    def average(fields):
+        total = F(fields[0])
+        for name in fields[1:]:
+            total = total + F(name)
+        return Cast(total, FloatField()) / Value(float(len(fields)), output_field=FloatField())
+
+    expressions = {'overall': average(rating_fields)}
+    for part, fields in parts.items():
+        expressions[part] = average(fields)
+    for name in rating_fields + problem_fields:
+        expressions[name] = Cast(F(name), FloatField())
+
+    aggregates = {'evaluation_count': Count('id')}
+    for criterion, expression in expressions.items():
+        aggregates[f'{criterion}_mean'] = Avg(expression)
+        aggregates[f'{criterion}_variance'] = Variance(expression)
+
+    rows = (
+        Evaluation.objects.order_by()
+        .values('teacher_id', 'academic_year_id', 'semester_id')
+        .annotate(**aggregates)
+    )
+    accumulators = []
+    for row in rows:
+        n = row['evaluation_count']
+        for criterion in expressions:
+            accumulators.append(RatingAccumulator(
+                teacher_id=row['teacher_id'],
+                academic_year_id=row['academic_year_id'],
+                semester_id=row['semester_id'],
+                criterion=criterion,
+                n=n,
+                mean=row[f'{criterion}_mean'],
+                m2=(row[f'{criterion}_variance'] or 0.0) * n,
+            ))
+    RatingAccumulator.objects.bulk_create(accumulators, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0009_evaluation_score_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RatingAccumulator',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('criterion', models.CharField(max_length=40)),
+                ('n', models.PositiveIntegerField(default=0)),
+                ('mean', models.FloatField(default=0.0)),
+                ('m2', models.FloatField(default=0.0)),
+                ('academic_year', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='evaluation.academicyear')),
+                ('semester', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='evaluation.semester')),
+                ('teacher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rating_accumulators', to='evaluation.teacherprofile')),
+            ],
+            options={
+                'unique_together': {('teacher', 'academic_year', 'semester', 'criterion')},
+            },
+        ),
+        migrations.RunPython(build_accumulators, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,87 @@
+# Generated by Django 4.2 on 2026-10-16 23:56
+
+from django.db import migrations, models
+
+
+TABLE = 'evaluation_studentprofile'
+FTS_TABLE = 'evaluation_studentprofile_fts'
+
+# pg_trgm serves the substring matches of the search (LIKE '%word%'). Servers
+# without the contrib extensions still search correctly, with a sequential scan.
+POSTGRES_INDEXES = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    f'CREATE INDEX IF NOT EXISTS studentprofile_search_trgm_idx ON {TABLE} USING gin (search_text gin_trgm_ops)',
+]
+POSTGRES_DROP_INDEXES = [
+    'DROP INDEX IF EXISTS studentprofile_search_tsv_idx',
+    'DROP INDEX IF EXISTS studentprofile_search_trgm_idx',
+]
+
+# External content FTS5 table over search_text, kept in sync by triggers; the
+# trigram tokenizer (SQLite 3.34+) matches substrings, not only word prefixes
+SQLITE_FTS = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"search_text, content='{TABLE}', content_rowid='id', tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text) VALUES ('delete', old.id, old.search_text);
+        INSERT INTO {FTS_TABLE}(rowid, search_text) VALUES (new.id, new.search_text);
+    END""",
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+SQLITE_DROP_FTS = [
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_au',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ad',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ai',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+
+def fill_search_text(apps, schema_editor):
+    StudentProfile = apps.get_model('evaluation', 'StudentProfile')
+    profiles = list(StudentProfile.objects.select_related('user'))
+    for profile in profiles:
+        user = profile.user
+        values = [user.first_name, user.last_name, user.username, user.email, profile.student_id_number, profile.course]
+        profile.search_text = ' '.join(value for value in values if value).lower()
+    StudentProfile.objects.bulk_update(profiles, ['search_text'], batch_size=1000)
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {'postgresql': POSTGRES_INDEXES, 'sqlite': SQLITE_FTS}.get(vendor, [])
+    if vendor == 'postgresql':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+            if not cursor.fetchone():
+                statements = []
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def drop_search_indexes(apps, schema_editor):
+    statements = {'postgresql': POSTGRES_DROP_INDEXES, 'sqlite': SQLITE_DROP_FTS}
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0011_user_name_order_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='studentprofile',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(fill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
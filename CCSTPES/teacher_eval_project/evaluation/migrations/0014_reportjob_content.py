@@ -0,0 +1,22 @@
+# Generated by Django 4.2 on 2026-10-17 00:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0013_reportjob'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='reportjob',
+            name='file',
+        ),
+        migrations.AddField(
+            model_name='reportjob',
+            name='content',
+            field=models.BinaryField(blank=True),
+        ),
+    ]
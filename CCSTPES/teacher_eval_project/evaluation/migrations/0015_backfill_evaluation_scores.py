@@ -0,0 +1,54 @@
+from django.db import migrations, transaction
+
+
+def backfill_scores(apps, schema_editor):
+    # Fill the score columns added in 0009 for evaluations saved before them,
+    # in keyset-paginated batches of 500
+    Evaluation = apps.get_model('evaluation', 'Evaluation')
+
+    parts = {
+        'presentation': ['presentation_objectives', 'presentation_motivation', 'presentation_relation',
+                         'presentation_assignments'],
+        'development': ['dev_anticipates', 'dev_mastery', 'dev_logical', 'dev_expression', 'dev_participation',
+                        'dev_questions', 'dev_values', 'dev_reinforcement', 'dev_involvement', 'dev_voice',
+                        'dev_grammar', 'dev_monitoring', 'dev_time'],
+        'student_behavior': ['student_answers', 'student_questions', 'student_engagement', 'student_timeframe',
+                             'student_majority'],
+        'wrapup': ['wrapup_demonstrate', 'wrapup_synthesize'],
+    }
+    rating_fields = [name for fields in parts.values() for name in fields]
+    problem_fields = ['problem_late', 'problem_absent', 'problem_video']
+    columns = ['overall_avg'] + [f'{part}_avg' for part in parts] + ['problem_total']
+
+    def average(evaluation, fields):
+        return round(sum(getattr(evaluation, name) for name in fields) / len(fields), 2)
+
+    evaluations = Evaluation.objects.filter(overall_avg__isnull=True).order_by('pk').only(
+        'pk', *rating_fields, *problem_fields
+    )
+    last_pk = 0
+    while True:
+        batch = list(evaluations.filter(pk__gt=last_pk)[:500])
+        if not batch:
+            return
+
+        for evaluation in batch:
+            evaluation.overall_avg = average(evaluation, rating_fields)
+            for part, fields in parts.items():
+                setattr(evaluation, f'{part}_avg', average(evaluation, fields))
+            evaluation.problem_total = sum(getattr(evaluation, name) for name in problem_fields)
+
+        with transaction.atomic():
+            Evaluation.objects.bulk_update(batch, columns)
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('evaluation', '0014_reportjob_content'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_scores, migrations.RunPython.noop),
+    ]
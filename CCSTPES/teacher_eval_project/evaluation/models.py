@@ -1,11 +1,13 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.db.models import Count, Q
+from django.db.models import Avg, Count, F, FloatField, OuterRef, Q, Subquery, Sum, Value, Variance
+from django.db.models.functions import Cast, Coalesce, TruncMonth, TruncWeek
 from django.core.validators import FileExtensionValidator
-from datetime import datetime
+from datetime import datetime, timedelta
+import math
 
 
 
@@ -23,6 +25,12 @@ class User(AbstractUser):
     is_pending = models.BooleanField(default=False)
     email_verification_token = models.CharField(max_length=100, blank=True, null=True)
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Keyset pagination order of the admin student listing
+            models.Index(fields=['first_name', 'last_name', 'id'], name='user_name_order_idx'),
+        ]
+    
     def __str__(self):
         return f"{self.username} ({self.get_user_type_display()})"
 
@@ -126,6 +134,26 @@ class Subject(models.Model):
 
 
 
+class TeacherProfileQuerySet(models.QuerySet):
+
+    def with_ratings(self):
+        """
+        Annotate average_rating and rated_evaluation_count from the rating rollups
+        (0 for teachers without evaluations) so get_average_rating() needs no query.
+        """
+        aggregates = rollup_aggregates()
+        rollups = TeacherRatingRollup.objects.filter(teacher=OuterRef('pk')).order_by().values('teacher')
+        return self.annotate(
+            rated_evaluation_count=Coalesce(
+                Subquery(rollups.annotate(total=aggregates['total_evaluations']).values('total')), 0
+            ),
+            average_rating=Coalesce(
+                Subquery(rollups.annotate(average=aggregates['average_rating']).values('average')),
+                Value(0.0)
+            ),
+        )
+
+
 class TeacherProfile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='teacher_profile')
     employee_id = models.CharField(max_length=50, unique=True)
@@ -148,18 +176,17 @@ class TeacherProfile(models.Model):
     qualification = models.CharField(max_length=200)
     experience_years = models.IntegerField(default=0)
     
+    objects = TeacherProfileQuerySet.as_manager()
+    
     def __str__(self):
         return f"Teacher: {self.user.username} ({self.department.code})"
     
     def get_average_rating(self):
         """Calculate average rating from all evaluations"""
-        evaluations = self.evaluations.all()
-        if evaluations.exists():
-            total_avg = 0
-            for evaluation in evaluations:
-                total_avg += evaluation.get_average_rating()  # Use Evaluation's get_average_rating() method
-            return round(total_avg / evaluations.count(), 2)
-        return 0
+        if hasattr(self, 'average_rating'):
+            # Annotated by TeacherProfile.objects.with_ratings()
+            return round(self.average_rating, 2)
+        return self.rating_rollups.summary()['average_rating']
     
     def get_subjects_list(self):
         """Get comma-separated list of subject codes"""
@@ -183,6 +210,10 @@ class TeacherProfile(models.Model):
     def get_evaluation_progress(self):
         """Get evaluation progress percentage for this teacher
         Returns a dict with total_possible, completed, and percentage"""
+        # Set by attach_evaluation_progress() for lists of teachers
+        if hasattr(self, '_evaluation_progress'):
+            return self._evaluation_progress
+        
         # Get all students in the same department
         total_students = StudentProfile.objects.filter(
             department=self.department
@@ -191,6 +222,10 @@ class TeacherProfile(models.Model):
         # Get completed evaluations for this teacher
         completed_evaluations = self.evaluations.count()
         
+        return self._progress(total_students, completed_evaluations)
+    
+    @staticmethod
+    def _progress(total_students, completed_evaluations):
         if total_students == 0:
             return {
                 'total_possible': 0,
@@ -206,6 +241,32 @@ class TeacherProfile(models.Model):
             'percentage': percentage
         }
     
+    @classmethod
+    def attach_evaluation_progress(cls, teachers):
+        """
+        Compute get_evaluation_progress() for many teachers with two grouped
+        queries (students per department, evaluations per teacher) and store
+        it on each teacher. Returns the teachers as a list.
+        """
+        teachers = list(teachers)
+        if not teachers:
+            return teachers
+        
+        students_per_department = dict(
+            StudentProfile.objects.filter(department__in={teacher.department_id for teacher in teachers})
+            .order_by().values_list('department').annotate(total=Count('id'))
+        )
+        evaluations_per_teacher = dict(
+            Evaluation.objects.filter(teacher__in=[teacher.pk for teacher in teachers])
+            .order_by().values_list('teacher').annotate(total=Count('id'))
+        )
+        for teacher in teachers:
+            teacher._evaluation_progress = cls._progress(
+                students_per_department.get(teacher.department_id, 0),
+                evaluations_per_teacher.get(teacher.pk, 0)
+            )
+        return teachers
+    
     class Meta:
         ordering = ['user__username']
 
@@ -254,12 +315,29 @@ class StudentProfile(models.Model):
         related_name='students'
     )
 
+    # Lowercased names, username, email, student number and course for the
+    # admin student search (see search.py); kept in sync by save() and by a
+    # User post_save signal
+    search_text = models.TextField(blank=True, default='', editable=False)
+
     class Meta:
         ordering = ['user__username']
 
     def __str__(self):
         return f"{self.user.get_full_name()} ({self.student_id_number})"
 
+    def save(self, *args, **kwargs):
+        self.search_text = self.build_search_text()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {'search_text'}
+        super().save(*args, **kwargs)
+
+    def build_search_text(self, user=None):
+        user = user or self.user
+        values = [user.first_name, user.last_name, user.username, user.email, self.student_id_number, self.course]
+        return ' '.join(value for value in values if value).lower()
+
     # ---------------------------
     # HELPERS - FIXED FOR YOUR SETUP
     # ---------------------------
@@ -333,17 +411,8 @@ class StudentProfile(models.Model):
             return self.get_assigned_teachers()
         
         # Otherwise, get all teachers teaching subjects for this year level
-        # Since Subject.teachers is ManyToMany, we need to collect all teachers
-        subjects_for_year = Subject.objects.filter(year_level=self.year_level)
-        
-        teacher_ids = set()
-        for subject in subjects_for_year.prefetch_related('teachers'):
-            teacher_ids.update(subject.teachers.values_list('id', flat=True))
-        
-        if teacher_ids:
-            return TeacherProfile.objects.filter(id__in=teacher_ids).distinct()
-        
-        return TeacherProfile.objects.none()
+        # (one query through the Subject.teachers join table)
+        return TeacherProfile.objects.filter(subjects__year_level=self.year_level).distinct()
 
     def get_evaluation_progress(self):
         """
@@ -458,6 +527,249 @@ class EvaluationSettings(models.Model):
     
 
 
+# Rated criteria grouped by evaluation part (all rated 1-5)
+PRESENTATION_FIELDS = (
+    'presentation_objectives', 'presentation_motivation',
+    'presentation_relation', 'presentation_assignments',
+)
+DEVELOPMENT_FIELDS = (
+    'dev_anticipates', 'dev_mastery', 'dev_logical', 'dev_expression',
+    'dev_participation', 'dev_questions', 'dev_values', 'dev_reinforcement',
+    'dev_involvement', 'dev_voice', 'dev_grammar', 'dev_monitoring', 'dev_time',
+)
+STUDENT_BEHAVIOR_FIELDS = (
+    'student_answers', 'student_questions', 'student_engagement',
+    'student_timeframe', 'student_majority',
+)
+WRAPUP_FIELDS = ('wrapup_demonstrate', 'wrapup_synthesize')
+RATING_FIELDS = PRESENTATION_FIELDS + DEVELOPMENT_FIELDS + STUDENT_BEHAVIOR_FIELDS + WRAPUP_FIELDS
+
+# Problems met (rated 1-3)
+PROBLEM_FIELDS = ('problem_late', 'problem_absent', 'problem_video')
+
+RATING_SCALE = 5
+PROBLEM_SCALE = 3
+
+SCORE_PARTS = {
+    'presentation': PRESENTATION_FIELDS,
+    'development': DEVELOPMENT_FIELDS,
+    'student_behavior': STUDENT_BEHAVIOR_FIELDS,
+    'wrapup': WRAPUP_FIELDS,
+}
+
+
+def score_expression(fields):
+    """Database expression for the average of the given rating fields of one evaluation"""
+    total = F(fields[0])
+    for name in fields[1:]:
+        total = total + F(name)
+    return Cast(total, FloatField()) / Value(float(len(fields)), output_field=FloatField())
+
+
+def stored_score(part):
+    """
+    Persisted score column of 'overall' or a SCORE_PARTS part (overall_avg,
+    presentation_avg, ...), computed from the criteria for rows whose
+    columns are not filled yet.
+    """
+    fields = RATING_FIELDS if part == 'overall' else SCORE_PARTS[part]
+    return Coalesce(F(f'{part}_avg'), score_expression(fields))
+
+
+def score_aggregates():
+    """Aggregates matching get_average_rating() and the part averages, averaged across evaluations"""
+    aggregates = {
+        'evaluation_count': Count('id'),
+        'average_rating': Avg(stored_score('overall')),
+    }
+    for part in SCORE_PARTS:
+        aggregates[f'{part}_average'] = Avg(stored_score(part))
+    return aggregates
+
+
+def calculate_score_columns(evaluation):
+    """Values of the persisted score columns of an evaluation (or historical model instance)"""
+    def average(fields):
+        return round(sum(getattr(evaluation, name) for name in fields) / len(fields), 2)
+
+    return {
+        'overall_avg': average(RATING_FIELDS),
+        'presentation_avg': average(PRESENTATION_FIELDS),
+        'development_avg': average(DEVELOPMENT_FIELDS),
+        'student_behavior_avg': average(STUDENT_BEHAVIOR_FIELDS),
+        'wrapup_avg': average(WRAPUP_FIELDS),
+        'problem_total': sum(getattr(evaluation, name) for name in PROBLEM_FIELDS),
+    }
+
+
+SCORE_COLUMNS = (
+    'overall_avg', 'presentation_avg', 'development_avg',
+    'student_behavior_avg', 'wrapup_avg', 'problem_total',
+)
+
+
+def backfill_score_columns(model, batch_size=500, recompute=False, progress=None):
+    """
+    Fill the persisted score columns in keyset-paginated batches, one
+    transaction per batch. Only rows without scores unless recompute.
+
+    model is Evaluation, or the historical model inside a migration.
+    progress(updated) is called after every batch. Returns the number of
+    evaluations updated.
+    """
+    evaluations = model.objects.order_by('pk').only('pk', *RATING_FIELDS, *PROBLEM_FIELDS)
+    if not recompute:
+        evaluations = evaluations.filter(overall_avg__isnull=True)
+
+    updated = 0
+    last_pk = 0
+    while True:
+        batch = list(evaluations.filter(pk__gt=last_pk)[:batch_size])
+        if not batch:
+            return updated
+
+        for evaluation in batch:
+            for name, value in calculate_score_columns(evaluation).items():
+                setattr(evaluation, name, value)
+
+        with transaction.atomic():
+            model.objects.bulk_update(batch, SCORE_COLUMNS)
+
+        last_pk = batch[-1].pk
+        updated += len(batch)
+        if progress:
+            progress(updated)
+
+
+def distribution_aggregates():
+    """Conditional counts named '<field>_<value>' for every criterion and every possible value"""
+    aggregates = {}
+    for fields, scale in ((RATING_FIELDS, RATING_SCALE), (PROBLEM_FIELDS, PROBLEM_SCALE)):
+        for name in fields:
+            for value in range(1, scale + 1):
+                aggregates[f'{name}_{value}'] = Count('id', filter=Q(**{name: value}))
+    return aggregates
+
+
+TREND_TRUNCATORS = {'week': TruncWeek, 'month': TruncMonth}
+
+
+def trend_periods(unit, periods, today=None):
+    """Start dates of the last `periods` weeks (Monday) or months, oldest first, ending with the current one"""
+    today = today or timezone.localdate()
+    if unit == 'week':
+        current = today - timedelta(days=today.weekday())
+        return [current - timedelta(weeks=offset) for offset in range(periods - 1, -1, -1)]
+
+    starts = []
+    year, month = today.year, today.month
+    for _ in range(periods):
+        starts.append(today.replace(year=year, month=month, day=1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return starts[::-1]
+
+
+class EvaluationQuerySet(models.QuerySet):
+    """Scoring helpers that compute evaluation averages inside the database"""
+
+    def with_scores(self):
+        """Annotate each evaluation with overall_score and the four part scores"""
+        annotations = {'overall_score': stored_score('overall')}
+        for part in SCORE_PARTS:
+            annotations[f'{part}_score'] = stored_score(part)
+        return self.annotate(**annotations)
+
+    def score_summary(self):
+        """
+        Aggregate the queryset into a single row.
+
+        Returns a dict with evaluation_count, average_rating and the
+        presentation/development/student_behavior/wrapup averages.
+        Averages are 0 when there are no evaluations.
+        """
+        summary = self.order_by().aggregate(**score_aggregates())
+        return _round_summary(summary)
+
+    def score_summary_by(self, *fields):
+        """
+        Same as score_summary() but grouped by the given fields.
+
+        Returns a list of dicts, one per group, each also holding the
+        grouping field values.
+        """
+        rows = self.order_by().values(*fields).annotate(**score_aggregates()).order_by(*fields)
+        return [_round_summary(row) for row in rows]
+
+    def period_history(self, *fields):
+        """
+        Same as score_summary() per academic year and semester, oldest first.
+
+        One grouped query; each dict also holds academic_year, semester and
+        their names. Extra fields (e.g. 'teacher') are added to the grouping.
+        """
+        period_fields = (
+            'academic_year', 'academic_year__name', 'academic_year__start_Year',
+            'semester', 'semester__name', 'semester__start_Month',
+        )
+        rows = (
+            self.order_by()
+            .values(*fields, *period_fields)
+            .annotate(**score_aggregates())
+            .order_by(*fields, 'academic_year__start_Year', 'semester__start_Month')
+        )
+        return [_round_summary(row) for row in rows]
+
+    def score_trend(self, unit='week', periods=5, today=None):
+        """
+        Evaluation count and average rating per week or month, in one grouped query.
+
+        Returns one dict per period (oldest first) with period (start date),
+        evaluation_count and average_rating. Every period is present; periods
+        without evaluations have a count of 0 and an average_rating of None
+        so callers decide how to show the gap.
+        """
+        starts = trend_periods(unit, periods, today)
+        rows = (
+            self.order_by()
+            .filter(created_at__date__gte=starts[0])
+            .annotate(period=TREND_TRUNCATORS[unit]('created_at', output_field=models.DateField()))
+            .values('period')
+            .annotate(evaluation_count=Count('id'), average_rating=Avg(stored_score('overall')))
+        )
+        by_period = {row['period']: row for row in rows}
+
+        trend = []
+        for start in starts:
+            row = by_period.get(start)
+            trend.append({
+                'period': start,
+                'evaluation_count': row['evaluation_count'] if row else 0,
+                'average_rating': round(row['average_rating'], 2) if row else None,
+            })
+        return trend
+
+    def rating_distribution(self):
+        """
+        Count how often each value was given for every criterion, in one query.
+
+        Returns {field: [count of 1s, count of 2s, ...]} with five counts for
+        the rated items and three for the problem_* items.
+        """
+        counts = self.order_by().aggregate(**distribution_aggregates())
+        distribution = {}
+        for fields, scale in ((RATING_FIELDS, RATING_SCALE), (PROBLEM_FIELDS, PROBLEM_SCALE)):
+            for name in fields:
+                distribution[name] = [counts[f'{name}_{value}'] for value in range(1, scale + 1)]
+        return distribution
+
+
+def _round_summary(summary):
+    for key, value in summary.items():
+        if key.endswith('_average') or key == 'average_rating':
+            summary[key] = round(value, 2) if value is not None else 0
+    return summary
+
+
 class Evaluation(models.Model):
     student = models.ForeignKey(
         StudentProfile, 
@@ -596,9 +908,21 @@ class Evaluation(models.Model):
         help_text="Suggested measures to solve the problems"
     )
     
+    # PERSISTED SCORES (computed in save(), see calculate_scores())
+    overall_avg = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    presentation_avg = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    development_avg = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    student_behavior_avg = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    wrapup_avg = models.FloatField(null=True, blank=True, editable=False, db_index=True)
+    problem_total = models.PositiveSmallIntegerField(null=True, blank=True, editable=False, db_index=True)
+    
+    SCORE_COLUMNS = SCORE_COLUMNS
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = EvaluationQuerySet.as_manager()
+    
     class Meta:
         unique_together = ['student', 'teacher', 'subject', 'semester', 'academic_year']
         ordering = ['-created_at']
@@ -606,8 +930,23 @@ class Evaluation(models.Model):
     def __str__(self):
         return f"{self.student.user.username} evaluated {self.teacher.user.username} - {self.subject.code}"
     
+    def save(self, *args, **kwargs):
+        for name, value in self.calculate_scores().items():
+            setattr(self, name, value)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | set(self.SCORE_COLUMNS)
+        super().save(*args, **kwargs)
+    
+    def calculate_scores(self):
+        """Compute the values of the persisted score columns from the criterion fields"""
+        return calculate_score_columns(self)
+    
     def get_average_rating(self):
         """Calculate overall average rating from all criteria"""
+        if self.overall_avg is not None:
+            return self.overall_avg
+        
         # Part I: Presentation (4 items)
         part1 = (
             self.presentation_objectives + self.presentation_motivation + 
@@ -639,6 +978,9 @@ class Evaluation(models.Model):
     
     def get_presentation_average(self):
         """Average for Part I: Presentation of Lesson"""
+        if self.presentation_avg is not None:
+            return self.presentation_avg
+        
         total = (
             self.presentation_objectives + self.presentation_motivation + 
             self.presentation_relation + self.presentation_assignments
@@ -647,6 +989,9 @@ class Evaluation(models.Model):
     
     def get_development_average(self):
         """Average for Part II: Development of Lesson"""
+        if self.development_avg is not None:
+            return self.development_avg
+        
         total = (
             self.dev_anticipates + self.dev_mastery + self.dev_logical + 
             self.dev_expression + self.dev_participation + self.dev_questions + 
@@ -657,6 +1002,9 @@ class Evaluation(models.Model):
     
     def get_student_behavior_average(self):
         """Average for Part III: Expected Student Behavior"""
+        if self.student_behavior_avg is not None:
+            return self.student_behavior_avg
+        
         total = (
             self.student_answers + self.student_questions + 
             self.student_engagement + self.student_timeframe + self.student_majority
@@ -665,6 +1013,9 @@ class Evaluation(models.Model):
     
     def get_wrapup_average(self):
         """Average for Part IV: Wrap-up"""
+        if self.wrapup_avg is not None:
+            return self.wrapup_avg
+        
         total = self.wrapup_demonstrate + self.wrapup_synthesize
         return round(total / 2, 2)
     
@@ -675,4 +1026,433 @@ class Evaluation(models.Model):
             'absent': self.problem_absent,
             'video': self.problem_video,
             'total': self.problem_late + self.problem_absent + self.problem_video
-        }
\ No newline at end of file
+        }
+
+
+ROLLUP_KEY_FIELDS = ('teacher_id', 'academic_year_id', 'semester_id', 'subject_id')
+ROLLUP_PART_FIELDS = dict(SCORE_PARTS, problem=PROBLEM_FIELDS)
+
+
+def rollup_aggregates():
+    """Aggregates over rollup rows with the same keys as score_aggregates()"""
+    total_count = Sum('evaluation_count')
+    overall_sum = Sum('presentation_sum') + Sum('development_sum') + Sum('student_behavior_sum') + Sum('wrapup_sum')
+    aggregates = {
+        # Named differently from the model field; renamed by _rollup_summary()
+        'total_evaluations': total_count,
+        'average_rating': Cast(overall_sum, FloatField()) / (Cast(total_count, FloatField()) * len(RATING_FIELDS)),
+    }
+    for part, fields in SCORE_PARTS.items():
+        aggregates[f'{part}_average'] = (
+            Cast(Sum(f'{part}_sum'), FloatField()) / (Cast(total_count, FloatField()) * len(fields))
+        )
+    return aggregates
+
+
+class TeacherRatingRollupQuerySet(models.QuerySet):
+    """Read and maintain the per-teacher rating totals"""
+
+    def summary(self):
+        """Same result shape as EvaluationQuerySet.score_summary()"""
+        return _rollup_summary(self.order_by().aggregate(**rollup_aggregates()))
+
+    def summary_by(self, *fields):
+        """Same result shape as EvaluationQuerySet.score_summary_by()"""
+        rows = self.order_by().values(*fields).annotate(**rollup_aggregates()).order_by(*fields)
+        return [_rollup_summary(row) for row in rows if row['total_evaluations']]
+
+    def record(self, evaluation, sign=1):
+        """Add (sign=1) or remove (sign=-1) one evaluation from its rollup row"""
+        key = {name: getattr(evaluation, name) for name in ROLLUP_KEY_FIELDS}
+        if sign > 0:
+            self.get_or_create(**key)
+
+        updates = {'evaluation_count': F('evaluation_count') + sign}
+        for part, fields in ROLLUP_PART_FIELDS.items():
+            part_total = 0
+            for name in fields:
+                value = getattr(evaluation, name)
+                updates[f'{name}_sum'] = F(f'{name}_sum') + sign * value
+                part_total += value
+            updates[f'{part}_sum'] = F(f'{part}_sum') + sign * part_total
+        self.filter(**key).update(**updates)
+
+        if sign < 0:
+            self.filter(evaluation_count__lte=0, **key).delete()
+
+    def rebuild(self, **filters):
+        """
+        Recompute rollup rows from Evaluation.
+
+        filters are applied to both tables (e.g. teacher_id=3), so a single
+        key or the whole table can be rebuilt. Returns the number of rows written.
+        """
+        sums = {'evaluation_count': Count('id')}
+        for part, fields in ROLLUP_PART_FIELDS.items():
+            for name in fields:
+                sums[f'{name}_sum'] = Sum(name)
+            sums[f'{part}_sum'] = sum((Sum(name) for name in fields[1:]), Sum(fields[0]))
+
+        rows = (
+            Evaluation.objects.filter(**filters)
+            .order_by()
+            .values(*ROLLUP_KEY_FIELDS)
+            .annotate(**sums)
+        )
+        self.filter(**filters).delete()
+        rollups = self.bulk_create([self.model(**row) for row in rows], batch_size=500)
+        return len(rollups)
+
+
+def _rollup_summary(row):
+    row['evaluation_count'] = row.pop('total_evaluations') or 0
+    return _round_summary(row)
+
+
+class TeacherRatingRollup(models.Model):
+    """
+    Running totals of every criterion per (teacher, academic year, semester, subject).
+
+    Kept up to date by the Evaluation signals in signals.py and rebuildable with
+    the rebuild_rating_rollups management command. Averages are the sums divided
+    by evaluation_count (and by the number of items for part sums).
+    """
+    teacher = models.ForeignKey(
+        TeacherProfile,
+        on_delete=models.CASCADE,
+        related_name='rating_rollups'
+    )
+    academic_year = models.ForeignKey(AcademicYear, on_delete=models.CASCADE)
+    semester = models.ForeignKey(Semester, on_delete=models.CASCADE)
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE)
+    
+    evaluation_count = models.PositiveIntegerField(default=0)
+    
+    # PART I: PRESENTATION OF LESSON - per-criterion sums
+    presentation_objectives_sum = models.PositiveIntegerField(default=0)
+    presentation_motivation_sum = models.PositiveIntegerField(default=0)
+    presentation_relation_sum = models.PositiveIntegerField(default=0)
+    presentation_assignments_sum = models.PositiveIntegerField(default=0)
+    
+    # PART II: DEVELOPMENT OF THE LESSON - per-criterion sums
+    dev_anticipates_sum = models.PositiveIntegerField(default=0)
+    dev_mastery_sum = models.PositiveIntegerField(default=0)
+    dev_logical_sum = models.PositiveIntegerField(default=0)
+    dev_expression_sum = models.PositiveIntegerField(default=0)
+    dev_participation_sum = models.PositiveIntegerField(default=0)
+    dev_questions_sum = models.PositiveIntegerField(default=0)
+    dev_values_sum = models.PositiveIntegerField(default=0)
+    dev_reinforcement_sum = models.PositiveIntegerField(default=0)
+    dev_involvement_sum = models.PositiveIntegerField(default=0)
+    dev_voice_sum = models.PositiveIntegerField(default=0)
+    dev_grammar_sum = models.PositiveIntegerField(default=0)
+    dev_monitoring_sum = models.PositiveIntegerField(default=0)
+    dev_time_sum = models.PositiveIntegerField(default=0)
+    
+    # PART III: EXPECTED STUDENT BEHAVIOR - per-criterion sums
+    student_answers_sum = models.PositiveIntegerField(default=0)
+    student_questions_sum = models.PositiveIntegerField(default=0)
+    student_engagement_sum = models.PositiveIntegerField(default=0)
+    student_timeframe_sum = models.PositiveIntegerField(default=0)
+    student_majority_sum = models.PositiveIntegerField(default=0)
+    
+    # PART IV: WRAP-UP - per-criterion sums
+    wrapup_demonstrate_sum = models.PositiveIntegerField(default=0)
+    wrapup_synthesize_sum = models.PositiveIntegerField(default=0)
+    
+    # PART V: PROBLEMS MET - per-criterion sums
+    problem_late_sum = models.PositiveIntegerField(default=0)
+    problem_absent_sum = models.PositiveIntegerField(default=0)
+    problem_video_sum = models.PositiveIntegerField(default=0)
+    
+    # Part totals (sum of the criterion sums above)
+    presentation_sum = models.PositiveIntegerField(default=0)
+    development_sum = models.PositiveIntegerField(default=0)
+    student_behavior_sum = models.PositiveIntegerField(default=0)
+    wrapup_sum = models.PositiveIntegerField(default=0)
+    problem_sum = models.PositiveIntegerField(default=0)
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    objects = TeacherRatingRollupQuerySet.as_manager()
+    
+    class Meta:
+        unique_together = ['teacher', 'academic_year', 'semester', 'subject']
+    
+    def __str__(self):
+        return f"{self.teacher} - {self.subject.code} ({self.academic_year.name} {self.semester.name}): {self.evaluation_count} evaluations"
+
+
+# Criteria tracked by RatingAccumulator: the overall and part averages of each
+# evaluation plus every individual item
+ACCUMULATOR_CRITERIA = ('overall',) + tuple(SCORE_PARTS) + RATING_FIELDS + PROBLEM_FIELDS
+ACCUMULATOR_KEY_FIELDS = ('teacher_id', 'academic_year_id', 'semester_id')
+
+# z value of a two-sided 95% confidence interval (normal approximation)
+CONFIDENCE_Z = 1.96
+
+
+def criterion_values(evaluation):
+    """Value of every accumulator criterion for one evaluation"""
+    values = {'overall': sum(getattr(evaluation, name) for name in RATING_FIELDS) / len(RATING_FIELDS)}
+    for part, fields in SCORE_PARTS.items():
+        values[part] = sum(getattr(evaluation, name) for name in fields) / len(fields)
+    for name in RATING_FIELDS + PROBLEM_FIELDS:
+        values[name] = getattr(evaluation, name)
+    return values
+
+
+def criterion_expression(criterion):
+    """Database expression matching criterion_values() for one criterion"""
+    if criterion == 'overall':
+        return score_expression(RATING_FIELDS)
+    if criterion in SCORE_PARTS:
+        return score_expression(SCORE_PARTS[criterion])
+    return Cast(F(criterion), FloatField())
+
+
+def spread_statistics(n, mean, m2):
+    """Mean, sample standard deviation and 95% confidence interval of the mean from (n, mean, M2)"""
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    margin = CONFIDENCE_Z * std / math.sqrt(n) if n else 0.0
+    return {
+        'n': n,
+        'mean': round(mean, 2),
+        'std': round(std, 2),
+        'ci_low': round(mean - margin, 2),
+        'ci_high': round(mean + margin, 2),
+    }
+
+
+class RatingAccumulatorQuerySet(models.QuerySet):
+    """Maintain and read the running (n, mean, M2) accumulators"""
+
+    def record(self, evaluation, sign=1):
+        """
+        Add (sign=1) or remove (sign=-1) one evaluation using Welford's update.
+
+        Touches only the accumulator rows of the evaluation's teacher and
+        period, which are locked for the duration so concurrent submissions
+        apply one after the other. Call inside the transaction that saves or
+        deletes the evaluation.
+        """
+        key = {name: getattr(evaluation, name) for name in ACCUMULATOR_KEY_FIELDS}
+        with transaction.atomic():
+            rows = {row.criterion: row for row in self.select_for_update().filter(**key)}
+            if sign > 0 and len(rows) < len(ACCUMULATOR_CRITERIA):
+                self.bulk_create(
+                    [self.model(criterion=criterion, **key) for criterion in ACCUMULATOR_CRITERIA if criterion not in rows],
+                    ignore_conflicts=True
+                )
+                rows = {row.criterion: row for row in self.select_for_update().filter(**key)}
+            if not rows:
+                return
+
+            for criterion, value in criterion_values(evaluation).items():
+                row = rows.get(criterion)
+                if row is None:
+                    continue
+                if sign > 0:
+                    row.push(value)
+                else:
+                    row.pop(value)
+
+            self.bulk_update([row for row in rows.values() if row.n], ['n', 'mean', 'm2'])
+            self.filter(pk__in=[row.pk for row in rows.values() if not row.n]).delete()
+
+    def rebuild(self, **filters):
+        """
+        Recompute accumulators from Evaluation with one grouped query.
+
+        filters use the key field names (e.g. teacher_id=3) and are applied to
+        both tables. Returns the number of rows written.
+        """
+        aggregates = {'evaluation_count': Count('id')}
+        for criterion in ACCUMULATOR_CRITERIA:
+            expression = criterion_expression(criterion)
+            aggregates[f'{criterion}_mean'] = Avg(expression)
+            aggregates[f'{criterion}_variance'] = Variance(expression)
+
+        rows = (
+            Evaluation.objects.filter(**filters)
+            .order_by()
+            .values(*ACCUMULATOR_KEY_FIELDS)
+            .annotate(**aggregates)
+        )
+        accumulators = []
+        for row in rows:
+            n = row['evaluation_count']
+            key = {name: row[name] for name in ACCUMULATOR_KEY_FIELDS}
+            for criterion in ACCUMULATOR_CRITERIA:
+                accumulators.append(self.model(
+                    criterion=criterion,
+                    n=n,
+                    mean=row[f'{criterion}_mean'],
+                    m2=(row[f'{criterion}_variance'] or 0.0) * n,
+                    **key
+                ))
+
+        self.filter(**filters).delete()
+        return len(self.bulk_create(accumulators, batch_size=500))
+
+    def spread(self):
+        """
+        Combine the accumulators in this queryset per criterion (e.g. across periods).
+
+        Returns {criterion: {n, mean, std, ci_low, ci_high}}; criteria without
+        evaluations are missing.
+        """
+        merged = {}
+        for criterion, n, mean, m2 in self.order_by().values_list('criterion', 'n', 'mean', 'm2'):
+            if criterion not in merged:
+                merged[criterion] = (n, mean, m2)
+                continue
+            # Chan et al. parallel combination of two (n, mean, M2) triples
+            n_a, mean_a, m2_a = merged[criterion]
+            total = n_a + n
+            delta = mean - mean_a
+            merged[criterion] = (
+                total,
+                mean_a + delta * n / total,
+                m2_a + m2 + delta * delta * n_a * n / total,
+            )
+        return {criterion: spread_statistics(*values) for criterion, values in merged.items() if values[0]}
+
+
+class RatingAccumulator(models.Model):
+    """
+    Running count, mean and sum of squared deviations (Welford's M2) of one
+    criterion for a teacher in an academic year and semester.
+
+    Standard deviations and confidence intervals are read from these rows in
+    constant time instead of scanning the evaluations. Kept up to date by the
+    Evaluation signals in signals.py and rebuildable with the
+    rebuild_rating_rollups management command.
+    """
+    teacher = models.ForeignKey(
+        TeacherProfile,
+        on_delete=models.CASCADE,
+        related_name='rating_accumulators'
+    )
+    academic_year = models.ForeignKey(AcademicYear, on_delete=models.CASCADE)
+    semester = models.ForeignKey(Semester, on_delete=models.CASCADE)
+    criterion = models.CharField(max_length=40)
+    
+    n = models.PositiveIntegerField(default=0)
+    mean = models.FloatField(default=0.0)
+    m2 = models.FloatField(default=0.0)
+    
+    objects = RatingAccumulatorQuerySet.as_manager()
+    
+    class Meta:
+        unique_together = ['teacher', 'academic_year', 'semester', 'criterion']
+    
+    def __str__(self):
+        return f"{self.teacher} - {self.criterion} ({self.academic_year.name} {self.semester.name}): n={self.n}"
+    
+    def push(self, value):
+        """Welford update for one new value"""
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+    
+    def pop(self, value):
+        """Inverse Welford update for one removed value"""
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        previous_mean = self.mean
+        self.n -= 1
+        self.mean = (previous_mean * (self.n + 1) - value) / self.n
+        self.m2 = max(self.m2 - (value - self.mean) * (value - previous_mean), 0.0)
+
+
+class ReportJobQuerySet(models.QuerySet):
+    """Queue operations of the PDF report jobs"""
+
+    def claim_next(self):
+        """
+        Mark the oldest pending job running and return it, or None when the
+        queue is empty. Locked rows are skipped, so several workers can poll
+        the same queue without claiming a job twice.
+        """
+        with transaction.atomic():
+            job = self.filter(status=ReportJob.PENDING).order_by('created_at', 'id').select_for_update(
+                skip_locked=True
+            ).first()
+            if job is None:
+                return None
+            job.status = ReportJob.RUNNING
+            job.started_at = timezone.now()
+            job.save(update_fields=['status', 'started_at'])
+        return job
+
+    def requeue_stale(self, started_before):
+        """Put back jobs whose worker died while running them; returns how many"""
+        return self.filter(status=ReportJob.RUNNING, started_at__lt=started_before).update(
+            status=ReportJob.PENDING, started_at=None
+        )
+
+
+class ReportJob(models.Model):
+    """
+    A PDF report requested from views_reports, rendered in the background by
+    the runreportworker management command and downloaded once done.
+    """
+    TEACHER = 'teacher'
+    DEPARTMENT = 'department'
+    EVALUATION = 'evaluation'
+    ALL_TEACHERS = 'all_teachers'
+    STUDENT_EVALUATIONS = 'student_evaluations'
+    KIND_CHOICES = [
+        (TEACHER, 'Teacher Report'),
+        (DEPARTMENT, 'Department Report'),
+        (EVALUATION, 'Evaluation Details'),
+        (ALL_TEACHERS, 'All Teachers Report'),
+        (STUDENT_EVALUATIONS, 'Student Evaluations'),
+    ]
+
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    # id of the teacher, department, evaluation or student the report is about
+    object_id = models.PositiveIntegerField(null=True, blank=True)
+    academic_year = models.ForeignKey(AcademicYear, on_delete=models.CASCADE, null=True, blank=True)
+    semester = models.ForeignKey(Semester, on_delete=models.CASCADE, null=True, blank=True)
+    requested_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='report_jobs')
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    # the PDF lives in the database, where the web process can read what a
+    # worker on another machine rendered; finished jobs are purged after a week
+    content = models.BinaryField(blank=True, editable=False)
+    filename = models.CharField(max_length=255, blank=True)
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ReportJobQuerySet.as_manager()
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='reportjob_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.object_id or '-'} ({self.get_status_display()})"
+
+    @property
+    def is_finished(self):
+        return self.status in (self.DONE, self.FAILED)
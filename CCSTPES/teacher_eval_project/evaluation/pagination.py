@@ -0,0 +1,89 @@
+"""
+Keyset (cursor) pagination
+==========================
+
+Pages through a queryset ordered by a unique list of fields by filtering on
+the last row seen instead of using OFFSET, so every page costs the same no
+matter how deep into the listing it is and rows inserted meanwhile never
+shift the pages. The cursor handed to the client is the ordering values of
+the last row of the page, base64-encoded JSON.
+
+Usage:
+    rows, next_cursor = keyset_page(students, STUDENT_ORDERING, cursor=request.GET.get('cursor'))
+"""
+
+import base64
+import binascii
+import json
+from functools import reduce
+
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def page_size_from(value, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """Page size requested by the client, clamped to 1..maximum"""
+    try:
+        size = int(value)
+    except (TypeError, ValueError):
+        return default
+    return max(1, min(size, maximum))
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor, length):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeError, ValueError):
+        raise InvalidCursor(cursor)
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursor(cursor)
+    return values
+
+
+def keyset_page(queryset, ordering, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+    """
+    One page of queryset in ordering, starting after cursor.
+
+    ordering must end with a unique field; fields prefixed with '-' are
+    descending. Returns (rows, next_cursor); next_cursor is None on the last
+    page. Raises InvalidCursor for a cursor that was not produced by this
+    function for the same ordering.
+    """
+    queryset = queryset.order_by(*ordering)
+    if cursor:
+        queryset = queryset.filter(_after(ordering, decode_cursor(cursor, len(ordering))))
+
+    # one extra row tells whether there is a next page
+    rows = list(queryset[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_cursor([_lookup(rows[-1], field.lstrip('-')) for field in ordering])
+
+
+def _after(ordering, values):
+    # (a, b, c) > (x, y, z)  <=>  a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+    # with < instead of > for descending fields
+    clauses = []
+    for position, field in enumerate(ordering):
+        name = field.lstrip('-')
+        comparison = 'lt' if field.startswith('-') else 'gt'
+        clause = Q(**{f'{name}__{comparison}': values[position]})
+        for previous_field, previous_value in zip(ordering[:position], values[:position]):
+            clause &= Q(**{previous_field.lstrip('-'): previous_value})
+        clauses.append(clause)
+    return reduce(lambda left, right: left | right, clauses)
+
+
+def _lookup(row, field):
+    return reduce(getattr, field.split('__'), row)
@@ -22,6 +22,7 @@ from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics import renderPDF
 from django.db.models import Avg, Count, Q
+from django.utils import timezone
 from datetime import datetime
 
 
@@ -181,30 +182,41 @@ def create_radar_chart(categories_data, title="Performance Overview"):
     return buffer
 
 
-def create_trend_line_chart(weekly_data, title="Rating Trend Over Time"):
+def create_trend_line_chart(trend, title="Rating Trend Over Time", label_format='%b %Y'):
     """
     Create a line chart showing rating trends over time
     
     Args:
-        weekly_data: dict like {'Week 1': 4.2, 'Week 2': 4.3, ...}
+        trend: list from Evaluation.objects.score_trend(); periods without
+            evaluations are left as gaps in the line
     """
     fig, ax = plt.subplots(figsize=(8, 4))
     
-    weeks = list(weekly_data.keys())
-    ratings = list(weekly_data.values())
+    labels = [bucket['period'].strftime(label_format) for bucket in trend]
+    ratings = np.array([
+        bucket['average_rating'] if bucket['evaluation_count'] else np.nan
+        for bucket in trend
+    ], dtype=float)
+    positions = np.arange(len(labels))
     
     # Create line plot
-    ax.plot(weeks, ratings, marker='o', linewidth=2.5, markersize=8, 
+    ax.plot(positions, ratings, marker='o', linewidth=2.5, markersize=8, 
             color='maroon', markerfacecolor='white', markeredgewidth=2,
             markeredgecolor='maroon')
     
     # Fill area under curve
-    ax.fill_between(range(len(weeks)), ratings, alpha=0.2, color='maroon')
+    ax.fill_between(positions, np.nan_to_num(ratings), where=~np.isnan(ratings), alpha=0.2, color='maroon')
     
     # Add value labels on points
-    for i, (week, rating) in enumerate(zip(weeks, ratings)):
-        ax.text(i, rating + 0.1, f'{rating:.2f}', 
-                ha='center', fontsize=10, fontweight='bold')
+    for i, rating in enumerate(ratings):
+        if np.isnan(rating):
+            ax.text(i, 0.2, 'No data', ha='center', fontsize=9, color='grey')
+        else:
+            ax.text(i, rating + 0.1, f'{rating:.2f}', 
+                    ha='center', fontsize=10, fontweight='bold')
+    
+    ax.set_xticks(positions)
+    ax.set_xticklabels(labels)
     
     # Styling
     ax.set_ylim(0, 5.5)
@@ -230,6 +242,60 @@ def create_trend_line_chart(weekly_data, title="Rating Trend Over Time"):
     return buffer
 
 
+def create_benchmark_bar_chart(comparison, title="Benchmark Comparison"):
+    """
+    Create a grouped bar chart of the teacher's category averages next to
+    their department's and the institution's
+    
+    Args:
+        comparison: dict from analytics.cohort_comparison()
+    """
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    
+    categories = [
+        ('Presentation', 'presentation_average'),
+        ('Development', 'development_average'),
+        ('Student Behavior', 'student_behavior_average'),
+        ('Wrap-up', 'wrapup_average'),
+        ('Overall', 'average_rating'),
+    ]
+    cohorts = [
+        ('Teacher', 'teacher', '#8B0000'),
+        ('Department', 'department', '#6C757D'),
+        ('Institution', 'institution', '#DAA520'),
+    ]
+    positions = np.arange(len(categories))
+    width = 0.26
+    
+    for offset, (label, cohort, color) in enumerate(cohorts):
+        values = [comparison[cohort][key] for _, key in categories]
+        bars = ax.bar(positions + (offset - 1) * width, values, width, label=label, color=color)
+        for bar, value in zip(bars, values):
+            ax.text(bar.get_x() + bar.get_width() / 2, value + 0.05, f'{value:.2f}',
+                    ha='center', fontsize=7)
+    
+    # Styling
+    ax.set_xticks(positions)
+    ax.set_xticklabels([label for label, _ in categories])
+    ax.set_ylim(0, 5.5)
+    ax.set_ylabel('Average Rating', fontsize=11, fontweight='bold')
+    ax.set_title(title, fontsize=13, fontweight='bold', pad=15)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(axis='y', alpha=0.3, linestyle='--')
+    ax.legend(loc='upper right', ncol=3, fontsize=9)
+    
+    plt.tight_layout()
+    
+    # Save to buffer
+    buffer = BytesIO()
+    plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+    plt.close()
+    buffer.seek(0)
+    
+    return buffer
+
+
 def create_pie_chart(data_dict, title="Distribution"):
     """
     Create a professional pie chart
@@ -269,12 +335,13 @@ def create_pie_chart(data_dict, title="Distribution"):
     return buffer
 
 
-def create_problems_heatmap(problems_data):
+def create_problems_heatmap(distribution):
     """
     Create a heatmap showing problem severity distribution
     
     Args:
-        problems_data: dict with problem counts
+        distribution: dict of problem item -> [not serious, serious, very serious]
+            counts, the histograms of ScoreMatrix.summary()
     """
     fig, ax = plt.subplots(figsize=(8, 4))
     
@@ -284,15 +351,9 @@ def create_problems_heatmap(problems_data):
     
     # Data matrix
     data = np.array([
-        [problems_data.get('late_not_serious', 0), 
-         problems_data.get('late_serious', 0), 
-         problems_data.get('late_very_serious', 0)],
-        [problems_data.get('absent_not_serious', 0), 
-         problems_data.get('absent_serious', 0), 
-         problems_data.get('absent_very_serious', 0)],
-        [problems_data.get('video_not_serious', 0), 
-         problems_data.get('video_serious', 0), 
-         problems_data.get('video_very_serious', 0)]
+        distribution.get('problem_late', [0, 0, 0]),
+        distribution.get('problem_absent', [0, 0, 0]),
+        distribution.get('problem_video', [0, 0, 0]),
     ])
     
     # Create heatmap
@@ -497,7 +558,9 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     Returns:
         BytesIO buffer containing the PDF
     """
-    from .models import Evaluation
+    from .models import Evaluation, TeacherRatingRollup
+    from .analytics import cohort_comparison
+    from .score_matrix import ScoreMatrix
     
     buffer = BytesIO()
     doc = SimpleDocTemplate(
@@ -553,16 +616,21 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     elements.append(Spacer(1, 0.3*inch))
     
     # ========== GET EVALUATION DATA ==========
-    evaluations = Evaluation.objects.filter(teacher=teacher).select_related(
-        'student', 'student__user', 'subject', 'academic_year', 'semester'
-    )
+    evaluations = Evaluation.objects.filter(teacher=teacher)
     
     if academic_year:
         evaluations = evaluations.filter(academic_year=academic_year)
     if semester:
         evaluations = evaluations.filter(semester=semester)
     
-    total_evaluations = evaluations.count()
+    # Calculate statistics from the rating rollups
+    rollups = TeacherRatingRollup.objects.filter(teacher=teacher)
+    if academic_year:
+        rollups = rollups.filter(academic_year=academic_year)
+    if semester:
+        rollups = rollups.filter(semester=semester)
+    summary = rollups.summary()
+    total_evaluations = summary['evaluation_count']
     
     if total_evaluations == 0:
         elements.append(Paragraph(
@@ -573,12 +641,19 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
         buffer.seek(0)
         return buffer
     
-    # Calculate statistics
-    average_rating = sum([e.get_average_rating() for e in evaluations]) / total_evaluations
-    presentation_avg = sum([e.get_presentation_average() for e in evaluations]) / total_evaluations
-    development_avg = sum([e.get_development_average() for e in evaluations]) / total_evaluations
-    student_behavior_avg = sum([e.get_student_behavior_average() for e in evaluations]) / total_evaluations
-    wrapup_avg = sum([e.get_wrapup_average() for e in evaluations]) / total_evaluations
+    # Spread and confidence from the running accumulators (no extra pass over evaluations)
+    accumulators = teacher.rating_accumulators.all()
+    if academic_year:
+        accumulators = accumulators.filter(academic_year=academic_year)
+    if semester:
+        accumulators = accumulators.filter(semester=semester)
+    spread = accumulators.spread()
+    
+    average_rating = summary['average_rating']
+    presentation_avg = summary['presentation_average']
+    development_avg = summary['development_average']
+    student_behavior_avg = summary['student_behavior_average']
+    wrapup_avg = summary['wrapup_average']
     
     # ========== OVERALL RATING WITH GAUGE CHART ==========
     elements.append(Paragraph("Overall Performance", styles['SectionHeader']))
@@ -611,6 +686,15 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     ]))
     
     elements.append(summary_table)
+    
+    overall_spread = spread.get('overall')
+    if overall_spread:
+        elements.append(Spacer(1, 0.15*inch))
+        elements.append(Paragraph(
+            f"Standard deviation: {overall_spread['std']:.2f} &nbsp;&nbsp;|&nbsp;&nbsp; "
+            f"95% confidence interval of the mean: {overall_spread['ci_low']:.2f} - {overall_spread['ci_high']:.2f}",
+            styles['InfoText']
+        ))
     elements.append(Spacer(1, 0.3*inch))
     
     # ========== CATEGORY BREAKDOWN WITH BAR CHART ==========
@@ -631,15 +715,21 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     elements.append(Spacer(1, 0.2*inch))
     
     # Category details table
-    category_table_data = [
-        ['Category', 'Average Score', 'Descriptor'],
-        ['Presentation', f'{presentation_avg:.2f}', get_rating_descriptor(presentation_avg)],
-        ['Development', f'{development_avg:.2f}', get_rating_descriptor(development_avg)],
-        ['Student Behavior', f'{student_behavior_avg:.2f}', get_rating_descriptor(student_behavior_avg)],
-        ['Wrap-up', f'{wrapup_avg:.2f}', get_rating_descriptor(wrapup_avg)],
-    ]
+    category_table_data = [['Category', 'Average Score', 'Std Dev', '95% CI', 'Descriptor']]
+    for label, part, avg in (('Presentation', 'presentation', presentation_avg),
+                             ('Development', 'development', development_avg),
+                             ('Student Behavior', 'student_behavior', student_behavior_avg),
+                             ('Wrap-up', 'wrapup', wrapup_avg)):
+        part_spread = spread.get(part)
+        category_table_data.append([
+            label,
+            f'{avg:.2f}',
+            f"{part_spread['std']:.2f}" if part_spread else '-',
+            f"{part_spread['ci_low']:.2f} - {part_spread['ci_high']:.2f}" if part_spread else '-',
+            get_rating_descriptor(avg)
+        ])
     
-    category_table = Table(category_table_data, colWidths=[2.5*inch, 2*inch, 2*inch])
+    category_table = Table(category_table_data, colWidths=[1.7*inch, 1.2*inch, 1*inch, 1.3*inch, 1.3*inch])
     category_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B0000')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -657,6 +747,16 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     elements.append(category_table)
     elements.append(Spacer(1, 0.3*inch))
     
+    # ========== BENCHMARK COMPARISON ==========
+    elements.append(PageBreak())
+    elements.append(Paragraph("Department and Institution Benchmark", styles['SectionHeader']))
+    
+    comparison = cohort_comparison(teacher, academic_year, semester)
+    benchmark_buffer = create_benchmark_bar_chart(comparison)
+    benchmark_img = Image(benchmark_buffer, width=6.5*inch, height=3.7*inch)
+    elements.append(benchmark_img)
+    elements.append(Spacer(1, 0.3*inch))
+    
     # ========== RADAR CHART ==========
     elements.append(PageBreak())
     elements.append(Paragraph("Multi-Dimensional Performance View", styles['SectionHeader']))
@@ -666,35 +766,76 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     elements.append(radar_img)
     elements.append(Spacer(1, 0.3*inch))
     
+    # ========== RATING TREND ==========
+    latest = evaluations.order_by('-created_at').values_list('created_at', flat=True).first()
+    if latest:
+        elements.append(PageBreak())
+        elements.append(Paragraph("Rating Trend", styles['SectionHeader']))
+        
+        # Six months ending with the most recent evaluation in the report period
+        trend = evaluations.score_trend('month', 6, today=timezone.localtime(latest).date())
+        trend_buffer = create_trend_line_chart(trend, title="Monthly Average Rating")
+        trend_img = Image(trend_buffer, width=6.5*inch, height=3.25*inch)
+        elements.append(trend_img)
+        elements.append(Spacer(1, 0.3*inch))
+    
+    # ========== SEMESTER HISTORY ==========
+    # Every semester the teacher was evaluated in, regardless of the report filter
+    history = Evaluation.objects.filter(teacher=teacher).period_history()
+    if history:
+        elements.append(Paragraph("Semester History", styles['SectionHeader']))
+        
+        history_table_data = [['Academic Year', 'Semester', 'Evaluations', 'Average Rating', 'Performance']]
+        for period in history:
+            history_table_data.append([
+                period['academic_year__name'],
+                period['semester__name'],
+                str(period['evaluation_count']),
+                f"{period['average_rating']:.2f}",
+                get_rating_descriptor(period['average_rating'])
+            ])
+        
+        history_table = Table(history_table_data, colWidths=[1.4*inch, 1.5*inch, 1.2*inch, 1.3*inch, 1.5*inch])
+        history_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B0000')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#FFF5F5')]),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]))
+        
+        elements.append(history_table)
+        elements.append(Spacer(1, 0.3*inch))
+    
     # ========== PERFORMANCE BY SUBJECT ==========
     elements.append(PageBreak())
     elements.append(Paragraph("Performance by Subject", styles['SectionHeader']))
     
-    # Group by subject
-    subjects_dict = {}
-    for eval in evaluations:
-        subject_code = eval.subject.code
-        if subject_code not in subjects_dict:
-            subjects_dict[subject_code] = {
-                'name': eval.subject.name,
-                'evaluations': []
-            }
-        subjects_dict[subject_code]['evaluations'].append(eval)
-    
-    subject_table_data = [['Subject Code', 'Subject Name', 'Evaluations', 'Average Rating', 'Performance']]
-    
-    for code, data in sorted(subjects_dict.items()):
-        evals = data['evaluations']
-        avg = sum([e.get_average_rating() for e in evals]) / len(evals)
+    subject_table_data = [['Subject Code', 'Subject Name', 'Evaluations', 'Average Rating', 'Std. Dev.', 'Performance']]
+    
+    # One matrix of the criterion scores feeds the subject table and the problem counts
+    matrix = ScoreMatrix.from_queryset(evaluations, group_by=('subject__code', 'subject__name'))
+    for (code, name), subject_stats in matrix.summary_by().items():
+        avg = subject_stats['average_rating']
         subject_table_data.append([
             code,
-            data['name'],
-            str(len(evals)),
+            name,
+            str(subject_stats['evaluation_count']),
             f'{avg:.2f}',
+            f"{subject_stats['rating_std']:.2f}",
             get_rating_descriptor(avg)
         ])
     
-    subject_table = Table(subject_table_data, colWidths=[1.3*inch, 2.2*inch, 1.2*inch, 1.3*inch, 1.5*inch])
+    subject_table = Table(
+        subject_table_data, colWidths=[1.1*inch, 2.0*inch, 1.0*inch, 1.1*inch, 0.9*inch, 1.4*inch]
+    )
     subject_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B0000')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -717,48 +858,21 @@ def generate_teacher_evaluation_report(teacher, academic_year=None, semester=Non
     elements.append(PageBreak())
     elements.append(Paragraph("Problems Identified", styles['SectionHeader']))
     
-    # Collect problem data
-    late_issues = [e.problem_late for e in evaluations]
-    absent_issues = [e.problem_absent for e in evaluations]
-    video_issues = [e.problem_video for e in evaluations]
-    
-    problems_data = {
-        'late_not_serious': late_issues.count(1),
-        'late_serious': late_issues.count(2),
-        'late_very_serious': late_issues.count(3),
-        'absent_not_serious': absent_issues.count(1),
-        'absent_serious': absent_issues.count(2),
-        'absent_very_serious': absent_issues.count(3),
-        'video_not_serious': video_issues.count(1),
-        'video_serious': video_issues.count(2),
-        'video_very_serious': video_issues.count(3),
-    }
+    distribution = matrix.summary()['histograms']
     
     # Heatmap
-    heatmap_buffer = create_problems_heatmap(problems_data)
+    heatmap_buffer = create_problems_heatmap(distribution)
     heatmap_img = Image(heatmap_buffer, width=6.5*inch, height=3.5*inch)
     elements.append(heatmap_img)
     elements.append(Spacer(1, 0.3*inch))
     
     # Problem summary
-    problem_summary_data = [
-        ['Problem Type', 'Not Serious', 'Serious', 'Very Serious', 'Total'],
-        ['Late to Class', 
-         str(problems_data['late_not_serious']),
-         str(problems_data['late_serious']),
-         str(problems_data['late_very_serious']),
-         str(sum([problems_data['late_not_serious'], problems_data['late_serious'], problems_data['late_very_serious']]))],
-        ['Absenteeism',
-         str(problems_data['absent_not_serious']),
-         str(problems_data['absent_serious']),
-         str(problems_data['absent_very_serious']),
-         str(sum([problems_data['absent_not_serious'], problems_data['absent_serious'], problems_data['absent_very_serious']]))],
-        ['Long Videos (>30min)',
-         str(problems_data['video_not_serious']),
-         str(problems_data['video_serious']),
-         str(problems_data['video_very_serious']),
-         str(sum([problems_data['video_not_serious'], problems_data['video_serious'], problems_data['video_very_serious']]))],
-    ]
+    problem_summary_data = [['Problem Type', 'Not Serious', 'Serious', 'Very Serious', 'Total']]
+    for label, field in (('Late to Class', 'problem_late'),
+                         ('Absenteeism', 'problem_absent'),
+                         ('Long Videos (>30min)', 'problem_video')):
+        counts = distribution[field]
+        problem_summary_data.append([label] + [str(count) for count in counts] + [str(sum(counts))])
     
     problem_table = Table(problem_summary_data, colWidths=[2*inch, 1.3*inch, 1.3*inch, 1.3*inch, 1.3*inch])
     problem_table.setStyle(TableStyle([
@@ -819,7 +933,8 @@ def generate_department_report(department, academic_year=None, semester=None):
     Returns:
         BytesIO buffer containing the PDF
     """
-    from .models import TeacherProfile, Evaluation
+    from .models import TeacherProfile
+    from .analytics import teacher_rankings
     
     buffer = BytesIO()
     doc = SimpleDocTemplate(
@@ -883,24 +998,18 @@ def generate_department_report(department, academic_year=None, semester=None):
         return buffer
     
     # ========== DEPARTMENT STATISTICS ==========
-    teacher_stats = []
-    
-    for teacher in teachers:
-        evaluations = Evaluation.objects.filter(teacher=teacher)
-        
-        if academic_year:
-            evaluations = evaluations.filter(academic_year=academic_year)
-        if semester:
-            evaluations = evaluations.filter(semester=semester)
-        
-        eval_count = evaluations.count()
-        if eval_count > 0:
-            avg_rating = sum([e.get_average_rating() for e in evaluations]) / eval_count
-            teacher_stats.append({
-                'teacher': teacher,
-                'avg_rating': avg_rating,
-                'eval_count': eval_count
-            })
+    # One windowed query ranks every evaluated teacher in the department
+    teachers_by_id = teachers.select_related('user').in_bulk()
+    teacher_stats = [
+        {
+            'teacher': teachers_by_id[row['teacher']],
+            'avg_rating': row['average_rating'],
+            'eval_count': row['evaluation_count'],
+            'rank': row['department_rank'],
+            'percentile': row['department_percentile'],
+        }
+        for row in teacher_rankings(academic_year, semester, department=department)
+    ]
     
     if not teacher_stats:
         elements.append(Paragraph("No evaluation data available for this period.", styles['InfoText']))
@@ -908,9 +1017,6 @@ def generate_department_report(department, academic_year=None, semester=None):
         buffer.seek(0)
         return buffer
     
-    # Sort by rating
-    teacher_stats.sort(key=lambda x: x['avg_rating'], reverse=True)
-    
     # Calculate department average
     dept_avg = sum([t['avg_rating'] for t in teacher_stats]) / len(teacher_stats)
     
@@ -961,20 +1067,21 @@ def generate_department_report(department, academic_year=None, semester=None):
     # ========== TEACHER RANKINGS TABLE ==========
     elements.append(Paragraph("Complete Teacher Rankings", styles['SectionHeader']))
     
-    ranking_data = [['Rank', 'Teacher Name', 'Employee ID', 'Evaluations', 'Avg Rating', 'Performance']]
+    ranking_data = [['Rank', 'Teacher Name', 'Employee ID', 'Evaluations', 'Avg Rating', 'Percentile', 'Performance']]
     
-    for idx, stat in enumerate(teacher_stats, 1):
+    for stat in teacher_stats:
         teacher = stat['teacher']
         ranking_data.append([
-            str(idx),
+            str(stat['rank']),
             teacher.user.get_full_name(),
             teacher.employee_id,
             str(stat['eval_count']),
             f"{stat['avg_rating']:.2f}",
+            f"{stat['percentile']:.0f}",
             get_rating_descriptor(stat['avg_rating'])
         ])
     
-    ranking_table = Table(ranking_data, colWidths=[0.6*inch, 2*inch, 1.2*inch, 1*inch, 1*inch, 1.5*inch])
+    ranking_table = Table(ranking_data, colWidths=[0.5*inch, 1.8*inch, 1*inch, 0.9*inch, 0.9*inch, 0.9*inch, 1.3*inch])
     ranking_table.setStyle(TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#8B0000')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -1378,4 +1485,98 @@ def generate_detailed_evaluation_report(evaluation):
     doc.build(elements)
     buffer.seek(0)
     
-    return buffer
\ No newline at end of file
+    return buffer
+
+
+def generate_student_evaluations_report(student, evaluations):
+    """
+    Generate PDF summary of the evaluations a student submitted
+    
+    Args:
+        student: StudentProfile instance
+        evaluations: the student's evaluations, with teacher users, subjects and periods selected
+    
+    Returns:
+        BytesIO buffer containing the PDF
+    """
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    
+    elements = []
+    styles = get_custom_styles()
+    
+    # Header
+    elements.append(create_header_table(
+        "Student Evaluation Summary",
+        f"{student.user.get_full_name()}"
+    ))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Student info
+    student_info_data = [
+        ['Student ID:', student.student_id_number],
+        ['Name:', student.user.get_full_name()],
+        ['Department:', str(student.department)],
+        ['Year Level:', student.get_year_level_display()],
+        ['Course:', student.course],
+        ['Total Evaluations:', str(evaluations.count())],
+        ['Report Generated:', datetime.now().strftime("%B %d, %Y at %I:%M %p")],
+    ]
+    
+    student_info_table = Table(student_info_data, colWidths=[2*inch, 4.5*inch])
+    student_info_table.setStyle(TableStyle([
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1a237e')),
+        ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+        ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    
+    elements.append(student_info_table)
+    elements.append(Spacer(1, 0.3*inch))
+    
+    # Evaluations list
+    elements.append(Paragraph("Submitted Evaluations", styles['SectionHeader']))
+    
+    if evaluations.exists():
+        eval_data = [
+            ['Date', 'Teacher', 'Subject', 'Rating', 'Academic Year', 'Semester'],
+        ]
+        
+        for evaluation in evaluations:
+            eval_data.append([
+                evaluation.created_at.strftime("%m/%d/%Y"),
+                evaluation.teacher.user.get_full_name(),
+                evaluation.subject.code,
+                f"{evaluation.get_average_rating():.2f}",
+                str(evaluation.academic_year.name),
+                str(evaluation.semester.name),
+            ])
+        
+        eval_table = Table(eval_data, colWidths=[1*inch, 1.8*inch, 1*inch, 0.8*inch, 1.2*inch, 1*inch])
+        eval_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3f51b5')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+        ]))
+        
+        elements.append(eval_table)
+    else:
+        elements.append(Paragraph("No evaluations submitted yet.", styles['InfoText']))
+    
+    # Build PDF
+    doc.build(elements)
+    
+    buffer.seek(0)
+    
+    return buffer
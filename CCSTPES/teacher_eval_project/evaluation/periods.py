@@ -0,0 +1,50 @@
+"""
+The active academic year and the open evaluation settings, which the
+dashboards, the evaluation form and the live stats all look up on every
+request. They change a few times a year, so the lookup is cached under a
+version counter (see cache_versions.py) that signals.py bumps whenever an
+AcademicYear, Semester or EvaluationSettings is saved or deleted.
+"""
+
+from django.core.cache import cache
+
+from .cache_versions import bump_version, versioned_key
+from .models import AcademicYear, EvaluationSettings
+
+CURRENT_PERIOD_TIMEOUT = 60 * 60
+CURRENT_PERIOD_VERSION_KEY = 'current_period_version'
+
+
+def invalidate_current_period():
+    bump_version(CURRENT_PERIOD_VERSION_KEY)
+
+
+def current_period():
+    """
+    Cached current period.
+
+    academic_year is the active academic year, settings its open evaluation
+    settings (None when closed) and semester the semester of those settings.
+    open_settings is the first open settings of any academic year.
+    """
+    key = versioned_key('current_period', [CURRENT_PERIOD_VERSION_KEY])
+    period = cache.get(key)
+    if period is None:
+        period = _load_current_period()
+        cache.set(key, period, CURRENT_PERIOD_TIMEOUT)
+    return period
+
+
+def _load_current_period():
+    academic_year = AcademicYear.objects.filter(is_active=True).first()
+    open_settings = list(EvaluationSettings.objects.filter(is_open=True).select_related('academic_year', 'semester'))
+    settings = next(
+        (item for item in open_settings if academic_year and item.academic_year_id == academic_year.pk), None
+    )
+    return {
+        'academic_year': academic_year,
+        'semester': settings.semester if settings else None,
+        'settings': settings,
+        'is_open': settings is not None,
+        'open_settings': open_settings[0] if open_settings else None,
+    }
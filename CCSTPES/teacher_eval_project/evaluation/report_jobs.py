@@ -0,0 +1,132 @@
+"""
+Background PDF reports
+======================
+
+The report downloads of views_reports render matplotlib charts and a
+ReportLab layout, which takes seconds per department report. Rendering them
+in the request held a web worker for that long, and the burst of reports at
+semester end starved everyone else. The views now only queue a ReportJob;
+the runreportworker management command renders queued jobs and stores the
+PDF on the job row, and the browser polls the job until it can download it.
+Keeping the PDF in the database lets the worker run as a separate service
+that shares no filesystem with the web process.
+
+Usage:
+    job = enqueue_report(request.user, ReportJob.TEACHER, teacher.pk, academic_year, semester)
+
+    # in the worker
+    job = ReportJob.objects.claim_next()
+    if job:
+        run_job(job)
+"""
+
+import logging
+
+from django.utils import timezone
+
+from .models import Department, Evaluation, ReportJob, StudentProfile, TeacherProfile
+from .pdf_reports import (
+    generate_department_report,
+    generate_detailed_evaluation_report,
+    generate_student_evaluations_report,
+    generate_teacher_evaluation_report,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _period_suffix(job):
+    suffix = ''
+    if job.academic_year:
+        suffix += f"_{job.academic_year.name}"
+    if job.semester:
+        suffix += f"_{job.semester.name}"
+    return suffix
+
+
+def _build_teacher_report(job):
+    teacher = TeacherProfile.objects.select_related('user', 'department').get(pk=job.object_id)
+    buffer = generate_teacher_evaluation_report(teacher, job.academic_year, job.semester)
+    return buffer, f"teacher_evaluation_{teacher.employee_id}{_period_suffix(job)}.pdf"
+
+
+def _build_department_report(job):
+    department = Department.objects.get(pk=job.object_id)
+    buffer = generate_department_report(department, job.academic_year, job.semester)
+    return buffer, f"department_evaluation_{department.code}{_period_suffix(job)}.pdf"
+
+
+def _build_evaluation_report(job):
+    evaluation = Evaluation.objects.select_related(
+        'teacher__user', 'student__user', 'subject', 'academic_year', 'semester'
+    ).get(pk=job.object_id)
+    buffer = generate_detailed_evaluation_report(evaluation)
+    filename = (
+        f"evaluation_detail_{evaluation.teacher.employee_id}_{evaluation.subject.code}_"
+        f"{evaluation.student.student_id_number}.pdf"
+    )
+    return buffer, filename
+
+
+def _build_all_teachers_report(job):
+    # Like the synchronous download this was, the report covers the first department only
+    department = Department.objects.first()
+    if department is None:
+        raise ValueError('There are no departments to report on.')
+    buffer = generate_department_report(department, job.academic_year, job.semester)
+    return buffer, f"all_teachers_evaluation{_period_suffix(job)}.pdf"
+
+
+def _build_student_evaluations_report(job):
+    student = StudentProfile.objects.select_related('user', 'department').get(pk=job.object_id)
+    evaluations = Evaluation.objects.filter(student=student).select_related(
+        'teacher', 'teacher__user', 'subject', 'academic_year', 'semester'
+    )
+    buffer = generate_student_evaluations_report(student, evaluations)
+    return buffer, f"student_evaluations_{student.student_id_number}.pdf"
+
+
+REPORT_BUILDERS = {
+    ReportJob.TEACHER: _build_teacher_report,
+    ReportJob.DEPARTMENT: _build_department_report,
+    ReportJob.EVALUATION: _build_evaluation_report,
+    ReportJob.ALL_TEACHERS: _build_all_teachers_report,
+    ReportJob.STUDENT_EVALUATIONS: _build_student_evaluations_report,
+}
+
+
+def enqueue_report(user, kind, object_id=None, academic_year=None, semester=None):
+    """
+    Queue a report for user, or return their job for the same report that is
+    still pending or running (double clicks and reloads queue nothing new).
+    """
+    request = {
+        'kind': kind,
+        'object_id': object_id,
+        'academic_year': academic_year,
+        'semester': semester,
+        'requested_by': user,
+    }
+    job = ReportJob.objects.filter(status__in=[ReportJob.PENDING, ReportJob.RUNNING], **request).first()
+    if job is None:
+        job = ReportJob.objects.create(**request)
+    return job
+
+
+def run_job(job):
+    """Render a claimed job and store the PDF, or record why it failed"""
+    try:
+        buffer, filename = REPORT_BUILDERS[job.kind](job)
+        job.content = buffer.getvalue()
+        job.filename = filename
+        job.status = ReportJob.DONE
+        job.finished_at = timezone.now()
+        job.save(update_fields=['content', 'filename', 'status', 'finished_at'])
+    except Exception as e:
+        logger.exception('Report job %s failed', job.pk)
+        job.content = b''
+        job.status = ReportJob.FAILED
+        job.error = str(e) or e.__class__.__name__
+        job.finished_at = timezone.now()
+        job.save(update_fields=['content', 'status', 'error', 'finished_at'])
+    return job
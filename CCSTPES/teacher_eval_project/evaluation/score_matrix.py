@@ -0,0 +1,114 @@
+"""
+Evaluation statistics computed from one matrix of criterion scores.
+
+ScoreMatrix.from_queryset() loads the criterion columns of an Evaluation
+queryset with a single values_list() query into an int8 matrix (one row per
+evaluation, one column per rated or problem item). summary() and
+summary_by() then compute, in one vectorized pass, the overall and part
+averages, the sample standard deviation of the overall rating, the per-item
+means and standard deviations and the 1-5 (1-3 for problems) histograms of
+every item, overall or per group key.
+"""
+
+import numpy as np
+
+from .models import PROBLEM_FIELDS, PROBLEM_SCALE, RATING_FIELDS, RATING_SCALE, SCORE_PARTS
+
+
+CRITERION_FIELDS = RATING_FIELDS + PROBLEM_FIELDS
+
+# Column positions of each part inside the matrix
+_PART_COLUMNS = {
+    part: [CRITERION_FIELDS.index(name) for name in fields]
+    for part, fields in SCORE_PARTS.items()
+}
+_RATING_COLUMNS = [CRITERION_FIELDS.index(name) for name in RATING_FIELDS]
+
+
+class ScoreMatrix:
+    """Criterion scores of many evaluations, optionally labelled with a group key per row"""
+
+    def __init__(self, scores, keys=None):
+        self.scores = scores
+        self.keys = keys if keys is not None else [()] * len(scores)
+
+    @classmethod
+    def from_queryset(cls, queryset, group_by=()):
+        """Build the matrix with one query; group_by fields are fetched alongside the scores"""
+        group_by = tuple(group_by)
+        rows = list(queryset.order_by().values_list(*group_by, *CRITERION_FIELDS))
+
+        width = len(group_by)
+        scores = np.array([row[width:] for row in rows], dtype=np.int8).reshape(len(rows), len(CRITERION_FIELDS))
+        keys = [row[:width] for row in rows]
+        return cls(scores, keys)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def summary(self):
+        """Statistics over every row"""
+        return self._summarize(np.zeros(len(self), dtype=np.intp), 1)[0]
+
+    def summary_by(self):
+        """Statistics per group key, computed for all groups in one vectorized pass"""
+        labels = {}
+        inverse = np.fromiter(
+            (labels.setdefault(key, len(labels)) for key in self.keys),
+            dtype=np.intp,
+            count=len(self.keys)
+        )
+        stats = self._summarize(inverse, len(labels))
+        return {key: stats[index] for key, index in sorted(labels.items())}
+
+    def _summarize(self, inverse, group_count):
+        values = self.scores.astype(np.float64)
+        # overall rating of every row, the same value as Evaluation.get_average_rating()
+        ratings = values[:, _RATING_COLUMNS].mean(axis=1)
+
+        counts = np.bincount(inverse, minlength=group_count)
+        sums = np.zeros((group_count, len(CRITERION_FIELDS)))
+        np.add.at(sums, inverse, values)
+        rating_sums = np.bincount(inverse, weights=ratings, minlength=group_count)
+
+        denominator = np.maximum(counts, 1)
+        means = sums / denominator[:, None]
+        rating_means = rating_sums / denominator
+
+        # sample standard deviations (ddof=1), like the rating accumulators
+        item_squares = np.zeros_like(sums)
+        np.add.at(item_squares, inverse, (values - means[inverse]) ** 2)
+        item_stds = np.sqrt(item_squares / np.maximum(counts - 1, 1)[:, None])
+        deviations = ratings - rating_means[inverse]
+        squares = np.bincount(inverse, weights=deviations * deviations, minlength=group_count)
+        rating_stds = np.sqrt(squares / np.maximum(counts - 1, 1))
+
+        # histograms[g, c, v - 1] = number of rows in group g with value v in column c
+        histograms = np.zeros((group_count, len(CRITERION_FIELDS), RATING_SCALE), dtype=np.int64)
+        np.add.at(histograms, inverse, self.scores[:, :, None] == np.arange(1, RATING_SCALE + 1))
+
+        results = []
+        for group in range(group_count):
+            count = int(counts[group])
+            result = {
+                'evaluation_count': count,
+                'average_rating': _round(rating_means[group]) if count else 0,
+                'rating_std': _round(rating_stds[group]) if count > 1 else 0,
+                'item_means': {},
+                'item_stds': {},
+                'histograms': {},
+            }
+            for part, part_columns in _PART_COLUMNS.items():
+                result[f'{part}_average'] = _round(means[group, part_columns].mean()) if count else 0
+
+            for column, name in enumerate(CRITERION_FIELDS):
+                scale = PROBLEM_SCALE if name in PROBLEM_FIELDS else RATING_SCALE
+                result['item_means'][name] = _round(means[group, column]) if count else 0
+                result['item_stds'][name] = _round(item_stds[group, column]) if count > 1 else 0
+                result['histograms'][name] = histograms[group, column, :scale].tolist()
+            results.append(result)
+        return results
+
+
+def _round(value):
+    return round(float(value), 2)
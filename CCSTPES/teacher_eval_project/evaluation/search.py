@@ -0,0 +1,115 @@
+"""
+Student search over StudentProfile.search_text (names, username, email,
+student number and course, lowercased).
+
+A student matches when every word of the query is a substring of their
+search_text, on every database, like the icontains filter this replaced.
+The index behind it depends on the database:
+- PostgreSQL: a pg_trgm GIN index serves the substring matches; results
+  are ranked by tsvector prefix matches plus trigram word similarity
+- SQLite: an FTS5 table with the trigram tokenizer, kept in sync by
+  triggers and ranked by bm25(); words shorter than three characters,
+  which have no trigram, are matched with a plain substring filter
+- anything else: a plain substring match
+
+Matches are annotated with an integer search_rank (higher is better) so
+callers can order and keyset-paginate on (-search_rank, id), e.g.
+search_students(students, 'dela cruz').order_by('-search_rank', 'user_id').
+The indexes and the FTS5 table are created by migration 0012.
+"""
+
+from django.db import connection
+from django.db.models import FloatField, IntegerField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+
+from .models import StudentProfile
+
+FTS_TABLE = f'{StudentProfile._meta.db_table}_fts'
+
+# search_rank is a similarity score scaled to an integer so it round-trips
+# exactly through a pagination cursor
+RANK_SCALE = 1000
+
+
+_trigram_support = {}
+
+
+def has_trigram_support():
+    """
+    Whether pg_trgm is installed in the current PostgreSQL database (checked
+    once). Migration 0012 installs it wherever the server ships it.
+    """
+    name = connection.settings_dict['NAME']
+    if name not in _trigram_support:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            _trigram_support[name] = cursor.fetchone() is not None
+    return _trigram_support[name]
+
+
+def normalize_query(query):
+    return ' '.join(query.lower().split())
+
+
+def search_students(queryset, query):
+    """Students of queryset matching query, annotated with search_rank"""
+    terms = normalize_query(query)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0, output_field=IntegerField()))
+    if connection.vendor == 'postgresql':
+        return _postgres_search(queryset, terms)
+    if connection.vendor == 'sqlite':
+        return _sqlite_search(queryset, terms)
+    return queryset.filter(_substring_matches(terms.split())).annotate(
+        search_rank=Value(0, output_field=IntegerField())
+    )
+
+
+def _substring_matches(words):
+    return Q(*[Q(search_text__contains=word) for word in words])
+
+
+def _postgres_search(queryset, terms):
+    # django.contrib.postgres imports psycopg, so only load it on PostgreSQL
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramWordSimilarity
+
+    # every word as a quoted prefix lexeme: 'dela':* & 'cruz':*
+    prefixes = ' & '.join(
+        "'{}':*".format(word.replace('\\', '\\\\').replace("'", "''")) for word in terms.split()
+    )
+    document = SearchVector('search_text', config='simple')
+    text_query = SearchQuery(prefixes, config='simple', search_type='raw')
+    score = SearchRank(document, text_query)
+    if has_trigram_support():
+        # only the ranking uses pg_trgm functions; which students match
+        # never depends on the extension
+        score = score + TrigramWordSimilarity(terms, 'search_text')
+
+    return queryset.filter(_substring_matches(terms.split())).annotate(
+        search_rank=Cast(score * Value(float(RANK_SCALE), output_field=FloatField()), IntegerField())
+    )
+
+
+def _sqlite_search(queryset, terms):
+    words = terms.split()
+    # the trigram tokenizer matches quoted strings of three or more
+    # characters anywhere in the text: "dela" "cruz"
+    indexed = [word for word in words if len(word) >= 3]
+    short = [word for word in words if len(word) < 3]
+
+    queryset = queryset.filter(_substring_matches(short))
+    if not indexed:
+        return queryset.annotate(search_rank=Value(0, output_field=IntegerField()))
+
+    match = ' '.join('"{}"'.format(word.replace('"', '""')) for word in indexed)
+    table = StudentProfile._meta.db_table
+    matches = RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match])
+    # bm25() is lower for better matches
+    rank = RawSQL(
+        f'SELECT CAST(-bm25({FTS_TABLE}) * {RANK_SCALE} AS INTEGER) FROM {FTS_TABLE} '
+        f'WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id',
+        [match],
+        output_field=IntegerField()
+    )
+    return queryset.filter(id__in=matches).annotate(search_rank=rank)
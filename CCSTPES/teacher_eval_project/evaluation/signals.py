@@ -0,0 +1,209 @@
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+from .models import (
+    AcademicYear, Department, Evaluation, EvaluationSettings, TeacherRatingRollup, RatingAccumulator, Semester,
+    StudentProfile, StudentSubject, Subject, TeacherProfile, User, ROLLUP_KEY_FIELDS, ACCUMULATOR_KEY_FIELDS
+)
+from .directory import invalidate_department_directory, invalidate_directories
+from .fragments import invalidate_student_list
+from .live_stats import invalidate_live_stats
+from .periods import invalidate_current_period
+from .worklists import invalidate_student_worklist, invalidate_year_level_worklists
+
+
+@receiver(pre_save, sender=Evaluation)
+def remember_rollup_key(sender, instance, raw=False, **kwargs):
+    """Keep the stored rollup key of an edited evaluation so its old row can be rebuilt"""
+    if raw or instance.pk is None:
+        return
+    instance._previous_rollup_key = Evaluation.objects.filter(
+        pk=instance.pk
+    ).values(*ROLLUP_KEY_FIELDS).first()
+
+
+@receiver(post_save, sender=Evaluation)
+def update_rollup_on_save(sender, instance, created, raw=False, **kwargs):
+    """Add new evaluations to their rollup row and accumulators; rebuild the affected rows on edits"""
+    if raw:
+        return
+    if created:
+        TeacherRatingRollup.objects.record(instance)
+        RatingAccumulator.objects.record(instance)
+        return
+
+    # Evaluations are not edited by users, only through the Django admin,
+    # so recomputing the (at most two) affected rows is cheap enough.
+    keys = [{name: getattr(instance, name) for name in ROLLUP_KEY_FIELDS}]
+    previous_key = getattr(instance, '_previous_rollup_key', None)
+    if previous_key and previous_key != keys[0]:
+        keys.append(previous_key)
+    for key in keys:
+        TeacherRatingRollup.objects.rebuild(**key)
+    
+    accumulator_keys = []
+    for key in keys:
+        accumulator_key = {name: key[name] for name in ACCUMULATOR_KEY_FIELDS}
+        if accumulator_key not in accumulator_keys:
+            accumulator_keys.append(accumulator_key)
+    for key in accumulator_keys:
+        RatingAccumulator.objects.rebuild(**key)
+
+
+@receiver(post_delete, sender=Evaluation)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    """Remove a deleted evaluation from its rollup row and accumulators"""
+    TeacherRatingRollup.objects.record(instance, sign=-1)
+    RatingAccumulator.objects.record(instance, sign=-1)
+
+
+@receiver(post_save, sender=Evaluation)
+@receiver(post_delete, sender=Evaluation)
+@receiver(post_save, sender=StudentSubject)
+@receiver(post_delete, sender=StudentSubject)
+def invalidate_worklist_of_student(sender, instance, raw=False, **kwargs):
+    """A student's evaluations or COR subjects changed"""
+    if raw:
+        return
+    invalidate_student_worklist(instance.student_id)
+
+
+@receiver(pre_save, sender=Subject)
+def remember_subject_year_level(sender, instance, raw=False, **kwargs):
+    if raw or instance.pk is None:
+        return
+    instance._previous_year_level = Subject.objects.filter(pk=instance.pk).values_list(
+        'year_level', flat=True
+    ).first()
+
+
+@receiver(post_save, sender=Subject)
+def invalidate_worklists_of_moved_subject(sender, instance, created, raw=False, **kwargs):
+    """A subject moved to another year level, taking its teachers along"""
+    previous_year_level = getattr(instance, '_previous_year_level', None)
+    if raw or created or previous_year_level == instance.year_level:
+        return
+    invalidate_year_level_worklists(instance.year_level)
+    if previous_year_level is not None:
+        invalidate_year_level_worklists(previous_year_level)
+
+
+@receiver(post_delete, sender=Subject)
+def invalidate_worklists_of_deleted_subject(sender, instance, **kwargs):
+    """Deleting a subject drops its teacher links without m2m_changed"""
+    invalidate_year_level_worklists(instance.year_level)
+
+
+@receiver(m2m_changed, sender=TeacherProfile.subjects.through)
+def invalidate_worklists_of_subject_teachers(sender, instance, action, reverse, pk_set, **kwargs):
+    """Teachers were added to or removed from subjects"""
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if reverse:
+        # subject.teachers.add(...) / remove(...) / clear()
+        year_levels = {instance.year_level}
+    elif action == 'pre_clear':
+        year_levels = set(instance.subjects.values_list('year_level', flat=True))
+    else:
+        year_levels = set(Subject.objects.filter(pk__in=pk_set).values_list('year_level', flat=True))
+    for year_level in year_levels:
+        invalidate_year_level_worklists(year_level)
+
+
+SEARCHED_USER_FIELDS = {'first_name', 'last_name', 'username', 'email'}
+
+
+@receiver(post_save, sender=User)
+def refresh_student_search_text(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Names, username and email of a student are part of StudentProfile.search_text"""
+    if raw or created or instance.user_type != 'student':
+        return
+    if update_fields is not None and not SEARCHED_USER_FIELDS & set(update_fields):
+        return
+    for profile in StudentProfile.objects.filter(user=instance):
+        StudentProfile.objects.filter(pk=profile.pk).update(search_text=profile.build_search_text(instance))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_student_list_of_user(sender, instance, raw=False, **kwargs):
+    """Registration, approval and renames of students change the admin student listing"""
+    if not raw and instance.user_type == 'student':
+        invalidate_student_list()
+
+
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+@receiver(post_save, sender=Evaluation)
+@receiver(post_delete, sender=Evaluation)
+@receiver(post_save, sender=StudentSubject)
+@receiver(post_delete, sender=StudentSubject)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_student_list_of_row(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_student_list()
+
+
+@receiver(post_save, sender=Evaluation)
+@receiver(post_delete, sender=Evaluation)
+@receiver(post_save, sender=StudentProfile)
+@receiver(post_delete, sender=StudentProfile)
+@receiver(post_save, sender=TeacherProfile)
+@receiver(post_delete, sender=TeacherProfile)
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=AcademicYear)
+@receiver(post_delete, sender=AcademicYear)
+@receiver(post_save, sender=EvaluationSettings)
+@receiver(post_delete, sender=EvaluationSettings)
+def invalidate_admin_live_stats(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_live_stats()
+
+
+@receiver(post_save, sender=AcademicYear)
+@receiver(post_delete, sender=AcademicYear)
+@receiver(post_save, sender=Semester)
+@receiver(post_delete, sender=Semester)
+@receiver(post_save, sender=EvaluationSettings)
+@receiver(post_delete, sender=EvaluationSettings)
+def invalidate_cached_period(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_current_period()
+
+
+@receiver(post_save, sender=TeacherProfile)
+@receiver(post_delete, sender=TeacherProfile)
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(m2m_changed, sender=TeacherProfile.subjects.through)
+def invalidate_teacher_directories(sender, instance, raw=False, action=None, **kwargs):
+    """Teachers, subjects or their assignments changed; they are edited rarely, so drop every department"""
+    if raw or action not in (None, 'post_add', 'post_remove', 'post_clear'):
+        return
+    invalidate_directories()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_teacher_directories_of_user(sender, instance, raw=False, **kwargs):
+    """Teacher names are listed in the directories"""
+    if not raw and instance.user_type == 'teacher':
+        invalidate_directories()
+
+
+@receiver(post_save, sender=Evaluation)
+@receiver(post_delete, sender=Evaluation)
+def invalidate_directory_of_rated_teacher(sender, instance, raw=False, **kwargs):
+    """The teacher's average rating changed"""
+    if raw:
+        return
+    department_id = TeacherProfile.objects.filter(pk=instance.teacher_id).values_list(
+        'department_id', flat=True
+    ).first()
+    if department_id is not None:
+        invalidate_department_directory(department_id)
@@ -46,7 +46,7 @@ const barChart = new Chart(ctxBar, {
       labels: ['Students', 'Teachers', 'Evaluations', 'Subjects'],
       datasets: [{
         label: 'Totals',
-        data: [{{ total_students }}, {{ total_teachers }}, {{ total_evaluations }}, {{ total_subjects }}],
+        data: [0, 0, 0, 0],  // filled in by pollLiveStats()
         backgroundColor: [
           'rgba(0, 123, 255, 0.7)',   // blue
           'rgba(128, 0, 0, 1)',     // maroon solid
@@ -69,8 +69,7 @@ const barChart = new Chart(ctxBar, {
       },
       scales: {
         y: {
-          beginAtZero: true,
-          max: 5
+          beginAtZero: true
         }
       },
       plugins: {
@@ -80,16 +79,40 @@ const barChart = new Chart(ctxBar, {
       }
     }
   });
-  setInterval(() => {
-    barChart.data.datasets[0].data = barChart.data.datasets[0].data.map(value => {
-      // Randomly add or subtract up to 1
-      let change = (Math.random() > 0.5 ? 1 : -0.5) * Math.random();
-      let newValue = value + change;
-      // Keep values between 0 and 5
-      return Math.max(0, Math.min(5, newValue));
-    });
-    barChart.update();
-  }, 2000);
+
+  // Real totals from the live stats endpoint (data-stats-url on the canvas);
+  // the endpoint answers 304 while nothing changed
+  function pollLiveStats() {
+    const url = ctxBar.canvas.dataset.statsUrl;
+    if (!url) return;
+    let etag = null;
+
+    const poll = () => {
+      if (document.hidden) return;
+      fetch(url, {
+        credentials: 'same-origin',
+        cache: 'no-store',
+        headers: etag ? { 'If-None-Match': etag } : {}
+      })
+        .then(response => {
+          if (response.status === 304 || !response.ok) return null;
+          etag = response.headers.get('ETag');
+          return response.json();
+        })
+        .then(stats => {
+          if (!stats) return;
+          barChart.data.datasets[0].data = [
+            stats.totals.students, stats.totals.teachers, stats.totals.evaluations, stats.totals.subjects
+          ];
+          barChart.update();
+        })
+        .catch(error => console.error('Error loading live stats:', error));
+    };
+
+    poll();
+    setInterval(poll, 15000);
+  }
+  pollLiveStats();
 
   const links = document.querySelectorAll('.sidebar-item a[data-section]');
   const sections = document.querySelectorAll('.page-section');
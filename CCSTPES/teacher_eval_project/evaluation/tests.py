@@ -1,3 +1,1194 @@
+import asyncio
+import datetime
+import io
+import json
+import re
+import statistics
+from unittest import mock, skipUnless
+
+from asgiref.sync import sync_to_async
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from . import analytics
+from .analytics import cohort_comparison, teacher_rankings, teacher_standing
+from .events import publish
+from .models import (
+    PROBLEM_FIELDS, PROBLEM_SCALE, RATING_FIELDS, RATING_SCALE, ROLLUP_KEY_FIELDS, ROLLUP_PART_FIELDS, SCORE_PARTS,
+    AcademicYear, Department, Evaluation, EvaluationSettings, ReportJob, Semester, StudentProfile, Subject, TeacherProfile, TeacherRatingRollup,
+    User
+)
+from .score_matrix import ScoreMatrix
+
+
+def varied_scores(seed):
+    """Criterion values that differ between criteria and between seeds"""
+    scores = {field: (seed + index * (seed % 3 + 1)) % 5 + 1 for index, field in enumerate(RATING_FIELDS)}
+    scores.update({field: (seed + index) % 3 + 1 for index, field in enumerate(PROBLEM_FIELDS)})
+    return scores
+
+
+class EvaluationDataTestCase(TestCase):
+    """One open semester, four teachers sharing three subjects, three students who evaluated the first two"""
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department.objects.create(name='College of Computer Science', code='CCS')
+        cls.academic_year = AcademicYear.objects.create(
+            name='2025-2026', start_Year=2025, end_Year=2026, is_active=True
+        )
+        cls.semester = Semester.objects.create(
+            name='1st Semester', academic_year=cls.academic_year,
+            start_Month=datetime.date(2025, 8, 1), end_Month=datetime.date(2025, 12, 1)
+        )
+        EvaluationSettings.objects.create(academic_year=cls.academic_year, semester=cls.semester, is_open=True)
+
+        subjects = [
+            Subject.objects.create(name=f'Subject {i}', code=f'CS10{i}', year_level=1, department=department)
+            for i in range(3)
+        ]
+        cls.teachers = []
+        for i in range(4):
+            user = User.objects.create_user(
+                username=f'teacher{i}', password='password', user_type='teacher', first_name=f'Teacher{i}'
+            )
+            teacher = TeacherProfile.objects.create(
+                user=user, employee_id=f'EMP{i}', department=department, qualification='MSc'
+            )
+            teacher.subjects.set(subjects)
+            cls.teachers.append(teacher)
+
+        cls.students = []
+        for i in range(3):
+            user = User.objects.create_user(
+                username=f'student{i}', password='password', user_type='student', first_name=f'Student{i}'
+            )
+            cls.students.append(StudentProfile.objects.create(
+                user=user, student_id_number=f'2025-{i}', year_level=1, course='BSCS', department=department
+            ))
+
+        scores = dict({field: 4 for field in RATING_FIELDS}, **{field: 2 for field in PROBLEM_FIELDS})
+        for student in cls.students:
+            for teacher, subject in zip(cls.teachers[:2], subjects):
+                Evaluation.objects.create(
+                    student=student, teacher=teacher, subject=subject, semester=cls.semester,
+                    academic_year=cls.academic_year, suggestions='Keep it up', **scores
+                )
+
+    def setUp(self):
+        # cached worklists, fragments and the current period outlive the test transaction
+        cache.clear()
+
+
+class ScoreSummaryTests(EvaluationDataTestCase):
+
+    def test_summary_matches_the_python_averages_in_one_query(self):
+        teacher = self.teachers[2]
+        subjects = list(teacher.subjects.order_by('code'))
+        evaluations = [
+            Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subject, semester=self.semester,
+                academic_year=self.academic_year, **varied_scores(seed)
+            )
+            for seed, (student, subject) in enumerate(
+                (student, subject) for student in self.students for subject in subjects
+            )
+        ]
+
+        with self.assertNumQueries(1):
+            summary = Evaluation.objects.filter(teacher=teacher).score_summary()
+
+        def mean(values):
+            return sum(values) / len(values)
+
+        self.assertEqual(summary['evaluation_count'], 9)
+        self.assertAlmostEqual(summary['average_rating'], mean([e.get_average_rating() for e in evaluations]), delta=0.01)
+        for part in SCORE_PARTS:
+            expected = mean([getattr(e, f'get_{part}_average')() for e in evaluations])
+            self.assertAlmostEqual(summary[f'{part}_average'], expected, delta=0.01, msg=part)
+
+        empty = Evaluation.objects.filter(teacher=self.teachers[3]).score_summary()
+        self.assertEqual((empty['evaluation_count'], empty['average_rating']), (0, 0))
+
+    def test_teacher_dashboard_does_not_load_every_evaluation(self):
+        self.client.force_login(self.teachers[0].user)
+        response = self.client.get(reverse('teacher_dashboard'))
+        self.assertNotIn('all_evaluations', response.context)
+        self.assertContains(response, '<strong>Presentation:</strong> 4.0/5.00', html=False)
+
+
+class RatingDistributionTests(EvaluationDataTestCase):
+    """rating_distribution() against counts over the same evaluations in Python"""
+
+    def test_distribution_matches_python_counts_in_one_query(self):
+        teacher = self.teachers[2]
+        subjects = list(teacher.subjects.order_by('code'))
+        for seed, (student, subject) in enumerate((st, su) for st in self.students for su in subjects):
+            Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subject, semester=self.semester,
+                academic_year=self.academic_year, **varied_scores(seed)
+            )
+
+        # the fixture evaluations (all 4s and 2s) and the varied ones together
+        evaluations = list(Evaluation.objects.all())
+        with self.assertNumQueries(1):
+            distribution = Evaluation.objects.rating_distribution()
+
+        self.assertEqual(list(distribution), list(RATING_FIELDS + PROBLEM_FIELDS))
+        for name in RATING_FIELDS + PROBLEM_FIELDS:
+            scale = PROBLEM_SCALE if name in PROBLEM_FIELDS else RATING_SCALE
+            values = [getattr(e, name) for e in evaluations]
+            self.assertEqual(distribution[name], [values.count(value) for value in range(1, scale + 1)], name)
+        # every value of the 1-3 problem items shows up in the varied evaluations
+        self.assertTrue(all(distribution['problem_late']))
+
+    def test_empty_queryset_counts_zero(self):
+        distribution = Evaluation.objects.filter(teacher=self.teachers[3]).rating_distribution()
+        self.assertEqual(distribution['presentation_objectives'], [0] * RATING_SCALE)
+        self.assertEqual(distribution['problem_video'], [0] * PROBLEM_SCALE)
+
+
+class ScoreTrendTests(EvaluationDataTestCase):
+    """score_trend() buckets with a fixed today, across week, month and year boundaries"""
+
+    def create_evaluations(self, *items):
+        """One evaluation of teacher 2 per (created_at, rating) item, every criterion rated `rating`"""
+        teacher = self.teachers[2]
+        pairs = [(student, subject) for student in self.students for subject in teacher.subjects.order_by('code')]
+        for (created_at, rating), (student, subject) in zip(items, pairs):
+            evaluation = Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subject, semester=self.semester,
+                academic_year=self.academic_year, **dict(varied_scores(0), **{name: rating for name in RATING_FIELDS})
+            )
+            # created_at is auto_now_add, move it afterwards
+            Evaluation.objects.filter(pk=evaluation.pk).update(created_at=created_at)
+        return Evaluation.objects.filter(teacher=teacher)
+
+    def assertTrend(self, trend, expected):
+        self.assertEqual(
+            [(row['period'], row['evaluation_count'], row['average_rating']) for row in trend], expected
+        )
+
+    def test_weeks_start_on_monday_across_the_new_year(self):
+        evaluations = self.create_evaluations(
+            (datetime.datetime(2025, 12, 7, 12, tzinfo=datetime.timezone.utc), 1),  # before the window
+            (datetime.datetime(2025, 12, 8, 0, 30, tzinfo=datetime.timezone.utc), 2),
+            (datetime.datetime(2025, 12, 28, 23, 30, tzinfo=datetime.timezone.utc), 3),  # Sunday
+            (datetime.datetime(2025, 12, 29, 0, 30, tzinfo=datetime.timezone.utc), 4),  # Monday
+            (datetime.datetime(2026, 1, 1, 12, tzinfo=datetime.timezone.utc), 5),
+        )
+
+        with self.assertNumQueries(1):
+            trend = evaluations.score_trend('week', 4, today=datetime.date(2026, 1, 2))
+        self.assertTrend(trend, [
+            (datetime.date(2025, 12, 8), 1, 2.0),
+            (datetime.date(2025, 12, 15), 0, None),
+            (datetime.date(2025, 12, 22), 1, 3.0),
+            (datetime.date(2025, 12, 29), 2, 4.5),
+        ])
+
+    def test_months_across_the_new_year(self):
+        evaluations = self.create_evaluations(
+            (datetime.datetime(2025, 10, 31, 23, 30, tzinfo=datetime.timezone.utc), 1),  # before the window
+            (datetime.datetime(2025, 12, 1, 0, 30, tzinfo=datetime.timezone.utc), 2),
+            (datetime.datetime(2025, 12, 31, 23, 30, tzinfo=datetime.timezone.utc), 5),
+            (datetime.datetime(2026, 1, 1, 0, 30, tzinfo=datetime.timezone.utc), 3),
+        )
+
+        trend = evaluations.score_trend('month', 3, today=datetime.date(2026, 1, 15))
+        self.assertTrend(trend, [
+            (datetime.date(2025, 11, 1), 0, None),
+            (datetime.date(2025, 12, 1), 2, 3.5),
+            (datetime.date(2026, 1, 1), 1, 3.0),
+        ])
+
+    def test_periods_without_evaluations_have_no_average(self):
+        trend = Evaluation.objects.filter(teacher=self.teachers[3]).score_trend(
+            'month', 2, today=datetime.date(2026, 3, 31)
+        )
+        self.assertTrend(trend, [(datetime.date(2026, 2, 1), 0, None), (datetime.date(2026, 3, 1), 0, None)])
+
+
+class PeriodHistoryTests(EvaluationDataTestCase):
+    """period_history() over semesters of two academic years"""
+
+    def setUp(self):
+        super().setUp()
+        teacher = self.teachers[0]
+        subjects = list(teacher.subjects.order_by('code'))
+        # created newest first, so the ordering has to come from the period dates
+        next_year = AcademicYear.objects.create(name='2026-2027', start_Year=2026, end_Year=2027)
+        next_first = Semester.objects.create(
+            name='1st Semester 2026', academic_year=next_year,
+            start_Month=datetime.date(2026, 8, 1), end_Month=datetime.date(2026, 12, 1)
+        )
+        second = Semester.objects.create(
+            name='2nd Semester 2025', academic_year=self.academic_year,
+            start_Month=datetime.date(2026, 1, 1), end_Month=datetime.date(2026, 5, 1)
+        )
+        self.evaluations = {
+            (next_year.pk, next_first.pk): self.create_evaluations(teacher, next_year, next_first, [
+                (self.students[0], subjects[0], 2),
+            ]),
+            (self.academic_year.pk, second.pk): self.create_evaluations(teacher, self.academic_year, second, [
+                (self.students[0], subjects[1], 5), (self.students[1], subjects[1], 2),
+            ]),
+        }
+        # the fixture evaluations of teacher 0 are all 4s in the first semester
+        self.evaluations[(self.academic_year.pk, self.semester.pk)] = list(Evaluation.objects.filter(
+            teacher=teacher, semester=self.semester
+        ))
+        self.order = [
+            (self.academic_year.pk, self.semester.pk), (self.academic_year.pk, second.pk),
+            (next_year.pk, next_first.pk),
+        ]
+
+    def create_evaluations(self, teacher, academic_year, semester, items):
+        return [
+            Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subject, semester=semester, academic_year=academic_year,
+                **dict(varied_scores(0), **{name: rating for name in RATING_FIELDS})
+            )
+            for student, subject, rating in items
+        ]
+
+    def test_history_is_oldest_first_with_per_period_scores(self):
+        with self.assertNumQueries(1):
+            history = Evaluation.objects.filter(teacher=self.teachers[0]).period_history()
+
+        self.assertEqual([(row['academic_year'], row['semester']) for row in history], self.order)
+        self.assertEqual(
+            [(row['academic_year__name'], row['semester__name']) for row in history],
+            [('2025-2026', '1st Semester'), ('2025-2026', '2nd Semester 2025'), ('2026-2027', '1st Semester 2026')]
+        )
+        for row in history:
+            evaluations = self.evaluations[(row['academic_year'], row['semester'])]
+            self.assertEqual(row['evaluation_count'], len(evaluations))
+            self.assertEqual(
+                row['average_rating'], round(statistics.mean(e.get_average_rating() for e in evaluations), 2)
+            )
+        self.assertEqual([row['average_rating'] for row in history], [4.0, 3.5, 2.0])
+
+    def test_extra_fields_group_per_teacher(self):
+        history = Evaluation.objects.filter(teacher__in=self.teachers[:2]).period_history('teacher')
+
+        self.assertEqual(
+            [(row['teacher'], row['semester'], row['evaluation_count']) for row in history],
+            [(self.teachers[0].pk, semester, len(self.evaluations[(year, semester)])) for year, semester in self.order]
+            + [(self.teachers[1].pk, self.semester.pk, 3)]
+        )
+
+
+class StoredScoreTests(EvaluationDataTestCase):
+    """The persisted score columns filled by save() and the backfill"""
+
+    def create_evaluation(self, seed=0):
+        return Evaluation.objects.create(
+            student=self.students[0], teacher=self.teachers[2], subject=Subject.objects.get(code='CS102'),
+            semester=self.semester, academic_year=self.academic_year, **varied_scores(seed)
+        )
+
+    def expected_columns(self, evaluation):
+        def average(fields):
+            return round(sum(getattr(evaluation, name) for name in fields) / len(fields), 2)
+
+        expected = {'overall_avg': average(RATING_FIELDS), 'problem_total': sum(
+            getattr(evaluation, name) for name in PROBLEM_FIELDS
+        )}
+        for part, fields in SCORE_PARTS.items():
+            expected[f'{part}_avg'] = average(fields)
+        return expected
+
+    def stored_columns(self, evaluation):
+        return Evaluation.objects.filter(pk=evaluation.pk).values(*Evaluation.SCORE_COLUMNS).get()
+
+    def test_save_fills_the_score_columns(self):
+        evaluation = self.create_evaluation(seed=3)
+        self.assertEqual(self.stored_columns(evaluation), self.expected_columns(evaluation))
+        self.assertEqual(evaluation.get_average_rating(), evaluation.overall_avg)
+
+        # update_fields saves recompute the columns too
+        evaluation.presentation_objectives = 1
+        evaluation.problem_late = 3
+        evaluation.save(update_fields=['presentation_objectives', 'problem_late'])
+        self.assertEqual(self.stored_columns(evaluation), self.expected_columns(evaluation))
+
+    def test_backfill_fills_missing_scores_in_batches(self):
+        evaluations = [self.create_evaluation(seed=4)] + list(Evaluation.objects.filter(teacher=self.teachers[0]))
+        Evaluation.objects.update(**{name: None for name in Evaluation.SCORE_COLUMNS})
+
+        out = io.StringIO()
+        call_command('backfill_evaluation_scores', batch_size=2, stdout=out)
+
+        self.assertIn('Backfilled scores for 7 evaluations.', out.getvalue())
+        for evaluation in evaluations:
+            self.assertEqual(self.stored_columns(evaluation), self.expected_columns(evaluation))
+
+        # only missing scores are touched unless --all
+        Evaluation.objects.filter(pk=evaluations[0].pk).update(overall_avg=1)
+        call_command('backfill_evaluation_scores', stdout=io.StringIO())
+        self.assertEqual(self.stored_columns(evaluations[0])['overall_avg'], 1)
+        call_command('backfill_evaluation_scores', '--all', stdout=io.StringIO())
+        self.assertEqual(self.stored_columns(evaluations[0]), self.expected_columns(evaluations[0]))
+
+    def test_backfill_migration_fills_missing_scores(self):
+        from importlib import import_module
+        from django.db.migrations.loader import MigrationLoader
+
+        evaluation = self.create_evaluation(seed=5)
+        Evaluation.objects.update(**{name: None for name in Evaluation.SCORE_COLUMNS})
+
+        # run the step with the historical models it sees during migrate
+        migration = ('evaluation', '0015_backfill_evaluation_scores')
+        historical_apps = MigrationLoader(connection).project_state(migration).apps
+        import_module('evaluation.migrations.0015_backfill_evaluation_scores').backfill_scores(historical_apps, None)
+        self.assertEqual(self.stored_columns(evaluation), self.expected_columns(evaluation))
+
+    def test_aggregates_read_the_stored_columns(self):
+        evaluations = Evaluation.objects.filter(teacher=self.teachers[0])
+        Evaluation.objects.filter(pk=evaluations[0].pk).update(overall_avg=1, presentation_avg=1)
+
+        summary = evaluations.score_summary()
+        self.assertEqual(summary['average_rating'], 3.0)
+        self.assertEqual(summary['presentation_average'], 3.0)
+        self.assertEqual(summary['development_average'], 4.0)
+        self.assertEqual(sorted(e.overall_score for e in evaluations.with_scores()), [1, 4, 4])
+        self.assertEqual(evaluations.score_trend(periods=1)[0]['average_rating'], 3.0)
+
+        # rows saved before the columns existed fall back to the criteria
+        Evaluation.objects.filter(pk=evaluations[0].pk).update(overall_avg=None, presentation_avg=None)
+        self.assertEqual(evaluations.score_summary()['average_rating'], 4.0)
+
+
+class RatingRollupTests(EvaluationDataTestCase):
+    """The incrementally maintained rollups always equal a rebuild from the evaluations"""
+
+    def rollup_rows(self):
+        fields = [
+            field.attname for field in TeacherRatingRollup._meta.concrete_fields
+            if field.attname not in ('id', 'updated_at')
+        ]
+        return sorted(tuple(row) for row in TeacherRatingRollup.objects.values_list(*fields))
+
+    def assertRollupsMatchEvaluations(self):
+        incremental = self.rollup_rows()
+
+        with transaction.atomic():
+            TeacherRatingRollup.objects.rebuild()
+            rebuilt = self.rollup_rows()
+            transaction.set_rollback(True)
+        self.assertEqual(incremental, rebuilt)
+
+        # fresh per-key totals computed in Python
+        totals = {}
+        for evaluation in Evaluation.objects.all():
+            key = tuple(getattr(evaluation, name) for name in ROLLUP_KEY_FIELDS)
+            row = totals.setdefault(key, {'evaluation_count': 0})
+            row['evaluation_count'] += 1
+            for part, fields in ROLLUP_PART_FIELDS.items():
+                for name in fields:
+                    row[f'{name}_sum'] = row.get(f'{name}_sum', 0) + getattr(evaluation, name)
+                    row[f'{part}_sum'] = row.get(f'{part}_sum', 0) + getattr(evaluation, name)
+        stored = {
+            tuple(getattr(rollup, name) for name in ROLLUP_KEY_FIELDS): rollup
+            for rollup in TeacherRatingRollup.objects.all()
+        }
+        self.assertEqual(set(stored), set(totals))
+        for key, row in totals.items():
+            for name, value in row.items():
+                self.assertEqual(getattr(stored[key], name), value, (key, name))
+
+    def test_create_edit_and_delete_keep_rollups_exact(self):
+        teacher = self.teachers[2]
+        subjects = list(teacher.subjects.order_by('code'))
+        evaluations = [
+            Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subjects[0], semester=self.semester,
+                academic_year=self.academic_year, **varied_scores(seed)
+            )
+            for seed, student in enumerate(self.students)
+        ]
+        self.assertRollupsMatchEvaluations()
+
+        # moving an evaluation to another subject moves it to another rollup row
+        moved = evaluations[0]
+        moved.subject = subjects[1]
+        for name, value in varied_scores(7).items():
+            setattr(moved, name, value)
+        moved.save()
+        self.assertRollupsMatchEvaluations()
+
+        evaluations[1].delete()
+        self.assertRollupsMatchEvaluations()
+
+        # the last evaluation of a row removes the row
+        moved.delete()
+        self.assertRollupsMatchEvaluations()
+        self.assertFalse(TeacherRatingRollup.objects.filter(teacher=teacher, subject=subjects[1]).exists())
+
+
+class ScoreMatrixTests(EvaluationDataTestCase):
+    """ScoreMatrix statistics against plain Python over the same evaluations"""
+
+    def create_evaluations(self):
+        teacher = self.teachers[2]
+        subjects = list(teacher.subjects.order_by('code'))
+        # three evaluations of CS100, two of CS101 and one of CS102
+        pairs = [(student, subjects[0]) for student in self.students]
+        pairs += [(student, subjects[1]) for student in self.students[:2]] + [(self.students[0], subjects[2])]
+        return [
+            Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subject, semester=self.semester,
+                academic_year=self.academic_year, **varied_scores(seed)
+            )
+            for seed, (student, subject) in enumerate(pairs)
+        ]
+
+    def expected_stats(self, evaluations):
+        ratings = [statistics.mean(getattr(e, name) for name in RATING_FIELDS) for e in evaluations]
+        expected = {
+            'evaluation_count': len(evaluations),
+            'average_rating': round(statistics.mean(ratings), 2),
+            'rating_std': round(statistics.stdev(ratings), 2) if len(ratings) > 1 else 0,
+        }
+        for part, fields in SCORE_PARTS.items():
+            expected[f'{part}_average'] = round(
+                statistics.mean(getattr(e, name) for e in evaluations for name in fields), 2
+            )
+        expected['item_means'], expected['item_stds'], expected['histograms'] = {}, {}, {}
+        for name in RATING_FIELDS + PROBLEM_FIELDS:
+            values = [getattr(e, name) for e in evaluations]
+            scale = PROBLEM_SCALE if name in PROBLEM_FIELDS else RATING_SCALE
+            expected['item_means'][name] = round(statistics.mean(values), 2)
+            expected['item_stds'][name] = round(statistics.stdev(values), 2) if len(values) > 1 else 0
+            expected['histograms'][name] = [values.count(value) for value in range(1, scale + 1)]
+        return expected
+
+    def test_summary_matches_python_statistics(self):
+        evaluations = self.create_evaluations()
+        with self.assertNumQueries(1):
+            matrix = ScoreMatrix.from_queryset(Evaluation.objects.filter(teacher=self.teachers[2]))
+        self.assertEqual(matrix.summary(), self.expected_stats(evaluations))
+
+    def test_summary_by_groups_in_one_pass(self):
+        evaluations = self.create_evaluations()
+        matrix = ScoreMatrix.from_queryset(
+            Evaluation.objects.filter(teacher=self.teachers[2]), group_by=('subject__code',)
+        )
+        by_subject = matrix.summary_by()
+
+        self.assertEqual(list(by_subject), [('CS100',), ('CS101',), ('CS102',)])
+        for (code,), stats in by_subject.items():
+            self.assertEqual(stats, self.expected_stats([e for e in evaluations if e.subject.code == code]), code)
+        # a single evaluation has no spread
+        self.assertEqual(by_subject[('CS102',)]['rating_std'], 0)
+
+    def test_empty_queryset(self):
+        matrix = ScoreMatrix.from_queryset(Evaluation.objects.filter(teacher=self.teachers[3]))
+        self.assertEqual(len(matrix), 0)
+        self.assertEqual(matrix.summary()['evaluation_count'], 0)
+        self.assertEqual(matrix.summary()['average_rating'], 0)
+        self.assertEqual(matrix.summary()['histograms']['problem_late'], [0, 0, 0])
+        self.assertEqual(matrix.summary_by(), {})
+
+
+class RatingAccumulatorTests(EvaluationDataTestCase):
+    """The running (n, mean, M2) accumulators against the statistics module"""
+
+    def setUp(self):
+        super().setUp()
+        self.teacher = self.teachers[2]
+        self.subjects = list(self.teacher.subjects.order_by('code'))
+        self.second_semester = Semester.objects.create(
+            name='2nd Semester 2025', academic_year=self.academic_year,
+            start_Month=datetime.date(2026, 1, 1), end_Month=datetime.date(2026, 5, 1)
+        )
+
+    def create_evaluation(self, student, subject, seed, semester=None):
+        return Evaluation.objects.create(
+            student=student, teacher=self.teacher, subject=subject, semester=semester or self.semester,
+            academic_year=self.academic_year, **varied_scores(seed)
+        )
+
+    def overall(self, evaluation):
+        return statistics.mean(getattr(evaluation, name) for name in RATING_FIELDS)
+
+    def assertSpreadMatches(self, accumulators, evaluations):
+        """spread() of accumulators equals mean, stdev and the 95% interval of the evaluations"""
+        spread = accumulators.spread()
+        if not evaluations:
+            self.assertEqual(spread, {})
+            return
+
+        checks = {'overall': self.overall, 'presentation_objectives': lambda e: e.presentation_objectives}
+        for criterion, value in checks.items():
+            values = [value(e) for e in evaluations]
+            mean = statistics.mean(values)
+            std = statistics.stdev(values) if len(values) > 1 else 0.0
+            margin = 1.96 * std / len(values) ** 0.5
+            self.assertEqual(spread[criterion]['n'], len(values), criterion)
+            self.assertAlmostEqual(spread[criterion]['mean'], mean, delta=0.006, msg=criterion)
+            self.assertAlmostEqual(spread[criterion]['std'], std, delta=0.006, msg=criterion)
+            self.assertAlmostEqual(spread[criterion]['ci_low'], mean - margin, delta=0.006, msg=criterion)
+            self.assertAlmostEqual(spread[criterion]['ci_high'], mean + margin, delta=0.006, msg=criterion)
+
+    def test_adds_and_deletes_match_python_statistics(self):
+        accumulators = self.teacher.rating_accumulators.all()
+        evaluations = []
+        for seed, student in enumerate(self.students):
+            evaluations.append(self.create_evaluation(student, self.subjects[0], seed))
+            self.assertSpreadMatches(accumulators, evaluations)
+        evaluations.append(self.create_evaluation(self.students[0], self.subjects[1], 7))
+        self.assertSpreadMatches(accumulators, evaluations)
+
+        while evaluations:
+            evaluations.pop(1 if len(evaluations) > 1 else 0).delete()
+            self.assertSpreadMatches(accumulators, evaluations)
+        self.assertFalse(accumulators.exists())
+
+    def test_single_evaluation_has_no_spread(self):
+        accumulators = self.teacher.rating_accumulators.all()
+        evaluation = self.create_evaluation(self.students[0], self.subjects[0], 4)
+        overall = accumulators.spread()['overall']
+        self.assertEqual(overall['n'], 1)
+        self.assertEqual(overall['std'], 0)
+        self.assertEqual(overall['ci_low'], overall['ci_high'])
+
+        # popping back to one evaluation also leaves no spread
+        second = self.create_evaluation(self.students[1], self.subjects[0], 5)
+        second.delete()
+        self.assertEqual(accumulators.spread()['overall']['std'], 0)
+        self.assertAlmostEqual(accumulators.spread()['overall']['mean'], self.overall(evaluation), delta=0.006)
+
+    def test_spread_merges_periods(self):
+        first = [self.create_evaluation(student, self.subjects[0], seed) for seed, student in enumerate(self.students)]
+        second = [
+            self.create_evaluation(student, self.subjects[1], seed + 3, semester=self.second_semester)
+            for seed, student in enumerate(self.students[:2])
+        ]
+        accumulators = self.teacher.rating_accumulators.all()
+        self.assertEqual(accumulators.values('semester').distinct().count(), 2)
+
+        self.assertSpreadMatches(accumulators.filter(semester=self.semester), first)
+        self.assertSpreadMatches(accumulators.filter(semester=self.second_semester), second)
+        self.assertSpreadMatches(accumulators, first + second)
+
+        # edits rebuild the period's rows; the merge still equals the statistics of every evaluation
+        first[0].presentation_objectives = 1
+        first[0].save()
+        self.assertSpreadMatches(accumulators, first + second)
+
+
+class StudentDashboardQueryTests(EvaluationDataTestCase):
+    """The student dashboard must not issue queries per evaluation or per teacher"""
+
+    def test_query_budget(self):
+        self.client.force_login(self.students[0].user)
+        with self.assertNumQueries(17):
+            self.client.get(reverse('student_dashboard'))
+        # the worklist and the current period are cached after the first visit
+        with self.assertNumQueries(11):
+            response = self.client.get(reverse('student_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['evaluations_count'], 2)
+        self.assertEqual(len(response.context['teachers']), 2)
+        self.assertEqual([t.get_average_rating() for t in response.context['top_teachers']], [4.0, 4.0])
+
+    def test_worklist_follows_new_evaluations_and_subject_teachers(self):
+        student = self.students[0]
+        self.client.force_login(student.user)
+        response = self.client.get(reverse('student_dashboard'))
+        self.assertEqual({t.pk for t in response.context['teachers']}, {t.pk for t in self.teachers[2:]})
+
+        scores = dict({field: 3 for field in RATING_FIELDS}, **{field: 1 for field in PROBLEM_FIELDS})
+        Evaluation.objects.create(
+            student=student, teacher=self.teachers[2], subject=self.teachers[2].subjects.first(),
+            semester=self.semester, academic_year=self.academic_year, suggestions='Ok', **scores
+        )
+        response = self.client.get(reverse('student_dashboard'))
+        self.assertEqual([t.pk for t in response.context['teachers']], [self.teachers[3].pk])
+
+        self.teachers[3].subjects.clear()
+        response = self.client.get(reverse('student_dashboard'))
+        self.assertEqual(response.context['teachers'], [])
+        self.assertEqual(response.context['teachers_count'], 3)
+
+
+class TeacherDirectoryTests(EvaluationDataTestCase):
+
+    def test_directory_is_cached_per_department(self):
+        self.client.force_login(self.students[0].user)
+        response = self.client.get(reverse('teacher_directory'))
+        self.assertEqual(len(response.context['teachers']), 4)
+        self.assertEqual(response.context['student_department']['code'], 'CCS')
+
+        with self.assertNumQueries(3):  # session, user and the student's department
+            response = self.client.get(reverse('teacher_directory'))
+        teacher = next(item for item in response.context['teachers'] if item['id'] == self.teachers[0].pk)
+        self.assertEqual(teacher['average_rating'], 4.0)
+        self.assertEqual(len(teacher['subjects']), 3)
+
+        # assignments and new evaluations show up
+        subject = Subject.objects.get(code='CS100')
+        self.teachers[0].subjects.remove(subject)
+        Evaluation.objects.create(
+            student=self.students[0], teacher=self.teachers[3], subject=subject,
+            semester=self.semester, academic_year=self.academic_year,
+            **dict({field: 5 for field in RATING_FIELDS}, **{field: 1 for field in PROBLEM_FIELDS})
+        )
+        teachers = {item['id']: item for item in self.client.get(reverse('teacher_directory')).context['teachers']}
+        self.assertEqual(len(teachers[self.teachers[0].pk]['subjects']), 2)
+        self.assertEqual(teachers[self.teachers[3].pk]['average_rating'], 5.0)
+
+    def test_only_students_see_the_directory(self):
+        self.client.force_login(self.teachers[0].user)
+        self.assertRedirects(self.client.get(reverse('teacher_directory')), reverse('home'))
+
+
+class ViewEvaluationTests(EvaluationDataTestCase):
+
+    def test_evaluation_renders_from_one_query(self):
+        evaluation = Evaluation.objects.filter(student=self.students[0], teacher=self.teachers[0]).get()
+        self.client.force_login(self.students[0].user)
+        with self.assertNumQueries(3):  # session, user and the evaluation with its relations
+            response = self.client.get(reverse('view_evaluation', args=[evaluation.pk]))
+
+        detail = response.context['detail']
+        self.assertEqual([len(part['criteria']) for part in detail['parts']], [4, 13, 5, 2])
+        self.assertEqual(detail['parts'][0]['criteria'][0]['stars'], [True] * 4 + [False])
+        self.assertEqual([problem['severity'] for problem in detail['problems']], ['Serious'] * 3)
+        self.assertContains(response, 'Communicates clearly the objectives')
+        self.assertContains(response, 'Wrap-up Average:</strong> 4.0/5.00', html=False)
+
+    def test_other_teachers_are_turned_away(self):
+        evaluation = Evaluation.objects.filter(teacher=self.teachers[0]).first()
+        self.client.force_login(self.teachers[1].user)
+        response = self.client.get(reverse('view_evaluation', args=[evaluation.pk]))
+        self.assertRedirects(response, reverse('teacher_dashboard'), fetch_redirect_response=False)
+
+
+class TeacherEvaluationProgressTests(EvaluationDataTestCase):
+
+    def test_bulk_progress_matches_single_teacher_progress(self):
+        expected = {teacher.pk: teacher.get_evaluation_progress() for teacher in self.teachers}
+        teachers = TeacherProfile.objects.all()
+        with self.assertNumQueries(3):
+            teachers = TeacherProfile.attach_evaluation_progress(teachers)
+            progress = {teacher.pk: teacher.get_evaluation_progress() for teacher in teachers}
+        self.assertEqual(progress, expected)
+        self.assertEqual(progress[self.teachers[0].pk], {'total_possible': 3, 'completed': 3, 'percentage': 100.0})
+
+
+class TeacherRankingTests(EvaluationDataTestCase):
+    """Window-function ranks against the Python fallback used without OVER support"""
+
+    def setUp(self):
+        super().setUp()
+        # teachers 0 and 1 tie at 4.0, teacher 2 trails at 3.0; a second
+        # department has a single teacher at 5.0
+        subject = Subject.objects.get(code='CS102')
+        self.create_evaluations(self.teachers[2], subject, 3)
+        self.other_department = Department.objects.create(name='College of Engineering', code='COE')
+        user = User.objects.create_user(username='teacher_coe', password='password', user_type='teacher')
+        self.loner = TeacherProfile.objects.create(
+            user=user, employee_id='EMP-COE', department=self.other_department, qualification='MSc'
+        )
+        self.create_evaluations(self.loner, subject, 5)
+
+    def create_evaluations(self, teacher, subject, value):
+        scores = dict({field: value for field in RATING_FIELDS}, **{field: 1 for field in PROBLEM_FIELDS})
+        for student in self.students[:2]:
+            Evaluation.objects.create(
+                student=student, teacher=teacher, subject=subject, semester=self.semester,
+                academic_year=self.academic_year, **scores
+            )
+
+    def python_rankings(self, **kwargs):
+        with mock.patch.object(connection.features, 'supports_over_clause', False):
+            return teacher_rankings(**kwargs)
+
+    def test_window_ranks_match_the_python_fallback(self):
+        self.assertTrue(connection.features.supports_over_clause)
+        rankings = teacher_rankings(academic_year=self.academic_year, semester=self.semester)
+        self.assertEqual(rankings, self.python_rankings(academic_year=self.academic_year, semester=self.semester))
+
+        by_teacher = {row['teacher']: row for row in rankings}
+        first, second, third = (by_teacher[teacher.pk] for teacher in self.teachers[:3])
+        loner = by_teacher[self.loner.pk]
+        self.assertNotIn(self.teachers[3].pk, by_teacher)
+
+        # ties share a rank and leave a gap after them
+        self.assertEqual([row['overall_rank'] for row in rankings], [1, 2, 2, 4])
+        self.assertEqual((first['department_rank'], second['department_rank'], third['department_rank']), (1, 1, 3))
+        self.assertEqual((first['department_percentile'], third['department_percentile']), (100.0, 0.0))
+        self.assertEqual((first['overall_percentile'], third['overall_percentile']), (66.7, 0.0))
+        self.assertEqual((first['department_size'], first['overall_size']), (3, 4))
+
+        # PERCENT_RANK of a single-teacher department is 0, the top percentile
+        self.assertEqual(
+            (loner['department_rank'], loner['department_percentile'], loner['department_size']), (1, 100.0, 1)
+        )
+        self.assertEqual((loner['overall_rank'], loner['overall_percentile']), (1, 100.0))
+
+    def test_department_rankings_are_filtered_in_the_query(self):
+        department = self.teachers[0].department
+        with CaptureQueriesContext(connection) as queries:
+            rankings = teacher_rankings(department=department)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('department_id', queries[0]['sql'].split('WHERE')[1])
+        self.assertEqual(rankings, self.python_rankings(department=department))
+
+        self.assertEqual([row['teacher'] for row in rankings], [t.pk for t in self.teachers[:3]])
+        self.assertEqual([row['department_rank'] for row in rankings], [1, 1, 3])
+        self.assertEqual(teacher_rankings(department=self.other_department)[0]['department_percentile'], 100.0)
+
+    def test_standing_ranks_against_the_institution(self):
+        standing = teacher_standing(self.teachers[2])
+        self.assertEqual((standing['department_rank'], standing['overall_rank']), (3, 4))
+        self.assertIsNone(teacher_standing(self.teachers[3]))
+
+    def test_teacher_dashboard_shows_the_standing(self):
+        self.client.force_login(self.teachers[2].user)
+        response = self.client.get(reverse('teacher_dashboard'))
+        self.assertEqual(response.context['standing']['overall_rank'], 4)
+        self.assertContains(response, '<strong>Department Rank:</strong> 3 of 3, percentile 0.0', html=False)
+        self.assertContains(response, '<strong>Overall Rank:</strong> 4 of 4, percentile 0.0', html=False)
+
+
+class CohortComparisonTests(EvaluationDataTestCase):
+    """Teacher, department and institution averages in one query"""
+
+    def setUp(self):
+        super().setUp()
+        # an earlier semester where teacher 0 was rated 1 and teacher 2 was rated 2
+        self.old_year = AcademicYear.objects.create(name='2024-2025', start_Year=2024, end_Year=2025)
+        self.old_semester = Semester.objects.create(
+            name='1st Semester 2024', academic_year=self.old_year,
+            start_Month=datetime.date(2024, 8, 1), end_Month=datetime.date(2024, 12, 1)
+        )
+        subject = Subject.objects.get(code='CS100')
+        for teacher, value in ((self.teachers[0], 1), (self.teachers[2], 2)):
+            Evaluation.objects.create(
+                student=self.students[0], teacher=teacher, subject=subject, semester=self.old_semester,
+                academic_year=self.old_year,
+                **dict({field: value for field in RATING_FIELDS}, **{field: 1 for field in PROBLEM_FIELDS})
+            )
+
+    def periods(self):
+        """Every period, both semesters, and a combination without evaluations"""
+        return [
+            (None, None), (self.academic_year, self.semester), (self.old_year, self.old_semester),
+            (self.old_year, self.semester),
+        ]
+
+    def python_totals(self, teacher, academic_year, semester):
+        """Cohort totals summed over the evaluations in Python"""
+        evaluations = Evaluation.objects.select_related('teacher')
+        if academic_year:
+            evaluations = evaluations.filter(academic_year=academic_year)
+        if semester:
+            evaluations = evaluations.filter(semester=semester)
+        members = {
+            'teacher': lambda e: e.teacher_id == teacher.pk,
+            'department': lambda e: e.teacher.department_id == teacher.department_id,
+            'institution': lambda e: True,
+        }
+        totals = {}
+        for cohort, is_member in members.items():
+            cohort_evaluations = [e for e in evaluations if is_member(e)]
+            if not cohort_evaluations:
+                continue
+            totals[cohort] = {'evaluation_count': len(cohort_evaluations)}
+            for part, fields in SCORE_PARTS.items():
+                totals[cohort][f'{part}_sum'] = sum(getattr(e, name) for e in cohort_evaluations for name in fields)
+        return totals
+
+    def test_union_matches_python_totals(self):
+        for teacher in self.teachers:
+            for academic_year, semester in self.periods():
+                with self.subTest(teacher=teacher.pk, academic_year=academic_year, semester=semester):
+                    self.assertEqual(
+                        analytics._cohort_totals_union(teacher, academic_year, semester),
+                        self.python_totals(teacher, academic_year, semester),
+                    )
+
+    @skipUnless(connection.vendor == 'postgresql', 'GROUPING SETS is only used on PostgreSQL')
+    def test_grouping_sets_match_the_union(self):
+        for teacher in self.teachers:
+            for academic_year, semester in self.periods():
+                with self.subTest(teacher=teacher.pk, academic_year=academic_year, semester=semester):
+                    self.assertEqual(
+                        analytics._cohort_totals_grouping_sets(teacher, academic_year, semester),
+                        analytics._cohort_totals_union(teacher, academic_year, semester),
+                    )
+
+        with mock.patch.object(connection, 'vendor', 'sqlite'):
+            union = cohort_comparison(self.teachers[0], self.academic_year, self.semester)
+        self.assertEqual(cohort_comparison(self.teachers[0], self.academic_year, self.semester), union)
+
+    def test_teacher_charts_compare_the_current_period(self):
+        self.client.force_login(self.teachers[0].user)
+        data = self.client.get(reverse('teacher_dashboard_charts')).json()
+
+        # the 1.0 of the earlier semester is left out of every cohort
+        self.assertEqual(data['benchmark']['teacher']['presentation_average'], 4.0)
+        self.assertEqual(data['benchmark']['teacher']['evaluation_count'], 3)
+        self.assertEqual(data['benchmark']['department']['evaluation_count'], 6)
+        self.assertEqual(data['benchmark']['institution']['average_rating'], 4.0)
+
+
+class TeacherDashboardChartsTests(EvaluationDataTestCase):
+
+    def test_charts_are_revalidated_with_the_etag(self):
+        self.client.force_login(self.teachers[0].user)
+        self.assertEqual(self.client.get(reverse('teacher_dashboard')).status_code, 200)
+
+        response = self.client.get(reverse('teacher_dashboard_charts'))
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['category']['presentation'], 4.0)
+        self.assertEqual(data['history']['counts'], [3])
+        self.assertEqual(len(data['weekly']['labels']), 5)
+
+        etag = response['ETag']
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse('teacher_dashboard_charts'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # other teachers' evaluations are not part of the validator
+        Evaluation.objects.create(
+            student=self.students[0], teacher=self.teachers[1], subject=self.teachers[1].subjects.last(),
+            semester=self.semester, academic_year=self.academic_year,
+            **dict({field: 5 for field in RATING_FIELDS}, **{field: 1 for field in PROBLEM_FIELDS})
+        )
+        response = self.client.get(reverse('teacher_dashboard_charts'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Evaluation.objects.create(
+            student=self.students[0], teacher=self.teachers[0], subject=self.teachers[0].subjects.last(),
+            semester=self.semester, academic_year=self.academic_year,
+            **dict({field: 5 for field in RATING_FIELDS}, **{field: 1 for field in PROBLEM_FIELDS})
+        )
+        response = self.client.get(reverse('teacher_dashboard_charts'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['history']['counts'], [4])
+
+
+class AdminDashboardTests(EvaluationDataTestCase):
+
+    def setUp(self):
+        super().setUp()
+        admin = User.objects.create_user(username='admin', password='password', user_type='admin')
+        self.client.force_login(admin)
+
+    def test_initial_page_only_runs_summary_counts(self):
+        # session, user, active period (2), four counts
+        with self.assertNumQueries(8):
+            response = self.client.get(reverse('admin_dashboard'))
+        self.assertEqual(response.context['total_evaluations'], 6)
+        self.assertNotIn('students', response.context)
+
+    def test_sections_are_served_separately(self):
+        for section in ('students', 'teachers', 'subjects', 'results', 'periods'):
+            response = self.client.get(reverse('admin_dashboard_section', args=[section]))
+            self.assertEqual(response.status_code, 200, section)
+        self.assertContains(
+            self.client.get(reverse('admin_dashboard_section', args=['teachers'])), 'viewTeacherModal'
+        )
+
+        overview = self.client.get(reverse('admin_dashboard_section', args=['overview'])).json()
+        self.assertEqual([item['rating'] for item in overview['top_teachers']], [4.0, 4.0])
+        self.assertEqual(self.client.get(reverse('admin_dashboard_section', args=['unknown'])).status_code, 404)
+
+    def test_results_section_lists_the_first_ten_teachers(self):
+        department = self.teachers[0].department
+        for i in range(4, 12):
+            user = User.objects.create_user(
+                username=f'teacher{i}', password='password', user_type='teacher', first_name=f'Teacher{i:02}'
+            )
+            TeacherProfile.objects.create(user=user, employee_id=f'EMP{i}', department=department, qualification='MSc')
+
+        response = self.client.get(reverse('admin_dashboard_section', args=['results']))
+        teachers = response.context['teachers']
+        self.assertIsInstance(teachers, list)
+        self.assertEqual(len(teachers), 10)
+        self.assertEqual(teachers[0], self.teachers[0])
+        self.assertEqual(response.context['teachers_count'], 12)
+        self.assertContains(response, 'Showing 10 of 12 teachers')
+
+        TeacherProfile.objects.all().delete()
+        response = self.client.get(reverse('admin_dashboard_section', args=['results']))
+        self.assertEqual(response.context['teachers_count'], 0)
+        self.assertContains(response, 'No teachers available')
+
+
+    def test_periods_section_costs_a_fixed_number_of_queries(self):
+        def periods_page():
+            with CaptureQueriesContext(connection) as queries:
+                html = self.client.get(reverse('admin_dashboard_section', args=['periods'])).content.decode()
+            return len(queries), html
+
+        before, _ = periods_page()
+        for year in range(2020, 2024):
+            academic_year = AcademicYear.objects.create(name=f'{year}-{year + 1}', start_Year=year, end_Year=year + 1)
+            for month in (1, 8):
+                semester = Semester.objects.create(
+                    name=f'{year} Semester {month}', academic_year=academic_year,
+                    start_Month=datetime.date(year, month, 1), end_Month=datetime.date(year, month + 4, 1)
+                )
+                EvaluationSettings.objects.create(academic_year=academic_year, semester=semester, is_open=False)
+        count, html = periods_page()
+        self.assertEqual(count, before)
+
+        # each semester shows its own settings and dates, next to the current period's badge
+        self.assertEqual(html.count('badge bg-success">Open'), 2)
+        self.assertEqual(html.count('badge bg-secondary">Closed'), 8)
+        self.assertIn('Aug 01, 2025 - Dec 01, 2025', html)
+
+        # the cached current period follows the settings
+        EvaluationSettings.objects.update(is_open=False)
+        EvaluationSettings.objects.get(semester=self.semester).save()
+        response = self.client.get(reverse('admin_dashboard_section', args=['periods']))
+        self.assertFalse(response.context['evaluation_is_open'])
+
+    def test_teacher_and_subject_sections_cost_a_fixed_number_of_queries(self):
+        def section_queries():
+            counts = {}
+            for section in ('teachers', 'subjects'):
+                with CaptureQueriesContext(connection) as queries:
+                    self.client.get(reverse('admin_dashboard_section', args=[section]))
+                counts[section] = len(queries)
+            return counts
+
+        before = section_queries()
+        department = self.teachers[0].department
+        subjects = [
+            Subject.objects.create(name=f'Extra {i}', code=f'CS20{i}', year_level=2, department=department)
+            for i in range(3)
+        ]
+        for i in range(3):
+            user = User.objects.create_user(username=f'extra_teacher{i}', password='password', user_type='teacher')
+            teacher = TeacherProfile.objects.create(
+                user=user, employee_id=f'EXT{i}', department=department, qualification='MSc'
+            )
+            teacher.subjects.set(subjects)
+        self.assertEqual(section_queries(), before)
+
+        # assigned subjects are checked in the "assign subjects" modal
+        html = self.client.get(reverse('admin_dashboard_section', args=['teachers'])).content.decode()
+        self.assertRegex(html, rf'id="subject{teacher.id}_{subjects[0].id}"\s*checked')
+        self.assertNotRegex(html, rf'id="subject{self.teachers[0].id}_{subjects[0].id}"\s*checked')
+
+
+class AdminLiveStatsTests(EvaluationDataTestCase):
+
+    def setUp(self):
+        super().setUp()
+        admin = User.objects.create_user(username='admin', password='password', user_type='admin')
+        self.client.force_login(admin)
+
+    def test_unchanged_polls_are_answered_without_stats_queries(self):
+        response = self.client.get(reverse('admin_live_stats'))
+        data = response.json()
+        self.assertEqual(data['totals'], {'students': 3, 'teachers': 4, 'evaluations': 6, 'subjects': 3})
+        self.assertEqual(data['last_hour'], 6)
+        self.assertEqual(data['departments'][0]['completion'], 100.0)
+
+        etag = response['ETag']
+        with self.assertNumQueries(2):  # session and user only
+            response = self.client.get(reverse('admin_live_stats'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        Evaluation.objects.filter(student=self.students[0]).delete()
+        response = self.client.get(reverse('admin_live_stats'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['departments'][0]['evaluated_students'], 2)
+
+    def test_only_admins_get_stats(self):
+        self.client.force_login(self.students[0].user)
+        self.assertEqual(self.client.get(reverse('admin_live_stats')).status_code, 403)
+
+
+class LiveEventsTests(EvaluationDataTestCase):
+
+    async def test_teachers_receive_their_evaluation_events(self):
+        await sync_to_async(self.async_client.force_login)(self.teachers[0].user)
+        response = await self.async_client.get(reverse('live_events'))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b'retry:'))
+
+        # published from a sync thread, like the evaluate_teacher view does
+        await sync_to_async(publish, thread_sensitive=False)('student_approved', user_id=1)
+        await sync_to_async(publish, thread_sensitive=False)('evaluation', teacher_id=self.teachers[1].pk)
+        await sync_to_async(publish, thread_sensitive=False)('evaluation', teacher_id=self.teachers[0].pk)
+        event = (await asyncio.wait_for(anext(stream), 5)).decode()
+        self.assertIn('event: evaluation', event)
+        self.assertEqual(json.loads(event.split('data: ')[1])['teacher_id'], self.teachers[0].pk)
+        await stream.aclose()
+
+    def test_wsgi_requests_fall_back_to_polling(self):
+        self.client.force_login(self.teachers[0].user)
+        self.assertEqual(self.client.get(reverse('live_events')).status_code, 204)
+
+
+class StudentListPaginationTests(EvaluationDataTestCase):
+
+    def setUp(self):
+        super().setUp()
+        admin = User.objects.create_user(username='admin', password='password', user_type='admin')
+        self.client.force_login(admin)
+
+    def get_page(self, **params):
+        return self.client.get(
+            reverse('filter_students'), params, HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        ).json()
+
+    def test_pages_follow_the_cursor_without_gaps(self):
+        for i in range(4):
+            user = User.objects.create_user(username=f'extra{i}', password='password', user_type='student', first_name='Student1')
+            StudentProfile.objects.create(
+                user=user, student_id_number=f'2025-x{i}', year_level=2, course='BSIT',
+                department=self.students[0].department
+            )
+
+        first = self.get_page(page_size=3)
+        self.assertEqual((first['total_count'], first['pending_count'], first['approved_count']), (7, 0, 7))
+
+        pages, cursor = [first], first['next_cursor']
+        while cursor:
+            page = self.get_page(page_size=3, cursor=cursor)
+            self.assertNotIn('total_count', page)
+            pages.append(page)
+            cursor = page['next_cursor']
+        self.assertEqual(len(pages), 3)
+
+        rows = ''.join(page['html'] for page in pages)
+        self.assertEqual(rows.count('2025-'), 7)
+        self.assertEqual(len(set(re.findall(r'2025-x?\d', rows))), 7)
+
+    def test_page_size_is_capped_and_bad_cursors_rejected(self):
+        self.assertIsNone(self.get_page(page_size=100000)['next_cursor'])
+        response = self.client.get(
+            reverse('filter_students'), {'cursor': 'not-a-cursor'}, HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_search_matches_student_number_names_and_email(self):
+        user = self.students[2].user
+        user.last_name, user.email = 'Dela Cruz', 'jdc@example.com'
+        user.save()
+        self.students[2].refresh_from_db()
+        self.assertIn('dela cruz', self.students[2].search_text)
+
+        for query in ['2025-2', 'Dela Cruz', 'jdc@example.com']:
+            page = self.get_page(search=query)
+            self.assertEqual(page['total_count'], 1, query)
+            self.assertIn('2025-2', page['html'])
+
+        page = self.get_page(search='student', page_size=2)
+        self.assertEqual(page['total_count'], 3)
+        rest = self.get_page(search='student', page_size=2, cursor=page['next_cursor'])
+        self.assertIsNone(rest['next_cursor'])
+        rows = page['html'] + rest['html']
+        self.assertEqual(len(set(re.findall(r'2025-\d', rows))), 3)
+
+    def test_search_matches_inner_substrings(self):
+        user = self.students[2].user
+        user.first_name, user.last_name, user.email = 'Zed', 'Dela Cruz', 'jdc@example.com'
+        user.save()
+
+        # inside a word, shorter than a trigram, punctuation and several words at once
+        for query in ['ruz', 'ed', '@', 'xample', 'ela ruz']:
+            page = self.get_page(search=query)
+            self.assertEqual(page['total_count'], 1, query)
+            self.assertIn('2025-2', page['html'])
+        self.assertEqual(self.get_page(search='ruz zz')['total_count'], 0)
+
+    def test_pages_are_cached_until_a_student_changes(self):
+        first = self.get_page(status='pending')
+        self.assertEqual(first['total_count'], 0)
+        with self.assertNumQueries(2):  # session and user only
+            self.assertEqual(self.get_page(status='pending'), first)
+
+        self.students[0].user.is_pending = True
+        self.students[0].user.save()
+        self.assertEqual(self.get_page(status='pending')['total_count'], 1)
+
+        response = self.client.post(
+            reverse('approve_student', args=[self.students[0].user.id]), HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+        self.assertEqual(response.json()['pending_count'], 0)
+        self.assertEqual(self.get_page(status='pending')['total_count'], 0)
+
+
+class ReportJobTests(EvaluationDataTestCase):
+
+    def test_report_is_queued_then_rendered_by_the_worker(self):
+        teacher = self.teachers[0]
+        self.client.force_login(teacher.user)
+        url = reverse('reports:teacher_report_pdf', args=[teacher.pk])
+        response = self.client.get(url)
+        job = ReportJob.objects.get()
+        self.assertRedirects(response, reverse('reports:report_job', args=[job.pk]))
+        # reloading does not queue the report again
+        self.client.get(url)
+        self.assertEqual(ReportJob.objects.count(), 1)
+
+        status_url = reverse('reports:report_job_status', args=[job.pk])
+        self.assertEqual(self.client.get(status_url).json()['status'], 'pending')
+
+        call_command('runreportworker', '--once', stdout=io.StringIO())
+        status = self.client.get(status_url).json()
+        self.assertEqual(status['status'], 'done')
+
+        response = self.client.get(status['download_url'])
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertIn(f'teacher_evaluation_{teacher.employee_id}.pdf', response['Content-Disposition'])
+        self.assertTrue(response.content.startswith(b'%PDF'))
+
+        # other users cannot see the job
+        self.client.force_login(self.teachers[1].user)
+        self.assertEqual(self.client.get(status_url).status_code, 404)
+
+    def test_admin_report_links_open_the_status_page(self):
+        admin = User.objects.create_user(username='admin', password='password', user_type='admin')
+        self.client.force_login(admin)
+        html = self.client.get(reverse('admin_dashboard_section', args=['results'])).content.decode()
+        url = reverse('reports:department_report_pdf', args=[self.teachers[0].department_id])
+        # a download attribute would make the browser save the status page instead of running it
+        self.assertRegex(html, rf'href="{re.escape(url)}"')
+        self.assertNotRegex(html, rf'href="{re.escape(url)}"[^>]*\bdownload\b')
+
+        response = self.client.get(url, follow=True)
+        self.assertTemplateUsed(response, 'reports/report_job.html')
+        self.assertEqual(response['Content-Type'], 'text/html; charset=utf-8')
+
+    def test_missing_report_content_is_not_found(self):
+        job = ReportJob.objects.create(
+            kind=ReportJob.TEACHER, object_id=self.teachers[0].pk, requested_by=self.teachers[0].user,
+            status=ReportJob.DONE, filename='report.pdf'
+        )
+        self.client.force_login(self.teachers[0].user)
+        self.assertEqual(self.client.get(reverse('reports:download_report_job', args=[job.pk])).status_code, 404)
+
+    def test_worker_records_done_and_failed_jobs(self):
+        admin = User.objects.create_user(username='admin', password='password', user_type='admin')
+        student = self.students[0]
+        done = ReportJob.objects.create(
+            kind=ReportJob.STUDENT_EVALUATIONS, object_id=student.pk, requested_by=student.user
+        )
+        failed = ReportJob.objects.create(kind=ReportJob.DEPARTMENT, object_id=0, requested_by=admin)
+        call_command('runreportworker', '--once', stdout=io.StringIO())
 
-# Create your tests here.
+        done.refresh_from_db()
+        self.assertEqual(done.status, ReportJob.DONE)
+        self.assertEqual(done.filename, f'student_evaluations_{student.student_id_number}.pdf')
+        failed.refresh_from_db()
+        self.assertEqual(failed.status, ReportJob.FAILED)
+        self.assertTrue(failed.error)
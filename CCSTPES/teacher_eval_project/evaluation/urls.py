@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views 
+from . import views, views_events
 
 urlpatterns = [
     path('', views.home, name='home'),
@@ -16,6 +16,9 @@ urlpatterns = [
     path('debug-user/<int:user_id>/', views.debug_user_status, name='debug_user_status'),
     # Admin URLs
     path('admin-dashboard/', views.admin_dashboard, name='admin_dashboard'),
+    path('admin-dashboard/section/<str:section>/', views.admin_dashboard_section, name='admin_dashboard_section'),
+    path('admin-dashboard/live-stats/', views.admin_live_stats, name='admin_live_stats'),
+    path('events/', views_events.live_events, name='live_events'),
     path('admin-dashboard/approve-student/<int:user_id>/', views.approve_student, name='approve_student'),
     path('admin-dashboard/pending-students/', views.manage_pending_students, name='manage_pending_students'),
     # path('ajax/check-verification/', views.check_verification, name='check_verification'),
@@ -34,7 +37,8 @@ urlpatterns = [
     # Student & Teacher URLs
     path('student/dashboard/', views.student_dashboard, name='student_dashboard'),
     path('teacher/dashboard/', views.teacher_dashboard, name='teacher_dashboard'),
-    path('teachers/', views.teacher_list, name='teacher_list'),
+    path('teacher/dashboard/charts.json', views.teacher_dashboard_charts, name='teacher_dashboard_charts'),
+    path('teachers/', views.teacher_directory, name='teacher_directory'),
     path('evaluate/<int:teacher_id>/', views.evaluate_teacher, name='evaluate_teacher'),
     path('evaluation/<int:evaluation_id>/', views.view_evaluation, name='view_evaluation'),
     path('student/dashboard-debug/', views.student_dashboard_debug, name='student_dashboard_debug'),
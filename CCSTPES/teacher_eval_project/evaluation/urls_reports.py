@@ -55,6 +55,23 @@ urlpatterns = [
         views_reports.download_student_evaluations_report,
         name='student_evaluations_pdf'
     ),
+    
+    # Queued report jobs (rendered by the runreportworker command)
+    path(
+        'jobs/<int:job_id>/',
+        views_reports.report_job,
+        name='report_job'
+    ),
+    path(
+        'jobs/<int:job_id>/status/',
+        views_reports.report_job_status,
+        name='report_job_status'
+    ),
+    path(
+        'jobs/<int:job_id>/download/',
+        views_reports.download_report_job,
+        name='download_report_job'
+    ),
 ]
 
 # Example usage in templates:
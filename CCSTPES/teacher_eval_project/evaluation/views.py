@@ -2,17 +2,30 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import Avg, Count, Q, Prefetch
+from django.db.models import Avg, Count, Max, OuterRef, Q, Prefetch, Subquery
+from django.db.models.functions import Coalesce
 from django.db import models
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
+from django.utils.text import Truncator
 from django.conf import settings
 from django.core.exceptions import MultipleObjectsReturned
 from django.urls import reverse
+import hashlib
 import secrets
+from collections import defaultdict
 from .forms import StudentRegistrationForm, TeacherRegistrationForm, EvaluationForm
-from .models import User, TeacherProfile, StudentProfile, Evaluation, Subject, Department, StudentSubject, Semester, AcademicYear, EvaluationSettings
+from .analytics import cohort_comparison, teacher_rankings, teacher_standing
+from .worklists import student_worklist
+from .pagination import InvalidCursor, keyset_page, page_size_from
+from .search import normalize_query, search_students
+from .fragments import STUDENT_LIST_TIMEOUT, student_list_key
+from .live_stats import LIVE_STATS_TIMEOUT, live_stats_etag
+from .directory import department_directory
+from .events import publish
+from .periods import current_period
+from .models import User, TeacherProfile, StudentProfile, Evaluation, Subject, Department, StudentSubject, Semester, AcademicYear, EvaluationSettings, SCORE_PARTS, PROBLEM_FIELDS, RATING_SCALE
 from django.http import JsonResponse
 import random
 import json
@@ -20,8 +33,9 @@ from django.views.decorators.csrf import csrf_exempt
 from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
-from django.db import IntegrityError
-from django.views.decorators.http import require_http_methods
+from django.db import IntegrityError, transaction
+from django.views.decorators.http import condition, require_http_methods
+from django.views.decorators.cache import cache_control
 from django.db import connection
 
 
@@ -582,46 +596,58 @@ def student_dashboard(request):
         messages.error(request, 'Access denied!')
         return redirect('home')
     
-    student_profile = request.user.student_profile
+    student_profile = StudentProfile.objects.select_related('user', 'department').get(user=request.user)
     
     # CHECK IF EVALUATION IS OPEN
-    current_evaluation_settings = EvaluationSettings.objects.filter(is_open=True).first()
+    current_evaluation_settings = current_period()['open_settings']
     evaluation_is_open = current_evaluation_settings is not None
     current_semester = current_evaluation_settings.semester if current_evaluation_settings else None
     current_academic_year = current_evaluation_settings.academic_year if current_evaluation_settings else None
     
+    # Teachers are annotated with their rating so the cards and the evaluation
+    # list can call get_average_rating() without a query per teacher
+    rated_teachers = TeacherProfile.objects.with_ratings().select_related('user', 'department')
+    
     # Filter evaluations by current semester/year if evaluation is open
+    my_evaluations = student_profile.my_evaluations.select_related('subject', 'semester', 'academic_year').prefetch_related(
+        Prefetch('teacher', queryset=rated_teachers)
+    ).order_by('-created_at')
     if evaluation_is_open and current_semester and current_academic_year:
-        my_evaluations = student_profile.my_evaluations.filter(
+        my_evaluations = my_evaluations.filter(
             semester=current_semester,
             academic_year=current_academic_year
-        ).order_by('-created_at')
+        )
+    my_evaluations = list(my_evaluations)
+    
+    # Teachers to evaluate and already evaluated this period, cached per student
+    if evaluation_is_open and current_semester and current_academic_year:
+        worklist = student_worklist(student_profile, current_academic_year, current_semester)
     else:
-        my_evaluations = student_profile.my_evaluations.all().order_by('-created_at')
+        worklist = student_worklist(student_profile)
+    has_cor_assignments = worklist['has_cor_assignments']
+    evaluated_teacher_ids = set(worklist['evaluated_teacher_ids'])
     
     # Get subjects available for this student's year level
-    available_subjects = student_profile.get_available_subjects()
-    
-    # Sort based on what type was returned
-    if student_profile.has_assigned_subjects():
-        available_subjects = list(available_subjects.order_by('subject_code'))
+    if has_cor_assignments:
+        available_subjects = list(
+            student_profile.assigned_subjects.select_related('teacher', 'teacher__user').order_by('subject_code')
+        )
     else:
-        available_subjects = list(available_subjects.order_by('department__name', 'name'))
+        available_subjects = list(
+            Subject.objects.filter(year_level=student_profile.year_level)
+            .prefetch_related('teachers', 'teachers__user').order_by('department__name', 'name')
+        )
     
     # Get all teachers
-    available_teachers = student_profile.get_available_teachers().order_by('user__first_name')
-    
-    # Get list of teacher IDs evaluated this semester/year
-    if evaluation_is_open and current_semester and current_academic_year:
-        evaluated_teacher_ids = my_evaluations.values_list('teacher_id', flat=True).distinct()
-    else:
-        evaluated_teacher_ids = []
+    available_teachers = TeacherProfile.attach_evaluation_progress(
+        rated_teachers.filter(id__in=worklist['teacher_ids']).order_by('user__first_name')
+    )
     
     # Filter unevaluated teachers
-    unevaluated_teachers = available_teachers.exclude(id__in=evaluated_teacher_ids)
+    unevaluated_teachers = [teacher for teacher in available_teachers if teacher.id not in evaluated_teacher_ids]
     
     # Calculate evaluation progress
-    total_teachers = available_teachers.count()
+    total_teachers = len(available_teachers)
     evaluated_teachers_count = len(evaluated_teacher_ids)
     
     if total_teachers > 0:
@@ -631,10 +657,10 @@ def student_dashboard(request):
     
     pending_teachers = total_teachers - evaluated_teachers_count
     
-    # Get top performing teachers
+    # Get top performing teachers from the annotated ratings
     top_teachers = sorted(
-        [teacher for teacher in available_teachers if teacher.get_average_rating() >= 3.0],
-        key=lambda x: x.get_average_rating(),
+        [teacher for teacher in available_teachers if teacher.average_rating >= 3.0],
+        key=lambda teacher: teacher.average_rating,
         reverse=True
     )[:3]
     
@@ -644,7 +670,7 @@ def student_dashboard(request):
         'subjects': available_subjects,
         'teachers': unevaluated_teachers,
         'teachers_count': total_teachers,
-        'evaluations_count': my_evaluations.count(),
+        'evaluations_count': len(my_evaluations),
         'pending_evaluations': pending_teachers,
         'evaluated_teacher_ids': list(evaluated_teacher_ids),
         'progress_percentage': progress_percentage,
@@ -653,7 +679,7 @@ def student_dashboard(request):
         'top_teachers': top_teachers,
         'student_year_level': student_profile.get_year_level_display(),
         'student_department': student_profile.department.name,
-        'has_cor_assignments': student_profile.has_assigned_subjects(),
+        'has_cor_assignments': has_cor_assignments,
         'evaluation_is_open': evaluation_is_open,
         'current_semester': current_semester,
         'current_academic_year': current_academic_year,
@@ -720,7 +746,7 @@ from datetime import datetime, timedelta
 
 @login_required
 def teacher_dashboard(request):
-    """Teacher dashboard with real chart data"""
+    """Teacher dashboard; the chart series are fetched from teacher_dashboard_charts"""
     if request.user.user_type != 'teacher':
         messages.error(request, 'Access denied!')
         return redirect('home')
@@ -736,138 +762,199 @@ def teacher_dashboard(request):
         teacher=teacher
     ).select_related('student__user', 'subject').order_by('-created_at')
     
-    total_evaluations = evaluations.count()
+    # Overall and per-part averages in a single aggregate query
+    summary = evaluations.score_summary()
+    total_evaluations = summary['evaluation_count']
+    average_rating = round(summary['average_rating'], 1)
+    
+    # Standard deviation and 95% confidence interval from the running accumulators
+    spread = teacher.rating_accumulators.spread()
+    rating_spread = spread.get('overall')
+    
+    # Rank in the department and the institution for the current period
+    period = current_period()
+    standing = teacher_standing(teacher, period['academic_year'], period['semester'])
+    
+    # Category averages for the score circles and summary; the charts are
+    # loaded from teacher_dashboard_charts after the page renders
+    category_data = _category_data(summary)
+    
+    # ===== ITEM BREAKDOWN: count of each rating per criterion =====
+    distribution = evaluations.rating_distribution()
+    part_titles = {
+        'presentation': 'Presentation of Lesson',
+        'development': 'Development of the Lesson',
+        'student_behavior': 'Student Behavior',
+        'wrapup': 'Wrap-up',
+    }
+    item_breakdown = []
+    for part, fields in SCORE_PARTS.items():
+        items = []
+        for field in fields:
+            counts = distribution[field]
+            answered = sum(counts)
+            items.append({
+                'label': Evaluation._meta.get_field(field).help_text,
+                'counts': counts,
+                'average': round(sum(value * count for value, count in enumerate(counts, 1)) / answered, 2) if answered else 0,
+                'std': spread[field]['std'] if field in spread else None,
+            })
+        item_breakdown.append({'title': part_titles[part], 'items': items, 'spread': spread.get(part)})
     
-    # Calculate average rating
-    if total_evaluations > 0:
-        total_rating = sum([e.get_average_rating() for e in evaluations])
-        average_rating = round(total_rating / total_evaluations, 1)
-    else:
-        average_rating = 0
+    problem_breakdown = [
+        {'label': Evaluation._meta.get_field(field).help_text, 'counts': distribution[field]}
+        for field in PROBLEM_FIELDS
+    ]
     
-    # ===== CHART DATA: Rating Trend Over Time =====
-    # Get evaluations from the last 5 periods (weeks/months)
-    today = datetime.now()
+    context = {
+        'teacher': teacher,
+        'evaluations': evaluations[:10],  # Recent 10 for table
+        'total_evaluations': total_evaluations,
+        'average_rating': average_rating,
+        'rating_spread': rating_spread,
+        'standing': standing,
+        
+        # Chart Data - Category Performance (the other series come from charts.json)
+        'category_data': category_data,
+        
+        # Item-level rating counts
+        'item_breakdown': item_breakdown,
+        'problem_breakdown': problem_breakdown,
+    }
     
-    # Calculate weekly averages for the last 5 weeks
+    return render(request, 'teacher_dashboard.html', context)
+
+
+def _category_data(summary):
+    return {
+        'presentation': summary['presentation_average'],
+        'development': summary['development_average'],
+        'student_behavior': summary['student_behavior_average'],
+        'wrapup': summary['wrapup_average']
+    }
+
+
+def _teacher_chart_series(teacher):
+    """Chart series of the teacher dashboard, as served by teacher_dashboard_charts"""
+    evaluations = Evaluation.objects.filter(teacher=teacher)
+    
+    # ===== CHART DATA: Rating Trend Over Time =====
+    # Weekly averages for the last 5 weeks in one grouped query
     weekly_labels = []
     weekly_ratings = []
     
-    for i in range(4, -1, -1):  # Last 5 weeks
-        week_start = today - timedelta(weeks=i+1)
-        week_end = today - timedelta(weeks=i)
-        
-        week_evals = evaluations.filter(
-            created_at__gte=week_start,
-            created_at__lt=week_end
-        )
-        
-        if week_evals.exists():
-            avg = sum([e.get_average_rating() for e in week_evals]) / week_evals.count()
-            weekly_ratings.append(round(avg, 2))
+    weekly_trend = evaluations.score_trend('week', 5)
+    for weeks_ago, bucket in zip(range(len(weekly_trend) - 1, -1, -1), weekly_trend):
+        if bucket['evaluation_count']:
+            weekly_ratings.append(bucket['average_rating'])
         else:
             # Use previous week's rating or 0
             weekly_ratings.append(weekly_ratings[-1] if weekly_ratings else 0)
         
-        # Label format: "Week 1", "Week 2", etc.
-        if i == 0:
+        # Label format: "This Week", "2 Weeks Ago", etc.
+        if weeks_ago == 0:
             weekly_labels.append('This Week')
         else:
-            weekly_labels.append(f'{i+1} Week{"s" if i > 0 else ""} Ago')
-    
-    # ===== CHART DATA: Performance by Category =====
-    # Calculate averages for each evaluation category
-    if evaluations.exists():
-        category_data = {
-            'presentation': round(sum([e.get_presentation_average() for e in evaluations]) / total_evaluations, 2),
-            'development': round(sum([e.get_development_average() for e in evaluations]) / total_evaluations, 2),
-            'student_behavior': round(sum([e.get_student_behavior_average() for e in evaluations]) / total_evaluations, 2),
-            'wrapup': round(sum([e.get_wrapup_average() for e in evaluations]) / total_evaluations, 2)
-        }
-    else:
-        category_data = {
-            'presentation': 0,
-            'development': 0,
-            'student_behavior': 0,
-            'wrapup': 0
-        }
+            weekly_labels.append(f'{weeks_ago + 1} Weeks Ago')
+    
+    # ===== CHART DATA: Rating history per academic year and semester =====
+    history_labels = []
+    history_ratings = []
+    history_counts = []
+    
+    for period in evaluations.period_history():
+        history_labels.append(f"{period['academic_year__name']} {period['semester__name']}")
+        history_ratings.append(period['average_rating'])
+        history_counts.append(period['evaluation_count'])
+    
+    # ===== CHART DATA: Teacher, department and institution averages for the current period =====
+    period = current_period()
+    benchmark_data = cohort_comparison(teacher, period['academic_year'], period['semester'])
     
     # ===== CHART DATA: Ratings by Subject =====
     subject_labels = []
     subject_ratings = []
     
-    for subject in teacher.subjects.all():
-        subject_evals = evaluations.filter(subject=subject)
-        if subject_evals.exists():
-            avg = sum([e.get_average_rating() for e in subject_evals]) / subject_evals.count()
-            subject_labels.append(subject.code)
-            subject_ratings.append(round(avg, 2))
+    subject_rows = evaluations.filter(
+        subject__in=teacher.subjects.all()
+    ).score_summary_by('subject__code')
+    for row in subject_rows:
+        subject_labels.append(row['subject__code'])
+        subject_ratings.append(row['average_rating'])
     
     # ===== CHART DATA: Monthly Evaluation Count =====
     monthly_labels = []
     monthly_counts = []
     
-    for i in range(5, -1, -1):  # Last 6 months
-        month_date = today - timedelta(days=30*i)
-        month_start = month_date.replace(day=1)
-        
-        if i == 0:
-            month_end = today
-        else:
-            next_month = month_start.replace(day=28) + timedelta(days=4)
-            month_end = next_month.replace(day=1)
-        
-        month_count = evaluations.filter(
-            created_at__gte=month_start,
-            created_at__lt=month_end
-        ).count()
-        
-        monthly_labels.append(month_start.strftime('%b'))
-        monthly_counts.append(month_count)
-    
-    context = {
-        'teacher': teacher,
-        'evaluations': evaluations[:10],  # Recent 10 for table
-        'all_evaluations': evaluations,  # All for other calculations
-        'total_evaluations': total_evaluations,
-        'average_rating': average_rating,
-        
-        # Chart Data - Weekly Trend
-        'weekly_labels': weekly_labels,
-        'weekly_ratings': weekly_ratings,
-        
-        # Chart Data - Category Performance
-        'category_data': category_data,
-        
-        # Chart Data - By Subject
-        'subject_labels': subject_labels,
-        'subject_ratings': subject_ratings,
-        
-        # Chart Data - Monthly Counts
-        'monthly_labels': monthly_labels,
-        'monthly_counts': monthly_counts,
+    for bucket in evaluations.score_trend('month', 6):
+        monthly_labels.append(bucket['period'].strftime('%b'))
+        monthly_counts.append(bucket['evaluation_count'])
+    
+    return {
+        'weekly': {'labels': weekly_labels, 'ratings': weekly_ratings},
+        'category': _category_data(evaluations.score_summary()),
+        'benchmark': benchmark_data,
+        'subjects': {'labels': subject_labels, 'ratings': subject_ratings},
+        'monthly': {'labels': monthly_labels, 'counts': monthly_counts},
+        'history': {'labels': history_labels, 'ratings': history_ratings, 'counts': history_counts},
     }
+
+
+def _teacher_charts_etag(request):
+    """
+    Validator of a teacher's chart series: the teacher's latest evaluation
+    change and count, the current period and today's date (the weekly and
+    monthly buckets are relative to today).
+
+    Only the teacher's own evaluations are read, so other teachers'
+    submissions do not touch this request; the department and institution
+    benchmarks follow them when the teacher's own evaluations change or
+    the next day at the latest.
+    """
+    if request.user.user_type != 'teacher':
+        return None
+    teacher = TeacherProfile.objects.filter(user=request.user).only('id').first()
+    if teacher is None:
+        return None
     
-    return render(request, 'teacher_dashboard.html', context)
+    own = Evaluation.objects.filter(teacher=teacher).aggregate(latest=Max('updated_at'), count=Count('id'))
+    period = current_period()
+    state = [
+        teacher.pk, own['latest'], own['count'],
+        getattr(period['academic_year'], 'pk', None), getattr(period['semester'], 'pk', None),
+        timezone.localdate(),
+    ]
+    return hashlib.md5(str(state).encode()).hexdigest()
+
+
+@login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_teacher_charts_etag)
+def teacher_dashboard_charts(request):
+    """Chart series of the teacher dashboard; unchanged series answer 304 from the ETag alone"""
+    if request.user.user_type != 'teacher':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    teacher = get_object_or_404(TeacherProfile, user=request.user)
+    return JsonResponse(_teacher_chart_series(teacher))
 
 
 @login_required
-def teacher_list(request):
-    """List teachers from the same department for evaluation"""
+def teacher_directory(request):
+    """Teachers of the student's department, to pick one to evaluate"""
     if request.user.user_type != 'student':
         messages.error(request, 'Only students can access this page!')
         return redirect('home')
     
-    student = request.user.student_profile
+    department_id = StudentProfile.objects.filter(user=request.user).values_list('department_id', flat=True).first()
+    if department_id is None:
+        messages.error(request, 'Student profile not found!')
+        return redirect('home')
     
-    subjects_qs = Subject.objects.filter(department=student.department)
-    teachers = TeacherProfile.objects.filter(department=student.department).prefetch_related(
-        Prefetch('subjects', queryset=subjects_qs, to_attr='dept_subjects')
-    )
-
+    directory = department_directory(department_id)
     context = {
-        'teachers': teachers,
-        'student_department': student.department,
+        'teachers': directory['teachers'],
+        'student_department': directory['department'],
     }
     return render(request, 'teacher_list.html', context)
 
@@ -880,7 +967,7 @@ def evaluate_teacher(request, teacher_id):
         return redirect('home')
     
     # CHECK IF EVALUATION IS OPEN
-    current_evaluation_settings = EvaluationSettings.objects.filter(is_open=True).first()
+    current_evaluation_settings = current_period()['open_settings']
     
     if not current_evaluation_settings:
         messages.error(
@@ -950,42 +1037,49 @@ def evaluate_teacher(request, teacher_id):
                 messages.error(request, 'You can only evaluate subjects available to you!')
                 return redirect('student_dashboard')
             
-            # Create evaluation
-            evaluation = Evaluation.objects.create(
-                student=student,
-                teacher=teacher,
-                subject=subject_from_form,
-                semester=current_semester,
-                academic_year=current_academic_year,
-                presentation_objectives=form.cleaned_data['presentation_objectives'],
-                presentation_motivation=form.cleaned_data['presentation_motivation'],
-                presentation_relation=form.cleaned_data['presentation_relation'],
-                presentation_assignments=form.cleaned_data['presentation_assignments'],
-                dev_anticipates=form.cleaned_data['dev_anticipates'],
-                dev_mastery=form.cleaned_data['dev_mastery'],
-                dev_logical=form.cleaned_data['dev_logical'],
-                dev_expression=form.cleaned_data['dev_expression'],
-                dev_participation=form.cleaned_data['dev_participation'],
-                dev_questions=form.cleaned_data['dev_questions'],
-                dev_values=form.cleaned_data['dev_values'],
-                dev_reinforcement=form.cleaned_data['dev_reinforcement'],
-                dev_involvement=form.cleaned_data['dev_involvement'],
-                dev_voice=form.cleaned_data['dev_voice'],
-                dev_grammar=form.cleaned_data['dev_grammar'],
-                dev_monitoring=form.cleaned_data['dev_monitoring'],
-                dev_time=form.cleaned_data['dev_time'],
-                student_answers=form.cleaned_data['student_answers'],
-                student_questions=form.cleaned_data['student_questions'],
-                student_engagement=form.cleaned_data['student_engagement'],
-                student_timeframe=form.cleaned_data['student_timeframe'],
-                student_majority=form.cleaned_data['student_majority'],
-                wrapup_demonstrate=form.cleaned_data['wrapup_demonstrate'],
-                wrapup_synthesize=form.cleaned_data['wrapup_synthesize'],
-                problem_late=form.cleaned_data['problem_late'],
-                problem_absent=form.cleaned_data['problem_absent'],
-                problem_video=form.cleaned_data['problem_video'],
-                suggestions=form.cleaned_data['suggestions']
-            )
+            # Create evaluation; the rating rollup and accumulator updates made by
+            # the post_save signal commit or roll back together with it
+            with transaction.atomic():
+                evaluation = Evaluation.objects.create(
+                    student=student,
+                    teacher=teacher,
+                    subject=subject_from_form,
+                    semester=current_semester,
+                    academic_year=current_academic_year,
+                    presentation_objectives=form.cleaned_data['presentation_objectives'],
+                    presentation_motivation=form.cleaned_data['presentation_motivation'],
+                    presentation_relation=form.cleaned_data['presentation_relation'],
+                    presentation_assignments=form.cleaned_data['presentation_assignments'],
+                    dev_anticipates=form.cleaned_data['dev_anticipates'],
+                    dev_mastery=form.cleaned_data['dev_mastery'],
+                    dev_logical=form.cleaned_data['dev_logical'],
+                    dev_expression=form.cleaned_data['dev_expression'],
+                    dev_participation=form.cleaned_data['dev_participation'],
+                    dev_questions=form.cleaned_data['dev_questions'],
+                    dev_values=form.cleaned_data['dev_values'],
+                    dev_reinforcement=form.cleaned_data['dev_reinforcement'],
+                    dev_involvement=form.cleaned_data['dev_involvement'],
+                    dev_voice=form.cleaned_data['dev_voice'],
+                    dev_grammar=form.cleaned_data['dev_grammar'],
+                    dev_monitoring=form.cleaned_data['dev_monitoring'],
+                    dev_time=form.cleaned_data['dev_time'],
+                    student_answers=form.cleaned_data['student_answers'],
+                    student_questions=form.cleaned_data['student_questions'],
+                    student_engagement=form.cleaned_data['student_engagement'],
+                    student_timeframe=form.cleaned_data['student_timeframe'],
+                    student_majority=form.cleaned_data['student_majority'],
+                    wrapup_demonstrate=form.cleaned_data['wrapup_demonstrate'],
+                    wrapup_synthesize=form.cleaned_data['wrapup_synthesize'],
+                    problem_late=form.cleaned_data['problem_late'],
+                    problem_absent=form.cleaned_data['problem_absent'],
+                    problem_video=form.cleaned_data['problem_video'],
+                    suggestions=form.cleaned_data['suggestions']
+                )
+                # Live dashboards (views_events) hear about it once it is committed
+                transaction.on_commit(lambda: publish(
+                    'evaluation', teacher_id=teacher.pk, department_id=teacher.department_id,
+                    subject_id=subject_from_form.pk
+                ))
             
             messages.success(
                 request, 
@@ -1011,48 +1105,120 @@ def evaluate_teacher(request, teacher_id):
     return render(request, 'evaluate_teacher.html', context)
 
 
+# Headings of the evaluation detail page per part of SCORE_PARTS: title, icon, badge class, average label
+EVALUATION_DETAIL_PARTS = {
+    'presentation': ('Part I: Presentation of Lesson', 'fas fa-presentation', 'bg-primary', 'Presentation Average'),
+    'development': ('Part II: Development of the Lesson', 'fas fa-book-reader', 'bg-success', 'Development Average'),
+    'student_behavior': (
+        'Part III: Expected Student Behavior', 'fas fa-users', 'bg-warning text-dark', 'Student Behavior Average'
+    ),
+    'wrapup': ('Part IV: Wrap-up', 'fas fa-check-circle', 'bg-info', 'Wrap-up Average'),
+}
+
+# Short labels of the criteria on the evaluation detail page
+EVALUATION_DETAIL_LABELS = {
+    'presentation_objectives': 'Communicates clearly the objectives',
+    'presentation_motivation': 'Uses motivational techniques',
+    'presentation_relation': 'Relates previous lesson to present',
+    'presentation_assignments': 'Checks assignments',
+    'dev_anticipates': 'Anticipates difficulties of students',
+    'dev_mastery': 'Demonstrates mastery of the lesson',
+    'dev_logical': 'Develops lesson logically',
+    'dev_expression': 'Provides opportunities for free expression',
+    'dev_participation': 'Student participation in decision making',
+    'dev_questions': 'Asks questions of various levels',
+    'dev_values': 'Integrates values in the lesson',
+    'dev_reinforcement': 'Provides appropriate reinforcement',
+    'dev_involvement': 'Keeps majority of students involved',
+    'dev_voice': 'Speaks in well-modulated voice',
+    'dev_grammar': 'Observes correct grammar',
+    'dev_monitoring': 'Monitors student progress',
+    'dev_time': 'Utilizes instructional time productively',
+    'student_answers': 'Students answer in own words at designed level',
+    'student_questions': 'Students ask relevant questions',
+    'student_engagement': 'Students actively engaged in learning',
+    'student_timeframe': 'Students work within time frame',
+    'student_majority': 'Students abide by majority decision',
+    'wrapup_demonstrate': 'Provides opportunities to demonstrate learnings',
+    'wrapup_synthesize': 'Students synthesize learning through integration',
+    'problem_late': 'Late in Coming to Class',
+    'problem_absent': 'Absenteeism',
+    'problem_video': 'Very Long Video (>30min)',
+}
+
+# Problem severity (1-3) as shown on the evaluation detail page: label, badge class
+PROBLEM_SEVERITY_BADGES = {
+    1: ('Not Serious', 'problem-minor'),
+    2: ('Serious', 'problem-moderate'),
+    3: ('Very Serious', 'problem-serious'),
+}
+
+
+def _stars(value):
+    """Filled (True) / empty (False) stars of a rating"""
+    return [star <= value for star in range(1, RATING_SCALE + 1)]
+
+
+def _evaluation_detail(evaluation):
+    """Everything view_evaluation.html shows of the scores, computed once"""
+    parts = []
+    for part, fields in SCORE_PARTS.items():
+        title, icon, badge, average_label = EVALUATION_DETAIL_PARTS[part]
+        parts.append({
+            'title': title,
+            'icon': icon,
+            'badge': badge,
+            'average_label': average_label,
+            'average': getattr(evaluation, f'get_{part}_average')(),
+            'criteria': [
+                {'label': EVALUATION_DETAIL_LABELS[field], 'value': getattr(evaluation, field),
+                 'stars': _stars(getattr(evaluation, field))}
+                for field in fields
+            ],
+        })
+    
+    problems = []
+    for field in PROBLEM_FIELDS:
+        severity, css_class = PROBLEM_SEVERITY_BADGES.get(getattr(evaluation, field), PROBLEM_SEVERITY_BADGES[1])
+        problems.append({'label': EVALUATION_DETAIL_LABELS[field], 'severity': severity, 'css_class': css_class})
+    
+    average_rating = evaluation.get_average_rating()
+    return {
+        'average_rating': average_rating,
+        'average_stars': _stars(average_rating),
+        'parts': parts,
+        'problems': problems,
+    }
+
+
 @login_required
 def view_evaluation(request, evaluation_id):
     """View evaluation details"""
-    evaluation = get_object_or_404(Evaluation, id=evaluation_id)
+    evaluation = get_object_or_404(
+        Evaluation.objects.select_related('student', 'teacher__user', 'subject', 'academic_year', 'semester'),
+        id=evaluation_id
+    )
     
     # Check permissions
     if request.user.user_type == 'student':
-        if evaluation.student.user != request.user:
+        if evaluation.student.user_id != request.user.pk:
             messages.error(request, 'Access denied!')
             return redirect('student_dashboard')
     elif request.user.user_type == 'teacher':
-        if evaluation.teacher.user != request.user:
+        if evaluation.teacher.user_id != request.user.pk:
             messages.error(request, 'Access denied!')
             return redirect('teacher_dashboard')
     
-    context = {'evaluation': evaluation}
+    context = {'evaluation': evaluation, 'detail': _evaluation_detail(evaluation)}
     return render(request, 'view_evaluation.html', context)
 
 
-@login_required
-def admin_dashboard(request):
-    """Admin dashboard"""
-    if request.user.user_type != 'admin':
-        messages.error(request, 'Access denied!')
-        return redirect('home')
-    
-    # Get current active academic year and evaluation settings
-    current_academic_year = AcademicYear.objects.filter(is_active=True).first()
-    current_evaluation_settings = None
-    current_semester = None
-    
-    if current_academic_year:
-        current_evaluation_settings = EvaluationSettings.objects.filter(
-            academic_year=current_academic_year,
-            is_open=True
-        ).select_related('semester', 'academic_year').first()
-        
-        if current_evaluation_settings:
-            current_semester = current_evaluation_settings.semester
-    
-    all_academic_years = AcademicYear.objects.all()
-    all_semesters = Semester.objects.select_related('academic_year').all()
+def _admin_evaluation_period():
+    """Active academic year, its open evaluation settings and semester, and the matching Evaluation filter"""
+    period = current_period()
+    current_academic_year = period['academic_year']
+    current_semester = period['semester']
+    current_evaluation_settings = period['settings']
     
     # Filter evaluations by current academic year and semester if set
     evaluations_filter = {}
@@ -1061,125 +1227,309 @@ def admin_dashboard(request):
     if current_semester:
         evaluations_filter['semester'] = current_semester
     
-    # Summary stats
-    total_students = StudentProfile.objects.count()
-    total_teachers = TeacherProfile.objects.count()
+    return {
+        'current_academic_year': current_academic_year,
+        'current_semester': current_semester,
+        'current_evaluation_settings': current_evaluation_settings,
+        'evaluation_is_open': current_evaluation_settings.is_open if current_evaluation_settings else False,
+        'evaluations_filter': evaluations_filter,
+    }
+
+
+def _admin_top_teachers(evaluations_filter):
+    """Top teachers - ranked by the database over the rating rollups"""
+    teacher_scores = teacher_rankings(**evaluations_filter)[:5]
+    teachers_by_id = TeacherProfile.objects.select_related('user', 'department').in_bulk(
+        [row['teacher'] for row in teacher_scores]
+    )
+    return [
+        {
+            'teacher': teachers_by_id[row['teacher']],
+            'rating': row['average_rating'],
+            'total_evals': row['evaluation_count'],
+            'rank': row['overall_rank'],
+            'percentile': row['overall_percentile'],
+        }
+        for row in teacher_scores
+    ]
+
+
+@login_required
+def admin_dashboard(request):
+    """Admin dashboard - only the summary counts, each section is loaded by admin_dashboard_section"""
+    if request.user.user_type != 'admin':
+        messages.error(request, 'Access denied!')
+        return redirect('home')
     
-    if evaluations_filter:
-        total_evaluations = Evaluation.objects.filter(**evaluations_filter).count()
-    else:
-        total_evaluations = Evaluation.objects.count()
+    period = _admin_evaluation_period()
     
-    total_subjects = Subject.objects.count()
+    context = {
+        'total_students': StudentProfile.objects.count(),
+        'total_teachers': TeacherProfile.objects.count(),
+        'total_evaluations': Evaluation.objects.filter(**period['evaluations_filter']).count(),
+        'total_subjects': Subject.objects.count(),
+    }
 
-    # Top teachers
-    top_teachers = []
-    for t in TeacherProfile.objects.select_related('user').all():
-        if evaluations_filter:
-            teacher_evaluations = t.evaluations.filter(**evaluations_filter)
-        else:
-            teacher_evaluations = t.evaluations.all()
-        
-        total = teacher_evaluations.count()
-        if total > 0:
-            avg = sum([e.get_average_rating() for e in teacher_evaluations]) / total
-            top_teachers.append({
-                'teacher': t, 
-                'rating': round(avg, 2), 
-                'total_evals': total
-            })
+    return render(request, 'admin_dashboard.html', context)
+
+
+def _admin_live_stats_data():
+    """Totals of the admin dashboard, submissions in the last hour and completion per department"""
+    period = _admin_evaluation_period()
+    evaluations = Evaluation.objects.filter(**period['evaluations_filter'])
+    evaluation_counts = evaluations.aggregate(
+        total=Count('id'),
+        last_hour=Count('id', filter=Q(created_at__gte=timezone.now() - timedelta(hours=1))),
+    )
     
-    top_teachers = sorted(top_teachers, key=lambda x: x['rating'], reverse=True)[:5]
+    # Completion: share of a department's students who submitted at least one evaluation this period
+    students_by_department = dict(
+        StudentProfile.objects.order_by().values_list('department').annotate(total=Count('id'))
+    )
+    evaluated_by_department = dict(
+        evaluations.order_by().values_list('student__department').annotate(total=Count('student', distinct=True))
+    )
+    departments = []
+    for department in Department.objects.order_by('name'):
+        students = students_by_department.get(department.pk, 0)
+        evaluated = evaluated_by_department.get(department.pk, 0)
+        departments.append({
+            'name': department.name,
+            'code': department.code,
+            'students': students,
+            'evaluated_students': evaluated,
+            'completion': round(evaluated / students * 100, 1) if students else 0,
+        })
+    
+    return {
+        'totals': {
+            'students': sum(students_by_department.values()),
+            'teachers': TeacherProfile.objects.count(),
+            'evaluations': evaluation_counts['total'],
+            'subjects': Subject.objects.count(),
+        },
+        'last_hour': evaluation_counts['last_hour'],
+        'departments': departments,
+        'generated_at': timezone.now().isoformat(),
+    }
 
-    # Recent evaluations
-    if evaluations_filter:
-        recent_evaluations = Evaluation.objects.filter(**evaluations_filter).select_related(
-            'student__user',
-            'teacher__user',
-            'subject'  # ADD THIS
-        ).order_by('-created_at')[:5]
-    else:
-        recent_evaluations = Evaluation.objects.select_related(
-            'student__user',
-            'teacher__user',
-            'subject'  # ADD THIS
-        ).order_by('-created_at')[:5]
-    
-    # Get all students with optimizations
-    students = StudentProfile.objects.select_related(
-        'user',
-        'department'
-    ).prefetch_related(
-        'assigned_subjects',
-        'assigned_subjects__teacher',
-        'assigned_subjects__teacher__user',
-        'my_evaluations'
-    ).annotate(
-        evaluations_count=Count('my_evaluations', distinct=True),
-        subjects_count=Count('assigned_subjects', distinct=True)
-    ).order_by('user__first_name', 'user__last_name')
+
+def _admin_live_stats_etag(request):
+    return live_stats_etag() if request.user.user_type == 'admin' else None
+
+
+@login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_admin_live_stats_etag)
+def admin_live_stats(request):
+    """Polled by the admin dashboard; an unchanged poll is a 304 without any stats query"""
+    if request.user.user_type != 'admin':
+        return JsonResponse({'error': 'Access denied'}, status=403)
     
-    pending_count = StudentProfile.objects.filter(user__is_pending=True).count()
-    approved_count = StudentProfile.objects.filter(user__is_pending=False).count()
+    key = live_stats_etag()
+    data = cache.get(key)
+    if data is None:
+        data = _admin_live_stats_data()
+        cache.set(key, data, LIVE_STATS_TIMEOUT)
+    return JsonResponse(data)
+
+
+def _admin_overview_data():
+    period = _admin_evaluation_period()
+    return {
+        'top_teachers': [
+            {
+                'name': Truncator(item['teacher'].user.get_full_name()).chars(15),
+                'rating': item['rating'],
+                'total_evals': item['total_evals'],
+            }
+            for item in _admin_top_teachers(period['evaluations_filter'])
+        ],
+    }
+
+
+def _admin_students_context():
+    page = _student_page(StudentProfile.objects.all())
+    page['departments'] = Department.objects.all().order_by('name')
+    return page
+
+
+def _admin_teachers_context():
+    teachers = TeacherProfile.attach_evaluation_progress(
+        TeacherProfile.objects.with_ratings().select_related('user', 'department').prefetch_related('subjects')
+    )
     
-    departments = Department.objects.all().order_by('name')
-    teachers = TeacherProfile.objects.select_related('user', 'department').all()
+    # One department -> subjects map shared by every "assign subjects" modal
+    subjects_by_department = defaultdict(list)
+    for subject in Subject.objects.all():
+        subjects_by_department[subject.department_id].append(subject)
+    for teacher in teachers:
+        teacher.department_subjects = subjects_by_department[teacher.department_id]
+        teacher.assigned_subject_ids = {subject.pk for subject in teacher.subjects.all()}
     
-    # ADD THIS LINE:
-    subjects = Subject.objects.select_related('department').prefetch_related('teachers').all()
+    return {
+        'teachers': teachers,
+        'departments': Department.objects.all().order_by('name'),
+    }
 
-    context = {
-        'total_students': total_students,
-        'total_teachers': total_teachers,
-        'total_evaluations': total_evaluations,
-        'total_subjects': total_subjects,
-        'top_teachers': top_teachers,
+
+def _admin_subjects_context():
+    # Students with the subject on their COR, as a correlated count like the student listing
+    assignments = StudentSubject.objects.filter(subject=OuterRef('pk')).order_by().values('subject')
+    subjects = Subject.objects.select_related('department').prefetch_related(
+        Prefetch('teachers', queryset=TeacherProfile.objects.select_related('user'))
+    ).annotate(
+        students_count=Coalesce(Subquery(assignments.annotate(total=Count('id')).values('total')), 0),
+    )
+    return {
+        'subjects': subjects,
+        'departments': Department.objects.all().order_by('name'),
+    }
+
+
+def _admin_results_context():
+    period = _admin_evaluation_period()
+    
+    # The first ten teachers by name for the report links; the rest are only counted
+    teachers = TeacherProfile.objects.select_related('user', 'department').order_by(
+        'user__first_name', 'user__last_name', 'user__id'
+    )
+    
+    # Recent evaluations
+    recent_evaluations = Evaluation.objects.filter(**period['evaluations_filter']).select_related(
+        'student__user',
+        'teacher__user',
+        'subject'
+    ).order_by('-created_at')[:5]
+    
+    return {
+        'departments': Department.objects.all().order_by('name'),
+        'teachers': list(teachers[:10]),
+        'teachers_count': teachers.count(),
         'recent_evaluations': recent_evaluations,
-        'students': students,
-        'pending_count': pending_count,
-        'approved_count': approved_count,
-        'departments': departments,
-        'current_academic_year': current_academic_year,
-        'current_semester': current_semester,
-        'current_evaluation_settings': current_evaluation_settings,
-        'all_academic_years': all_academic_years,
+        'top_teachers': _admin_top_teachers(period['evaluations_filter']),
+    }
+
+
+def _admin_periods_context():
+    period = _admin_evaluation_period()
+    
+    # academic year -> semesters -> evaluation settings in three queries
+    academic_years = list(AcademicYear.objects.prefetch_related(Prefetch(
+        'semesters',
+        queryset=Semester.objects.prefetch_related(Prefetch('evaluation_settings', to_attr='settings_list')),
+        to_attr='semester_list'
+    )))
+    all_semesters = []
+    for year in academic_years:
+        for semester in year.semester_list:
+            semester.period_settings = next(
+                (settings for settings in semester.settings_list if settings.academic_year_id == year.pk), None
+            )
+            all_semesters.append(semester)
+    all_semesters.sort(key=lambda semester: semester.start_Month, reverse=True)
+    
+    return {
+        'current_academic_year': period['current_academic_year'],
+        'current_semester': period['current_semester'],
+        'current_evaluation_settings': period['current_evaluation_settings'],
+        'evaluation_is_open': period['evaluation_is_open'],
+        'all_academic_years': academic_years,
         'all_semesters': all_semesters,
-        'evaluation_is_open': current_evaluation_settings.is_open if current_evaluation_settings else False,
-        'teachers': teachers,
-        'subjects': subjects,  # ADD THIS
+        'total_evaluations': Evaluation.objects.filter(**period['evaluations_filter']).count(),
     }
 
-    return render(request, 'admin_dashboard.html', context)
+
+ADMIN_DASHBOARD_SECTIONS = {
+    'students': ('partials/admin_students_section.html', _admin_students_context),
+    'teachers': ('partials/admin_teachers_section.html', _admin_teachers_context),
+    'subjects': ('partials/admin_subjects_section.html', _admin_subjects_context),
+    'results': ('partials/admin_results_section.html', _admin_results_context),
+    'periods': ('partials/admin_periods_section.html', _admin_periods_context),
+}
+
+
+@login_required
+@require_http_methods(["GET"])
+def admin_dashboard_section(request, section):
+    """AJAX endpoint rendering one admin dashboard section (JSON chart data for the overview)"""
+    if request.user.user_type != 'admin':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    if section == 'overview':
+        return JsonResponse(_admin_overview_data())
+    
+    if section not in ADMIN_DASHBOARD_SECTIONS:
+        return JsonResponse({'error': 'Unknown section'}, status=404)
+    
+    template_name, build_context = ADMIN_DASHBOARD_SECTIONS[section]
+    return render(request, template_name, build_context())
+
+
+# Stable order of the admin student listing; user_id is unique (one profile per user)
+STUDENT_LIST_ORDERING = ('user__first_name', 'user__last_name', 'user_id')
+STUDENT_SEARCH_ORDERING = ('-search_rank', 'user_id')
+
+
+def _student_page(students, cursor=None, page_size=None, ordering=STUDENT_LIST_ORDERING):
+    """
+    One keyset page of students for partials/students_table.html, with the
+    counts of the whole filtered set on the first page.
+    """
+    context = {}
+    if not cursor:
+        context.update(students.aggregate(
+            total_count=Count('id'),
+            pending_count=Count('id', filter=Q(user__is_pending=True)),
+            approved_count=Count('id', filter=Q(user__is_pending=False)),
+        ))
+    
+    # Correlated counts keep the page query an ordered scan that stops after one page
+    evaluations = Evaluation.objects.filter(student=OuterRef('pk')).order_by().values('student')
+    subjects = StudentSubject.objects.filter(student=OuterRef('pk')).order_by().values('student')
+    students = students.select_related('user', 'department').annotate(
+        evaluations_count=Coalesce(Subquery(evaluations.annotate(total=Count('id')).values('total')), 0),
+        subjects_count=Coalesce(Subquery(subjects.annotate(total=Count('id')).values('total')), 0),
+    )
+    
+    context['students'], context['next_cursor'] = keyset_page(
+        students, ordering, cursor=cursor, page_size=page_size_from(page_size)
+    )
+    return context
 
 
 @login_required
 @require_http_methods(["GET"])
 def filter_students(request):
-    """AJAX endpoint to filter students without page reload"""
+    """AJAX endpoint to filter students without page reload, one page at a time"""
     if request.user.user_type != 'admin':
         return JsonResponse({'error': 'Access denied'}, status=403)
     
     if not request.headers.get('X-Requested-With') == 'XMLHttpRequest':
         return JsonResponse({'error': 'Invalid request'}, status=400)
     
-    students = StudentProfile.objects.select_related(
-        'user',
-        'department'
-    ).prefetch_related(
-        'assigned_subjects',
-        'assigned_subjects__teacher',
-        'assigned_subjects__teacher__user',
-        'my_evaluations'
-    ).annotate(
-        evaluations_count=Count('my_evaluations', distinct=True),
-        subjects_count=Count('assigned_subjects', distinct=True)
-    )
-    
     # Apply filters
     status_filter = request.GET.get('status', '')
     year_filter = request.GET.get('year_level', '')
     department_filter = request.GET.get('department', '')
-    search_query = request.GET.get('search', '')
+    search_query = normalize_query(request.GET.get('search', ''))
+    cursor = request.GET.get('cursor')
+    page_size = page_size_from(request.GET.get('page_size'))
+    
+    # Same filters, same page -> same cached response until a student changes
+    cache_key = student_list_key({
+        'status': status_filter if status_filter in ('pending', 'approved') else '',
+        'year_level': year_filter,
+        'department': department_filter,
+        'search': search_query,
+        'cursor': cursor or '',
+        'page_size': page_size,
+    })
+    data = cache.get(cache_key)
+    if data is not None:
+        return JsonResponse(data)
+    
+    students = StudentProfile.objects.all()
     
     if status_filter == 'pending':
         students = students.filter(user__is_pending=True)
@@ -1192,34 +1542,31 @@ def filter_students(request):
     if department_filter:
         students = students.filter(department_id=department_filter)
     
+    # Search results come best match first
+    ordering = STUDENT_LIST_ORDERING
     if search_query:
-        students = students.filter(
-            Q(user__first_name__icontains=search_query) |
-            Q(user__last_name__icontains=search_query) |
-            Q(user__username__icontains=search_query) |
-            Q(student_id__icontains=search_query) |
-            Q(user__email__icontains=search_query) |
-            Q(course__icontains=search_query)
-        )
-    
-    students = students.order_by('user__first_name', 'user__last_name')
-    
-    # Calculate counts
-    total_count = students.count()
-    pending_count = students.filter(user__is_pending=True).count()
-    approved_count = students.filter(user__is_pending=False).count()
-    
-    # Render table
-    html = render_to_string('partials/students_table.html', {
-        'students': students
-    })
+        students = search_students(students, search_query)
+        ordering = STUDENT_SEARCH_ORDERING
     
-    return JsonResponse({
-        'html': html,
-        'total_count': total_count,
-        'pending_count': pending_count,
-        'approved_count': approved_count
-    })
+    try:
+        page = _student_page(students, cursor=cursor, page_size=page_size, ordering=ordering)
+    except InvalidCursor:
+        return JsonResponse({'error': 'Invalid cursor'}, status=400)
+    
+    # "Load more" only needs the next rows; the first page renders the whole table
+    template_name = 'partials/students_table_rows.html' if cursor else 'partials/students_table.html'
+    data = {
+        'html': render_to_string(template_name, page, request=request),
+        'next_cursor': page['next_cursor'],
+    }
+    if not cursor:
+        data.update(
+            total_count=page['total_count'],
+            pending_count=page['pending_count'],
+            approved_count=page['approved_count'],
+        )
+    cache.set(cache_key, data, STUDENT_LIST_TIMEOUT)
+    return JsonResponse(data)
 
 
 @login_required
@@ -1238,17 +1585,20 @@ def approve_student(request, user_id):
         user.is_pending = False
         user.is_active = True
         user.save()
+        transaction.on_commit(lambda: publish('student_approved', user_id=user.pk))
         
         # If AJAX request, return JSON
         if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
             # Use StudentProfile (model in this app) for counts
-            pending_count = StudentProfile.objects.filter(user__is_pending=True).count()
-            approved_count = StudentProfile.objects.filter(user__is_pending=False).count()
+            counts = StudentProfile.objects.aggregate(
+                pending_count=Count('id', filter=Q(user__is_pending=True)),
+                approved_count=Count('id', filter=Q(user__is_pending=False)),
+            )
             return JsonResponse({
                 'success': True,
                 'message': f'{user.get_full_name()} approved successfully.',
-                'pending_count': pending_count,
-                'approved_count': approved_count
+                'pending_count': counts['pending_count'],
+                'approved_count': counts['approved_count']
             })
 
 
@@ -1781,7 +2131,7 @@ def assign_subjects(request, teacher_id):
 
 # Alternative: If you want a separate teacher list view
 @login_required
-def teacher_list(request):
+def admin_teacher_list(request):
     """Display list of all teachers"""
     if request.user.user_type != 'admin':
         messages.error(request, 'Access denied!')
@@ -0,0 +1,71 @@
+"""
+Server-Sent Events
+==================
+
+Streams the events of events.py to the admin and teacher dashboards over
+ASGI. Admins receive every event; a teacher receives the 'evaluation'
+events about themselves, which never name the student.
+
+Under WSGI (gunicorn sync workers, plain runserver) a stream would hold a
+worker for as long as the page is open, so the endpoint answers 204 there:
+EventSource does not reconnect after a 204 and the dashboards keep polling.
+"""
+
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+
+from .events import subscribe
+from .models import TeacherProfile
+
+# comment lines keep proxies from closing an idle stream
+HEARTBEAT_INTERVAL = 15
+# streams end after a while and EventSource reconnects, which bounds the
+# life of subscriptions whose client went away unnoticed
+STREAM_DURATION = 5 * 60
+RECONNECT_DELAY_MS = 5000
+
+
+def _event_filter(user):
+    """Which events a user may receive, or None when they get no stream"""
+    if not user.is_authenticated:
+        return None
+    if user.user_type == 'admin':
+        return lambda event: True
+    if user.user_type == 'teacher':
+        teacher_id = TeacherProfile.objects.filter(user=user).values_list('id', flat=True).first()
+        if teacher_id is not None:
+            return lambda event: event['event'] == 'evaluation' and event['data'].get('teacher_id') == teacher_id
+    return None
+
+
+async def _event_stream(accepts):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + STREAM_DURATION
+    async with subscribe(accepts) as subscription:
+        yield f'retry: {RECONNECT_DELAY_MS}\n\n'
+        while loop.time() < deadline:
+            event = await subscription.get(timeout=HEARTBEAT_INTERVAL)
+            if event is None:
+                yield ': heartbeat\n\n'
+            else:
+                yield 'id: {}\nevent: {}\ndata: {}\n\n'.format(event['id'], event['event'], json.dumps(event['data']))
+
+
+async def live_events(request):
+    """text/event-stream of dashboard events for admins and teachers"""
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+
+    accepts = await sync_to_async(_event_filter)(request.user)
+    if accepts is None:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    response = StreamingHttpResponse(_event_stream(accepts), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx and similar proxies must pass events through unbuffered
+    response['X-Accel-Buffering'] = 'no'
+    return response
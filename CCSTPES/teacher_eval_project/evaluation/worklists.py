@@ -0,0 +1,75 @@
+"""
+The teachers a student has to evaluate in a period, and the ones they have
+already evaluated, cached per student and period. Students reload their
+dashboard after every evaluation they submit, so the cached worklist saves
+the COR / year level subject lookups on each visit.
+
+The cached worklists are keyed on two version counters (see
+cache_versions.py):
+- the student's counter, on StudentSubject saves / deletes and Evaluation
+  saves / deletes of that student (see signals.py)
+- the year level's counter, when teachers are added to or removed from a
+  subject of that year level, or the subject itself changes
+"""
+
+from django.core.cache import cache
+
+from .cache_versions import bump_version, versioned_key
+
+WORKLIST_TIMEOUT = 60 * 60
+
+
+def _student_version_key(student_id):
+    return f'student_worklist_version:student:{student_id}'
+
+
+def _year_level_version_key(year_level):
+    return f'student_worklist_version:year_level:{year_level}'
+
+
+def invalidate_student_worklist(student_id):
+    bump_version(_student_version_key(student_id))
+
+
+def invalidate_year_level_worklists(year_level):
+    bump_version(_year_level_version_key(year_level))
+
+
+def student_worklist(student, academic_year=None, semester=None):
+    """
+    Cached worklist of a student for a period.
+
+    Returns {'teacher_ids': [...], 'evaluated_teacher_ids': [...],
+    'has_cor_assignments': bool}. teacher_ids are the teachers the student
+    should evaluate (see StudentProfile.get_available_teachers()) and
+    evaluated_teacher_ids the ones they evaluated in the period; without a
+    period nothing counts as evaluated.
+    """
+    academic_year_id = getattr(academic_year, 'pk', academic_year)
+    semester_id = getattr(semester, 'pk', semester)
+    key = versioned_key(
+        'student_worklist',
+        [_student_version_key(student.pk), _year_level_version_key(student.year_level)],
+        student.pk, student.year_level, academic_year_id, semester_id,
+    )
+
+    worklist = cache.get(key)
+    if worklist is None:
+        worklist = _build_worklist(student, academic_year_id, semester_id)
+        cache.set(key, worklist, WORKLIST_TIMEOUT)
+    return worklist
+
+
+def _build_worklist(student, academic_year_id, semester_id):
+    evaluated_teacher_ids = []
+    if academic_year_id and semester_id:
+        evaluated_teacher_ids = list(
+            student.my_evaluations.filter(academic_year_id=academic_year_id, semester_id=semester_id)
+            .order_by('teacher_id').values_list('teacher_id', flat=True).distinct()
+        )
+
+    return {
+        'teacher_ids': list(student.get_available_teachers().order_by('id').values_list('id', flat=True)),
+        'evaluated_teacher_ids': evaluated_teacher_ids,
+        'has_cor_assignments': student.has_assigned_subjects(),
+    }